@@ -16,6 +16,7 @@ from .network import *
 from .plutus import *
 from .pool_params import *
 from .serialization import *
+from .signing import *
 from .transaction import *
 from .txbuilder import *
 from .utils import *
@@ -10,15 +10,17 @@ from __future__ import annotations
 
 import binascii
 import os
+import threading
+from collections import OrderedDict
 from enum import Enum
-from typing import Optional, Type, Union
+from typing import Hashable, Iterable, List, Optional, Type, Union
 
 import base58
 from cbor2 import CBORTag
 from typing_extensions import override
 
 from pycardano.cbor import cbor2
-from pycardano.crypto.bech32 import decode, encode
+from pycardano.crypto.bech32 import decode, encode, encode_many
 from pycardano.exception import (
     DecodingException,
     DeserializeException,
@@ -185,10 +187,53 @@ class PointerAddress(CBORSerializable):
         return f"PointerAddress({self.slot}, {self.tx_index}, {self.cert_index})"
 
 
+class _InternCache:
+    """A thread-safe, bounded LRU map from address representations to decoded addresses."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Address] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Address]:
+        with self._lock:
+            address = self._entries.get(key)
+            if address is not None:
+                self._entries.move_to_end(key)
+            return address
+
+    def put(self, key: Hashable, address: Address):
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._entries[key] = address
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+
 class Address(CBORSerializable):
     """A shelley address. It consists of two parts: payment part and staking part.
         Either of the parts could be None, but they cannot be None at the same time.
 
+    Addresses decoded by :meth:`from_primitive` (and therefore :meth:`decode` and CBOR deserialization) are interned
+    in a bounded LRU cache keyed by their bech32/base58 string and their raw bytes, so decoding the same address
+    again returns the same instance. Addresses should therefore be treated as immutable. The cache size can be
+    changed with :meth:`set_intern_cache_size`.
+
     Args:
         payment_part (Union[VerificationKeyHash, ScriptHash, None]): Payment part of the address.
         staking_part (Union[KeyHash, ScriptHash, PointerAddress, None]): Staking part of the address.
@@ -217,6 +262,35 @@ class Address(CBORSerializable):
         self._header_byte = self._compute_header_byte() if not self.is_byron else None
         self._hrp = self._compute_hrp() if not self.is_byron else None
 
+        self._bytes: Optional[bytes] = None
+        self._encoded: Optional[str] = None
+
+    _CACHE_ATTRIBUTES = ("_bytes", "_encoded")
+    """Attributes caching the encodings of the address, filled on first use."""
+
+    INTERN_CACHE_SIZE = 4096
+    """Default maximum number of entries in the interning cache of decoded addresses."""
+
+    _intern_cache = _InternCache(INTERN_CACHE_SIZE)
+
+    @staticmethod
+    def set_intern_cache_size(size: int):
+        """Set the maximum number of entries in the interning cache of decoded addresses.
+
+        Each decoded address takes up to two entries, one for its string and one for its bytes.
+
+        Args:
+            size (int): Maximum number of entries. 0 disables interning.
+        """
+        if size < 0:
+            raise ValueError("Intern cache size must be non-negative.")
+        Address._intern_cache.resize(size)
+
+    @staticmethod
+    def clear_intern_cache():
+        """Remove all addresses from the interning cache."""
+        Address._intern_cache.clear()
+
     @property
     def is_byron(self) -> bool:
         """Check if this is a Byron-era address.
@@ -338,6 +412,14 @@ class Address(CBORSerializable):
         return prefix + suffix
 
     def __bytes__(self):
+        if self._bytes is None:
+            self._bytes = self._compute_bytes()
+        return self._bytes
+
+    def __hash__(self):
+        return hash(bytes(self))
+
+    def _compute_bytes(self) -> bytes:
         if self.is_byron:
             payload = cbor2.dumps(
                 [
@@ -371,9 +453,12 @@ class Address(CBORSerializable):
             >>> print(Address(payment_hash).encode())
             addr1v8xrqjtlfluk9axpmjj5enh0uw0cduwhz7txsqyl36m3ukgqdsn8w
         """
-        if self.is_byron:
-            return base58.b58encode(bytes(self)).decode("ascii")
-        return encode(self.hrp, bytes(self))
+        if self._encoded is None:
+            if self.is_byron:
+                self._encoded = base58.b58encode(bytes(self)).decode("ascii")
+            else:
+                self._encoded = encode(self.hrp, bytes(self))
+        return self._encoded  # type: ignore[return-value]
 
     @classmethod
     def decode(cls, data: str) -> Address:
@@ -395,12 +480,57 @@ class Address(CBORSerializable):
         """
         return cls.from_primitive(data)
 
+    @staticmethod
+    def encode_many(addresses: Iterable[Address]) -> List[str]:
+        """Encode several addresses, see :meth:`encode`.
+
+        Args:
+            addresses (Iterable[Address]): Addresses to encode.
+
+        Returns:
+            List[str]: Encoded addresses, in order.
+        """
+        addresses = list(addresses)
+        missing = [a for a in addresses if a._encoded is None and not a.is_byron]
+        for address, encoded in zip(
+            missing,
+            encode_many([a.hrp for a in missing], [bytes(a) for a in missing]),
+        ):
+            address._encoded = encoded
+        return [a.encode() for a in addresses]
+
+    @classmethod
+    def decode_many(cls, data: Iterable[str]) -> List[Address]:
+        """Decode several address strings, see :meth:`decode`.
+
+        Args:
+            data (Iterable[str]): Bech32-encoded (Shelley) or Base58-encoded (Byron) strings.
+
+        Returns:
+            List[Address]: Decoded addresses, in order.
+
+        Raises:
+            DecodingException: When any of the input strings is not a valid address.
+        """
+        return [cls.from_primitive(string) for string in data]
+
     def to_primitive(self) -> bytes:
         return bytes(self)
 
     @classmethod
     @limit_primitive_type(bytes, str)
     def from_primitive(cls: Type[Address], value: Union[bytes, str]) -> Address:
+        key = (cls, value)
+        address = Address._intern_cache.get(key)
+        if address is None:
+            address = cls._decode_primitive(value)
+            Address._intern_cache.put(key, address)
+            if isinstance(value, str):
+                Address._intern_cache.put((cls, bytes(address)), address)
+        return address
+
+    @classmethod
+    def _decode_primitive(cls: Type[Address], value: Union[bytes, str]) -> Address:
         # Convert string to bytes
         if isinstance(value, str):
             # Check for Byron Base58 prefixes (common Byron patterns)
@@ -418,19 +548,21 @@ class Address(CBORSerializable):
                     raise DecodingException(f"Failed to decode address string: {e}")
 
         # At this point, value is always bytes
-        # Check if it's a Byron address (CBOR with tag 24)
-        try:
-            decoded = cbor2.loads(value)
-            if isinstance(decoded, (tuple, list)) and len(decoded) == 2:
-                if isinstance(decoded[0], CBORTag) and decoded[0].tag == 24:
-                    # This is definitely a Byron address - validate and decode it
-                    return cls._from_byron_cbor(value)
-        except DecodingException:
-            # Byron decoding failed with validation error - re-raise it
-            raise
-        except Exception:
-            # Not Byron CBOR (general CBOR decode error), continue with Shelley decoding
-            pass
+        # Check if it's a Byron address (CBOR with tag 24). Byron addresses are CBOR arrays (major type 4), which
+        # rules out the header byte of every Shelley address type, so only those need a CBOR decoding attempt.
+        if value[:1] and value[0] >> 5 == 4:
+            try:
+                decoded = cbor2.loads(value)
+                if isinstance(decoded, (tuple, list)) and len(decoded) == 2:
+                    if isinstance(decoded[0], CBORTag) and decoded[0].tag == 24:
+                        # This is definitely a Byron address - validate and decode it
+                        return cls._from_byron_cbor(value)
+            except DecodingException:
+                # Byron decoding failed with validation error - re-raise it
+                raise
+            except Exception:
+                # Not Byron CBOR (general CBOR decode error), continue with Shelley decoding
+                pass
 
         # Shelley address decoding (existing logic)
         header = value[0]
@@ -586,6 +718,8 @@ class Address(CBORSerializable):
         addr._address_type = AddressType.BYRON
         addr._header_byte = None
         addr._hrp = None
+        addr._bytes = None
+        addr._encoded = None
         return addr
 
     def _infer_byron_network(self) -> Network:
@@ -610,6 +744,9 @@ class Address(CBORSerializable):
         if not isinstance(other, Address):
             return False
 
+        if self is other:
+            return True
+
         if self.is_byron != other.is_byron:
             return False
 
@@ -621,11 +758,8 @@ class Address(CBORSerializable):
                 and self._byron_crc32 == other._byron_crc32
             )
 
-        return (
-            self.payment_part == other.payment_part
-            and self.staking_part == other.staking_part
-            and self.network == other.network
-        )
+        # Header byte and parts in the raw bytes identify the payment part, staking part and network.
+        return bytes(self) == bytes(other)
 
     def __repr__(self):
         return f"{self.encode()}"
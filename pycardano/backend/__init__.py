@@ -2,6 +2,9 @@
 
 from .base import *
 from .blockfrost import *
+from .cache import *
 from .cardano_cli import *
+from .mempool import *
 from .ogmios_v5 import *
 from .ogmios_v6 import *
+from .utxo_index import *
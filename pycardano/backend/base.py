@@ -1,11 +1,14 @@
 """Defines interfaces for client codes to interact (read/write) with the blockchain."""
 
+import asyncio
+import functools
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from fractions import Fraction
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 
 from pycardano.address import Address
-from pycardano.exception import InvalidArgumentException
+from pycardano.exception import DecodingException, InvalidArgumentException
 from pycardano.logging import log_state
 from pycardano.network import Network
 from pycardano.plutus import ExecutionUnits
@@ -16,11 +19,57 @@ __all__ = [
     "GenesisParameters",
     "ProtocolParameters",
     "ChainContext",
+    "AsyncChainContext",
+    "ExecutorAsyncChainContext",
     "ALONZO_COINS_PER_UTXO_WORD",
 ]
 
 ALONZO_COINS_PER_UTXO_WORD = 34482
 
+T = TypeVar("T")
+
+
+def _canonical_address(address: str) -> str:
+    """The string form backends return an address in, e.g. lower case bech32, or the address as is if not parsable."""
+    try:
+        return str(Address.from_primitive(address))
+    except DecodingException:
+        return address
+
+
+def _group_by_address(
+    addresses: List[str], results: Iterable[T], address_of: Callable[[T], str]
+) -> Optional[Dict[str, List[T]]]:
+    """Group the results of a batched lookup of several addresses by the address each was looked up with.
+
+    Backends return addresses in their canonical form, whatever the form they were given in, so results are matched
+    to addresses by their canonical form.
+
+    Args:
+        addresses (List[str]): Distinct addresses looked up.
+        results (Iterable[T]): Results of the lookup.
+        address_of (Callable[[T], str]): Function returning the address of a result.
+
+    Returns:
+        Optional[Dict[str, List[T]]]: Results by address, or None when results can't be told apart, i.e. when a result
+        doesn't match any address, or two addresses have the same canonical form.
+    """
+    if len(addresses) == 1:
+        return {addresses[0]: list(results)}
+    owners = {_canonical_address(address): address for address in addresses}
+    if len(owners) < len(addresses):
+        return None
+    grouped: Dict[str, List[T]] = {address: [] for address in addresses}
+    for result in results:
+        address = address_of(result)
+        owner = (
+            address if address in grouped else owners.get(_canonical_address(address))
+        )
+        if owner is None:
+            return None
+        grouped[owner].append(result)
+    return grouped
+
 
 @dataclass(frozen=True)
 class GenesisParameters:
@@ -165,6 +214,34 @@ class ChainContext:
         """
         raise NotImplementedError()
 
+    def utxos_many(self, addresses: Iterable[Union[str, Address]]) -> List[UTxO]:
+        """Get all UTxOs associated with any of several addresses.
+
+        Backends that can look up many addresses at once do so in a single (or a few concurrent) requests,
+        instead of one round trip per address.
+
+        Args:
+            addresses (Iterable[Union[str, Address]]): Addresses, potentially bech32 encoded.
+                Duplicates are only looked up once.
+
+        Returns:
+            List[UTxO]: A list of UTxOs, grouped by address in the order the addresses are given.
+        """
+        return self._utxos_many(list(dict.fromkeys(str(a) for a in addresses)))
+
+    def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        """Get all UTxOs associated with any of several addresses.
+
+        Defaults to looking up addresses one by one. Backends should override this when they can batch lookups.
+
+        Args:
+            addresses (List[str]): Distinct addresses encoded with bech32.
+
+        Returns:
+            List[UTxO]: A list of UTxOs, grouped by address in the order the addresses are given.
+        """
+        return [utxo for address in addresses for utxo in self.utxos(address)]
+
     @log_state
     def submit_tx(self, tx: Union[Transaction, bytes, str]):
         """Submit a transaction to the blockchain.
@@ -218,3 +295,231 @@ class ChainContext:
             List[ExecutionUnits]: A list of execution units calculated for each of the transaction's redeemers
         """
         raise NotImplementedError()
+
+
+@typechecked
+class AsyncChainContext:
+    """Asynchronous counterpart of :class:`ChainContext`, for use from asyncio applications.
+
+    Queries are coroutines, so many of them can run concurrently on one event loop. Contexts hold connections that
+    should be released with :meth:`close`, or by using the context as an async context manager.
+    """
+
+    @property
+    def network(self) -> Network:
+        """Get current network"""
+        raise NotImplementedError()
+
+    async def protocol_param(self) -> ProtocolParameters:
+        """Get current protocol parameters"""
+        raise NotImplementedError()
+
+    async def genesis_param(self) -> GenesisParameters:
+        """Get chain genesis parameters"""
+        raise NotImplementedError()
+
+    async def epoch(self) -> int:
+        """Current epoch number"""
+        raise NotImplementedError()
+
+    async def last_block_slot(self) -> int:
+        """Slot number of last block"""
+        raise NotImplementedError()
+
+    async def utxos(self, address: Union[str, Address]) -> List[UTxO]:
+        """Get all UTxOs associated with an address.
+
+        Args:
+            address (Union[str, Address]): An address, potentially bech32 encoded
+
+        Returns:
+            List[UTxO]: A list of UTxOs.
+        """
+        return await self._utxos(str(address))
+
+    async def _utxos(self, address: str) -> List[UTxO]:
+        """Get all UTxOs associated with an address.
+
+        Args:
+            address (str): An address encoded with bech32.
+
+        Returns:
+            List[UTxO]: A list of UTxOs.
+        """
+        raise NotImplementedError()
+
+    async def utxos_many(self, addresses: Iterable[Union[str, Address]]) -> List[UTxO]:
+        """Get all UTxOs associated with any of several addresses.
+
+        Args:
+            addresses (Iterable[Union[str, Address]]): Addresses, potentially bech32 encoded.
+                Duplicates are only looked up once.
+
+        Returns:
+            List[UTxO]: A list of UTxOs, grouped by address in the order the addresses are given.
+        """
+        return await self._utxos_many(list(dict.fromkeys(str(a) for a in addresses)))
+
+    async def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        """Get all UTxOs associated with any of several addresses.
+
+        Defaults to looking up all addresses concurrently. Backends should override this when they can batch lookups.
+
+        Args:
+            addresses (List[str]): Distinct addresses encoded with bech32.
+
+        Returns:
+            List[UTxO]: A list of UTxOs, grouped by address in the order the addresses are given.
+        """
+        results = await asyncio.gather(*(self._utxos(a) for a in addresses))
+        return [utxo for utxos in results for utxo in utxos]
+
+    async def submit_tx(self, tx: Union[Transaction, bytes, str]):
+        """Submit a transaction to the blockchain.
+
+        Args:
+            tx (Union[Transaction, bytes, str]): The transaction to be submitted.
+
+        Raises:
+            :class:`InvalidArgumentException`: When the transaction is invalid.
+            :class:`TransactionFailedException`: When fails to submit the transaction to blockchain.
+        """
+        if isinstance(tx, Transaction):
+            return await self.submit_tx_cbor(tx.to_cbor())
+        elif isinstance(tx, bytes) or isinstance(tx, str):
+            return await self.submit_tx_cbor(tx)
+        else:
+            raise InvalidArgumentException(
+                f"Invalid transaction type: {type(tx)}, expected Transaction, bytes, or str"
+            )
+
+    async def submit_tx_cbor(self, cbor: Union[bytes, str]):
+        """Submit a transaction to the blockchain.
+
+        Args:
+            cbor (Union[bytes, str]): The serialized transaction to be submitted.
+
+        Raises:
+            :class:`InvalidArgumentException`: When the transaction is invalid.
+            :class:`TransactionFailedException`: When fails to submit the transaction to blockchain.
+        """
+        raise NotImplementedError()
+
+    async def evaluate_tx(self, tx: Transaction) -> Dict[str, ExecutionUnits]:
+        """Evaluate execution units of a transaction.
+
+        Args:
+            transaction (Transaction): The transaction to be evaluated.
+
+        Returns:
+            Dict[str, ExecutionUnits]: Execution units calculated for each of the transaction's redeemers
+        """
+        return await self.evaluate_tx_cbor(tx.to_cbor())
+
+    async def evaluate_tx_cbor(
+        self, cbor: Union[bytes, str]
+    ) -> Dict[str, ExecutionUnits]:
+        """Evaluate execution units of a transaction.
+
+        Args:
+            cbor (Union[bytes, str]): The serialized transaction to be evaluated.
+
+        Returns:
+            Dict[str, ExecutionUnits]: Execution units calculated for each of the transaction's redeemers
+        """
+        raise NotImplementedError()
+
+    async def close(self):
+        """Release connections held by the context."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class ExecutorAsyncChainContext(AsyncChainContext):
+    """Serve a synchronous :class:`ChainContext` through the :class:`AsyncChainContext` interface.
+
+    Blocking calls run on an executor (the event loop's default thread pool unless given), at most
+    `max_concurrent_requests` at a time, so they never block the event loop.
+
+    Args:
+        context (Optional[ChainContext]): The context to wrap. Subclasses may leave it out and create it in
+            :meth:`_create_context` instead, which is then called on the executor on first use.
+        executor (Optional[Executor]): Executor blocking calls run on.
+        max_concurrent_requests (int): Max number of blocking calls running at the same time.
+    """
+
+    def __init__(
+        self,
+        context: Optional[ChainContext] = None,
+        executor: Optional[Executor] = None,
+        max_concurrent_requests: int = 16,
+    ):
+        self._context = context
+        self._executor = executor
+        self._max_concurrent_requests = max_concurrent_requests
+        # Created on first use, so that they belong to the event loop the context is used from.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._context_lock: Optional[asyncio.Lock] = None
+
+    def _create_context(self) -> ChainContext:
+        """Create the wrapped context. Runs on the executor."""
+        raise NotImplementedError()
+
+    async def _run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(func, *args)
+            )
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run `func(context, *args)` on the executor."""
+        context = await self.wrapped_context()
+        return await self._run_in_executor(func, context, *args)
+
+    async def wrapped_context(self) -> ChainContext:
+        """The wrapped synchronous context, created on first use if needed."""
+        if self._context is None:
+            if self._context_lock is None:
+                self._context_lock = asyncio.Lock()
+            async with self._context_lock:
+                if self._context is None:
+                    self._context = await self._run_in_executor(self._create_context)
+        return self._context
+
+    @property
+    def network(self) -> Network:
+        if self._context is None:
+            raise NotImplementedError()
+        return self._context.network
+
+    async def protocol_param(self) -> ProtocolParameters:
+        return await self._run(lambda context: context.protocol_param)
+
+    async def genesis_param(self) -> GenesisParameters:
+        return await self._run(lambda context: context.genesis_param)
+
+    async def epoch(self) -> int:
+        return await self._run(lambda context: context.epoch)
+
+    async def last_block_slot(self) -> int:
+        return await self._run(lambda context: context.last_block_slot)
+
+    async def _utxos(self, address: str) -> List[UTxO]:
+        return await self._run(lambda context: context.utxos(address))
+
+    async def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        return await self._run(lambda context: context.utxos_many(addresses))
+
+    async def submit_tx_cbor(self, cbor: Union[bytes, str]):
+        return await self._run(lambda context: context.submit_tx_cbor(cbor))
+
+    async def evaluate_tx_cbor(
+        self, cbor: Union[bytes, str]
+    ) -> Dict[str, ExecutionUnits]:
+        return await self._run(lambda context: context.evaluate_tx_cbor(cbor))
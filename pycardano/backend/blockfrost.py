@@ -1,7 +1,9 @@
+import asyncio
 import os
 import tempfile
 import time
 import warnings
+from concurrent.futures import Executor, ThreadPoolExecutor
 from fractions import Fraction
 from typing import Dict, List, Optional, Union
 
@@ -12,9 +14,11 @@ from pycardano.address import Address
 from pycardano.backend.base import (
     ALONZO_COINS_PER_UTXO_WORD,
     ChainContext,
+    ExecutorAsyncChainContext,
     GenesisParameters,
     ProtocolParameters,
 )
+from pycardano.backend.cache import CacheStore, MemoryCacheStore
 from pycardano.cbor import cbor2
 from pycardano.exception import TransactionFailedException
 from pycardano.hash import SCRIPT_HASH_SIZE, DatumHash, ScriptHash
@@ -33,7 +37,10 @@ from pycardano.transaction import (
 )
 from pycardano.types import JsonDict
 
-__all__ = ["BlockFrostChainContext"]
+__all__ = ["BlockFrostChainContext", "AsyncBlockFrostChainContext"]
+
+# Batched address lookups are spread across this many concurrent requests, well within BlockFrost's burst limit.
+_MAX_CONCURRENT_REQUESTS = 8
 
 
 def _try_fix_script(scripth: str, script: PlutusScript) -> PlutusScript:
@@ -54,6 +61,8 @@ class BlockFrostChainContext(ChainContext):
         project_id (str): A BlockFrost project ID obtained from https://blockfrost.io.
         network (Network): Network to use.
         base_url (str): Base URL for the BlockFrost API. Defaults to the preprod url.
+        content_store (Optional[CacheStore]): Store reference scripts are cached in by hash, which can be shared with
+            other contexts. Defaults to an in-memory store.
     """
 
     api: BlockFrostApi
@@ -67,6 +76,7 @@ class BlockFrostChainContext(ChainContext):
         project_id: str,
         network: Optional[Network] = None,
         base_url: Optional[str] = None,
+        content_store: Optional[CacheStore] = None,
     ):
         if network is not None:
             warnings.warn(
@@ -96,6 +106,9 @@ class BlockFrostChainContext(ChainContext):
         self._epoch = None
         self._genesis_param = None
         self._protocol_param = None
+        self._content_store = (
+            content_store if content_store is not None else MemoryCacheStore(1000)
+        )
 
     def _check_epoch_and_update(self):
         if int(time.time()) >= self._epoch_info.end_time:
@@ -173,6 +186,13 @@ class BlockFrostChainContext(ChainContext):
         return self._protocol_param
 
     def _get_script(self, script_hash: str) -> ScriptType:
+        script = self._content_store.get(("script", script_hash))
+        if script is None:
+            script = self._fetch_script(script_hash)
+            self._content_store.set(("script", script_hash), script)
+        return script
+
+    def _fetch_script(self, script_hash: str) -> ScriptType:
         script_type = self.api.script(script_hash).type
         if script_type.lower().startswith("plutusv"):
             ps = PlutusScript.from_version(
@@ -249,6 +269,15 @@ class BlockFrostChainContext(ChainContext):
 
         return utxos
 
+    def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        if not addresses:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(len(addresses), _MAX_CONCURRENT_REQUESTS)
+        ) as executor:
+            results = list(executor.map(self._utxos, addresses))
+        return [utxo for utxos in results for utxo in utxos]
+
     def submit_tx_cbor(self, cbor: Union[bytes, str]) -> str:
         """Submit a transaction.
 
@@ -308,3 +337,60 @@ class BlockFrostChainContext(ChainContext):
                     getattr(result.EvaluationResult, k).steps,
                 )
             return return_val
+
+
+class AsyncBlockFrostChainContext(ExecutorAsyncChainContext):
+    """Asyncio counterpart of :class:`BlockFrostChainContext`.
+
+    The BlockFrost SDK only offers blocking calls, so they run on an executor, at most `max_concurrent_requests` at a
+    time. The underlying :class:`BlockFrostChainContext`, whose creation queries the API, is created on first use.
+
+    Args:
+        project_id (str): A BlockFrost project ID obtained from https://blockfrost.io.
+        network (Network): Network to use.
+        base_url (str): Base URL for the BlockFrost API. Defaults to the preprod url.
+        content_store (Optional[CacheStore]): Store reference scripts are cached in.
+        executor (Optional[Executor]): Executor API calls run on. Defaults to the event loop's default executor.
+        max_concurrent_requests (int): Max number of API calls running at the same time.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        network: Optional[Network] = None,
+        base_url: Optional[str] = None,
+        content_store: Optional[CacheStore] = None,
+        executor: Optional[Executor] = None,
+        max_concurrent_requests: int = _MAX_CONCURRENT_REQUESTS,
+    ):
+        super().__init__(
+            executor=executor, max_concurrent_requests=max_concurrent_requests
+        )
+        self._project_id = project_id
+        self._network = network
+        self._base_url = base_url
+        self._content_store = content_store
+
+    def _create_context(self) -> BlockFrostChainContext:
+        return BlockFrostChainContext(
+            self._project_id, self._network, self._base_url, self._content_store
+        )
+
+    @property
+    def network(self) -> Network:
+        if self._context is not None:
+            return self._context.network
+        # Same as BlockFrostChainContext, without querying the API.
+        if self._base_url and "mainnet" in self._base_url:
+            return Network.MAINNET
+        return self._network if self._network is not None else Network.TESTNET
+
+    async def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        # Look up addresses as concurrent calls, rather than one call fanning out to its own thread pool.
+        results = await asyncio.gather(
+            *(
+                self._run(BlockFrostChainContext._utxos, address)
+                for address in addresses
+            )
+        )
+        return [utxo for utxos in results for utxo in utxos]
@@ -0,0 +1,528 @@
+"""Caching shared by all chain contexts.
+
+:class:`CachedChainContext` wraps any :class:`ChainContext` and caches its query results with the same policy
+whatever the backend: UTxOs until the chain tip moves, protocol parameters for an epoch and genesis parameters forever.
+Scripts and datums are immutable and addressed by their hash, so the backends fetching them by hash (Kupo and
+BlockFrost) cache them forever in a content store, which can be shared with other contexts.
+
+Results are kept in a :class:`CacheStore`. :class:`MemoryCacheStore` keeps them in memory, and
+:class:`DiskCacheStore` in a directory, where they survive restarts and are shared by all processes using the same
+directory. :class:`DiskContentStore` keeps scripts and datums in a directory, in files named after their hash. Other
+stores, e.g. backed by a cache server, can be plugged in by implementing :class:`CacheStore`.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from cachetools import LRUCache
+from nacl.encoding import RawEncoder
+from nacl.hash import blake2b
+
+from pycardano.backend.base import ChainContext, GenesisParameters, ProtocolParameters
+from pycardano.cbor import cbor2
+from pycardano.hash import DATUM_HASH_SIZE, SCRIPT_HASH_SIZE
+from pycardano.nativescript import NativeScript
+from pycardano.network import Network
+from pycardano.plutus import Datum, ExecutionUnits, PlutusScript
+from pycardano.serialization import RawCBOR, default_encoder
+from pycardano.transaction import UTxO
+
+__all__ = [
+    "CacheStats",
+    "CacheStore",
+    "MemoryCacheStore",
+    "DiskCacheStore",
+    "DiskContentStore",
+    "CachedChainContext",
+]
+
+
+@dataclass
+class CacheStats:
+    """Numbers of cache hits and misses."""
+
+    hits: int = 0
+
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of lookups that were hits, 0 when there was none."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheStore:
+    """Where cached values are kept, by key.
+
+    Keys are tuples of strings and ints, values are picklable. Implementations must be safe to use from several
+    threads at once.
+    """
+
+    stats: CacheStats
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the value of a key, counting the lookup as a hit or a miss.
+
+        Args:
+            key (Hashable): The key.
+            default (Any): Value returned when the key is not found.
+
+        Returns:
+            Any: The value of the key, or `default` when not found.
+        """
+        found, value = self._get(key)
+        if found:
+            self.stats.hits += 1
+            return value
+        self.stats.misses += 1
+        return default
+
+    def _get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Get the value of a key.
+
+        Args:
+            key (Hashable): The key.
+
+        Returns:
+            Tuple[bool, Any]: Whether the key was found, and its value.
+        """
+        raise NotImplementedError()
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Set the value of a key.
+
+        Args:
+            key (Hashable): The key.
+            value (Any): The value.
+            ttl (Optional[float]): Seconds after which the value is expired. Never, unless the store expires values
+                on its own, when not given.
+        """
+        raise NotImplementedError()
+
+    def delete(self, key: Hashable):
+        """Remove a key, if present.
+
+        Args:
+            key (Hashable): The key.
+        """
+        raise NotImplementedError()
+
+    def clear(self):
+        """Remove all keys."""
+        raise NotImplementedError()
+
+
+class MemoryCacheStore(CacheStore):
+    """Keeps values in memory, evicting the least recently used ones beyond `maxsize`.
+
+    Args:
+        maxsize (int): Max number of values kept.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        super().__init__()
+        self._cache: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def _get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self._cache:
+                expires, value = self._cache[key]
+                if expires is None or time.time() < expires:
+                    return True, value
+                del self._cache[key]
+        return False, None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._cache[key] = (expires, value)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class DiskCacheStore(CacheStore):
+    """Keeps values in files of a directory, one per key.
+
+    Values survive restarts and are shared by all processes using the same directory. Files are replaced atomically,
+    so concurrent readers and writers never see a partial value. Values are pickled: only use a directory that no
+    untrusted party can write to.
+
+    Expired values are deleted when read, and by :meth:`prune`, which runs on writes at most every `prune_interval`
+    seconds, so that values which are never read again don't pile up.
+
+    Args:
+        directory (Union[str, Path]): Directory the values are kept in. Created if missing.
+        ttl (Optional[float]): Seconds after which a value is expired. Values never expire when not given, unless
+            they are set with a `ttl` of their own.
+        prune_interval (float): Min seconds between two prunings on write.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        ttl: Optional[float] = None,
+        prune_interval: float = 600,
+    ):
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+
+    def _path(self, key: Hashable) -> Path:
+        return self.directory / hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def _expired(self, path: Path, f: BinaryIO) -> bool:
+        """Whether the value in a file is expired, reading the expiry time it starts with from `f`."""
+        if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+            return True
+        expires = pickle.load(f)
+        return expires is not None and time.time() >= expires
+
+    def _get(self, key: Hashable) -> Tuple[bool, Any]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                if self._expired(path, f):
+                    path.unlink(missing_ok=True)
+                    return False, None
+                stored_key, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+        # Keys are stored along values, in case two keys have the same representation.
+        if stored_key != key:
+            return False, None
+        return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        if time.time() - self._last_prune >= self.prune_interval:
+            self.prune()
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # The expiry time comes first, so that pruning doesn't need to load the value.
+                pickle.dump(time.time() + ttl if ttl is not None else None, f)
+                pickle.dump((key, value), f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def prune(self):
+        """Delete the files of expired values."""
+        self._last_prune = time.time()
+        for path in self.directory.iterdir():
+            if path.name.startswith(".tmp"):
+                continue
+            try:
+                with open(path, "rb") as f:
+                    expired = self._expired(path, f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                # Removed in the meantime, or not a value of this store.
+                continue
+            if expired:
+                path.unlink(missing_ok=True)
+
+    def delete(self, key: Hashable):
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for path in self.directory.iterdir():
+            if path.is_file():
+                path.unlink(missing_ok=True)
+
+
+class DiskContentStore(CacheStore):
+    """Keeps scripts and datums in a directory, in files named after their hash.
+
+    Keys are ``("script", script_hash)`` and ``("datum", datum_hash)``, with hashes in hex. A file holds the exact bytes
+    its hash is computed from: the language prefix of a script followed by the script, or the CBOR of a datum. Content
+    is checked against its hash when read, so a file that was corrupted or tampered with is never returned. Files are
+    replaced atomically, so the directory can be shared by concurrent processes.
+
+    Args:
+        directory (Union[str, Path]): Directory the scripts and datums are kept in. Created if missing.
+        memory_cache_size (int): Max number of recently used scripts and datums also kept in memory.
+    """
+
+    _HASH_SIZES = {"script": SCRIPT_HASH_SIZE, "datum": DATUM_HASH_SIZE}
+
+    def __init__(self, directory: Union[str, Path], memory_cache_size: int = 1000):
+        super().__init__()
+        self.directory = Path(directory)
+        for kind in self._HASH_SIZES:
+            (self.directory / f"{kind}s").mkdir(parents=True, exist_ok=True)
+        self._memory = MemoryCacheStore(maxsize=memory_cache_size)
+
+    def _path(self, key: Hashable) -> Path:
+        if (
+            not isinstance(key, tuple)
+            or len(key) != 2
+            or key[0] not in self._HASH_SIZES
+            or not isinstance(key[1], str)
+        ):
+            raise ValueError(
+                f"Expect a ('script', hash) or ('datum', hash) key, but got {key}"
+            )
+        # Round trip through bytes, so that no path is built from anything but a hex hash.
+        return self.directory / f"{key[0]}s" / bytes.fromhex(key[1]).hex()
+
+    @staticmethod
+    def _encode(kind: str, value: Any) -> bytes:
+        if kind == "datum":
+            return cbor2.dumps(value, default=default_encoder)
+        if isinstance(value, NativeScript):
+            return bytes(1) + cast(bytes, value.to_cbor())
+        if isinstance(value, PlutusScript):
+            return value.get_script_hash_prefix() + value
+        raise ValueError(f"Expect a script, but got {type(value)}")
+
+    @staticmethod
+    def _decode(kind: str, content: bytes) -> Union[Datum, NativeScript, PlutusScript]:
+        if kind == "datum":
+            return RawCBOR(content)
+        if content[0] == 0:
+            return NativeScript.from_cbor(content[1:])
+        return PlutusScript.from_version(content[0], content[1:])
+
+    def _get(self, key: Hashable) -> Tuple[bool, Any]:
+        found, value = self._memory._get(key)
+        if found:
+            return True, value
+
+        path = self._path(key)
+        kind, expected_hash = cast(Tuple[str, str], key)
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return False, None
+        content_hash = blake2b(content, self._HASH_SIZES[kind], encoder=RawEncoder)
+        if not content or content_hash.hex() != path.name:
+            path.unlink(missing_ok=True)
+            return False, None
+
+        value = self._decode(kind, content)
+        self._memory.set(key, value)
+        return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        # Content never changes for a given hash, so `ttl` is ignored.
+        path = self._path(key)
+        content = self._encode(cast(Tuple[str, str], key)[0], value)
+        self._memory.set(key, value)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def delete(self, key: Hashable):
+        self._memory.delete(key)
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self):
+        self._memory.clear()
+        for kind in self._HASH_SIZES:
+            for path in (self.directory / f"{kind}s").iterdir():
+                path.unlink(missing_ok=True)
+
+
+class CachedChainContext(ChainContext):
+    """Caches the query results of a chain context.
+
+    The chain tip and epoch are kept in memory for `tip_ttl` and `epoch_ttl` seconds. Other results are kept in
+    stores, by resource:
+
+    - "utxos": UTxOs of an address, until the chain tip moves. They are also set to expire after `utxo_ttl` seconds,
+      so that the UTxOs of past chain tips are eventually removed from stores which keep values forever otherwise.
+    - "protocol_param": Protocol parameters, for the epoch they were fetched in.
+    - "genesis_param": Genesis parameters, forever.
+
+    Results are keyed by network, so stores can be shared by contexts of several networks.
+
+    Backends also keep UTxO lookups in their own short lived caches, keyed by the chain tip they last fetched. A
+    backend which refreshes its chain tip less often than every `tip_ttl` seconds may thus return UTxOs that are up to
+    its own `refetch_chain_tip_interval` old.
+
+    Args:
+        context (ChainContext): The context to cache the results of.
+        store (Optional[CacheStore]): Store of resources without a store of their own in `stores`. Defaults to a
+            :class:`MemoryCacheStore`.
+        stores (Optional[Dict[str, CacheStore]]): Stores by resource name.
+        tip_ttl (float): Seconds the chain tip is kept for.
+        epoch_ttl (float): Seconds the epoch is kept for. Protocol parameters are refetched at most this long after
+            an epoch change.
+        utxo_ttl (float): Seconds after which UTxOs stored are expired, even if the chain tip hasn't moved.
+    """
+
+    RESOURCES = ("utxos", "protocol_param", "genesis_param")
+
+    def __init__(
+        self,
+        context: ChainContext,
+        store: Optional[CacheStore] = None,
+        stores: Optional[Dict[str, CacheStore]] = None,
+        tip_ttl: float = 1,
+        epoch_ttl: float = 60,
+        utxo_ttl: float = 600,
+    ):
+        self._context = context
+        default_store = store if store is not None else MemoryCacheStore()
+        self._stores = {
+            resource: (stores or {}).get(resource, default_store)
+            for resource in self.RESOURCES
+        }
+        self.tip_ttl = tip_ttl
+        self.epoch_ttl = epoch_ttl
+        self.utxo_ttl = utxo_ttl
+        self.stats: Dict[str, CacheStats] = {
+            resource: CacheStats()
+            for resource in ("last_block_slot", "epoch") + self.RESOURCES
+        }
+        self._fetched: Dict[str, Tuple[float, Any]] = {}
+
+    @property
+    def wrapped_context(self) -> ChainContext:
+        """The context whose results are cached."""
+        return self._context
+
+    def _recent(self, resource: str, fetch: Callable[[], Any], ttl: float) -> Any:
+        fetched = self._fetched.get(resource)
+        if fetched is not None and time.time() - fetched[0] < ttl:
+            self.stats[resource].hits += 1
+            return fetched[1]
+        self.stats[resource].misses += 1
+        value = fetch()
+        self._fetched[resource] = (time.time(), value)
+        return value
+
+    def _stored(
+        self,
+        resource: str,
+        key: Tuple,
+        fetch: Callable[[], Any],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        store = self._stores[resource]
+        key = (resource, self.network.name) + key
+        value = store.get(key)
+        if value is not None:
+            self.stats[resource].hits += 1
+            return value
+        self.stats[resource].misses += 1
+        value = fetch()
+        store.set(key, value, ttl)
+        return value
+
+    @property
+    def network(self) -> Network:
+        return self._context.network
+
+    @property
+    def last_block_slot(self) -> int:
+        return self._recent(
+            "last_block_slot", lambda: self._context.last_block_slot, self.tip_ttl
+        )
+
+    @property
+    def epoch(self) -> int:
+        return self._recent("epoch", lambda: self._context.epoch, self.epoch_ttl)
+
+    @property
+    def protocol_param(self) -> ProtocolParameters:
+        return self._stored(
+            "protocol_param", (self.epoch,), lambda: self._context.protocol_param
+        )
+
+    @property
+    def genesis_param(self) -> GenesisParameters:
+        return self._stored("genesis_param", (), lambda: self._context.genesis_param)
+
+    def _utxos(self, address: str) -> List[UTxO]:
+        return self._stored(
+            "utxos",
+            (self.last_block_slot, address),
+            lambda: self._context.utxos(address),
+            self.utxo_ttl,
+        )
+
+    def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        store = self._stores["utxos"]
+        slot = self.last_block_slot
+        keys = {
+            address: ("utxos", self.network.name, slot, address)
+            for address in addresses
+        }
+        found = {}
+        for address in addresses:
+            utxos = store.get(keys[address])
+            if utxos is not None:
+                found[address] = utxos
+        missing = [address for address in addresses if address not in found]
+        self.stats["utxos"].hits += len(found)
+        self.stats["utxos"].misses += len(missing)
+
+        if len(missing) > 1:
+            by_address: Optional[Dict[str, List[UTxO]]] = {
+                address: [] for address in missing
+            }
+            for utxo in self._context.utxos_many(missing):
+                owner = by_address.get(str(utxo.output.address))
+                if owner is None:
+                    by_address = None
+                    break
+                owner.append(utxo)
+            if by_address is not None:
+                found.update(by_address)
+        for address in missing:
+            if address not in found:
+                # Results of an address given in another form can't be told apart from the others: look it up alone.
+                found[address] = self._context.utxos(address)
+            store.set(keys[address], found[address], self.utxo_ttl)
+
+        return [utxo for address in addresses for utxo in found[address]]
+
+    def submit_tx_cbor(self, cbor: Union[bytes, str]):
+        return self._context.submit_tx_cbor(cbor)
+
+    def evaluate_tx_cbor(self, cbor: Union[bytes, str]) -> Dict[str, ExecutionUnits]:
+        return self._context.evaluate_tx_cbor(cbor)
@@ -6,15 +6,18 @@ import json
 import os
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from enum import Enum
 from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union, cast
 
 import docker
 from cachetools import Cache, LRUCache, TTLCache, func
 from docker.errors import APIError
+from docker.models.containers import Container
 
 from pycardano.address import Address
 from pycardano.backend.base import (
@@ -22,6 +25,7 @@ from pycardano.backend.base import (
     ChainContext,
     GenesisParameters,
     ProtocolParameters,
+    _group_by_address,
 )
 from pycardano.cbor import cbor2
 from pycardano.exception import (
@@ -99,6 +103,28 @@ class DockerConfig:
 
 
 class CardanoCliChainContext(ChainContext):
+    """A chain context querying the chain with cardano-cli, either locally or in a Docker container.
+
+    By default, every command creates a new Docker client and looks up the container when running in Docker, and
+    commands run one after another. When `worker_mode` is set, the Docker client and container handle are instead kept
+    across commands, concurrent identical queries (from several threads) share a single command, and commands that
+    don't depend on each other, such as a transaction submission and the computation of its id, run in parallel.
+
+    Args:
+        binary (Path): Path to the cardano-cli binary.
+        socket (Path): Path to the cardano-node socket.
+        config_file (Path): Path to the cardano-node config file.
+        network (CardanoCliNetwork): Network of the chain.
+        refetch_chain_tip_interval (float): Seconds between chain tip refreshes.
+        utxo_cache_size (int): Max number of cached UTxO query results.
+        datum_cache_size (int): Max number of cached datums.
+        docker_config (Optional[DockerConfig]): Run cardano-cli in this Docker container.
+        network_magic_number (Optional[int]): Network magic of a custom network.
+        worker_mode (bool): Keep the Docker client across commands, coalesce concurrent identical queries and run
+            independent commands in parallel. Call :meth:`close` to release the Docker client and worker threads.
+        max_concurrent_commands (int): Max number of commands running at once when `worker_mode` is set.
+    """
+
     _binary: Path
     _socket: Optional[Path]
     _config_file: Path
@@ -111,6 +137,9 @@ class CardanoCliChainContext(ChainContext):
     _datum_cache: Cache
     _docker_config: Optional[DockerConfig]
     _network_magic_number: Optional[int]
+    _docker_client: Optional[docker.DockerClient]
+    _docker_container: Optional[Container]
+    _in_flight: Dict[Tuple[str, ...], Future]
 
     def __init__(
         self,
@@ -123,7 +152,20 @@ class CardanoCliChainContext(ChainContext):
         datum_cache_size: int = 10000,
         docker_config: Optional[DockerConfig] = None,
         network_magic_number: Optional[int] = None,
+        worker_mode: bool = False,
+        max_concurrent_commands: int = 4,
     ):
+        self.worker_mode = worker_mode
+        self.max_concurrent_commands = max_concurrent_commands
+        self._docker_client = None
+        self._docker_container = None
+        self._docker_lock = threading.Lock()
+        self._command_slots = threading.BoundedSemaphore(max_concurrent_commands)
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
         if docker_config is None:
             if not binary.exists() or not binary.is_file():
                 raise CardanoCliError(f"cardano-cli binary file not found: {binary}")
@@ -177,25 +219,110 @@ class CardanoCliChainContext(ChainContext):
         Runs the command in the cardano-cli. If the docker configuration is set, it will run the command in the
         docker container.
 
+        In worker mode, a query that is already running for another thread is not run again: its result is shared.
+
         :param cmd: Command as a list of strings
         :return: The stdout if the command runs successfully
         """
+        if not self.worker_mode:
+            return self._execute_command(cmd)
+
+        if cmd[0] != "query":
+            with self._command_slots:
+                return self._execute_command(cmd)
+
+        key = tuple(cmd)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if future is None:
+                future = self._in_flight[key] = Future()
+        if not is_owner:
+            return future.result()
+
         try:
-            if self._docker_config:
-                docker_config = self._docker_config
-                if docker_config.host_socket is None:
-                    client = docker.from_env()
-                else:
-                    client = docker.DockerClient(
-                        base_url=docker_config.host_socket.as_posix()
-                    )
+            with self._command_slots:
+                result = self._execute_command(cmd)
+            future.set_result(result)
+            return result
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def _run_commands_in_parallel(self, *calls) -> list:
+        """
+        Runs functions issuing independent commands, in parallel in worker mode, and one after another otherwise.
+
+        :param calls: Functions taking no argument
+        :return: Their results, in order
+        """
+        if not self.worker_mode:
+            return [call() for call in calls]
 
-                container = client.containers.get(docker_config.container_name)
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_commands
+                )
+            executor = self._executor
+
+        futures = [executor.submit(call) for call in calls]
+        # Let every command finish before reporting a failure, as they may share resources such as temporary files.
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def _get_docker_container(self) -> Container:
+        if self.worker_mode and self._docker_container is not None:
+            return self._docker_container
+
+        with self._docker_lock:
+            if self._docker_container is not None:
+                return self._docker_container
 
-                exec_result = container.exec_run(
-                    [self._binary.as_posix()] + cmd, stdout=True, stderr=True
+            docker_config = cast(DockerConfig, self._docker_config)
+            if docker_config.host_socket is None:
+                client = docker.from_env()
+            else:
+                client = docker.DockerClient(
+                    base_url=docker_config.host_socket.as_posix()
                 )
 
+            container = client.containers.get(docker_config.container_name)
+            if self.worker_mode:
+                self._docker_client = client
+                self._docker_container = container
+            return container
+
+    def _reset_docker_container(self):
+        with self._docker_lock:
+            client, self._docker_client = self._docker_client, None
+            self._docker_container = None
+        if client is not None:
+            client.close()
+
+    def _execute_command(self, cmd: List[str]) -> str:
+        try:
+            if self._docker_config:
+                try:
+                    container = self._get_docker_container()
+                    exec_result = container.exec_run(
+                        [self._binary.as_posix()] + cmd, stdout=True, stderr=True
+                    )
+                except APIError:
+                    if self._docker_container is None:
+                        raise
+                    # The cached container may be gone, e.g. after a restart: look it up again, and retry once
+                    # unless the command may have had an effect.
+                    self._reset_docker_container()
+                    if "submit" in cmd:
+                        raise
+                    exec_result = self._get_docker_container().exec_run(
+                        [self._binary.as_posix()] + cmd, stdout=True, stderr=True
+                    )
+
                 if exec_result.exit_code == 0:
                     output = exec_result.output.decode()
                     return output
@@ -212,6 +339,14 @@ class CardanoCliChainContext(ChainContext):
         except APIError as err:
             raise CardanoCliError(err) from err
 
+    def close(self):
+        """Release the Docker client and worker threads kept in worker mode."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+        self._reset_docker_container()
+
     def _query_chain_tip(self) -> JsonDict:
         result = self._run_command(["query", "tip"] + self._network_args)
         return json.loads(result)
@@ -238,8 +373,9 @@ class CardanoCliChainContext(ChainContext):
             genesis_json = json.load(genesis_file)
         return genesis_json
 
-    def _get_min_utxo(self) -> int:
-        params = self._query_current_protocol_params()
+    def _get_min_utxo(self, params: Optional[JsonDict] = None) -> int:
+        if params is None:
+            params = self._query_current_protocol_params()
         if "minUTxOValue" in params and params["minUTxOValue"] is not None:
             return params["minUTxOValue"]
         elif (
@@ -305,7 +441,7 @@ class CardanoCliChainContext(ChainContext):
             extra_entropy=result.get("extraPraosEntropy", ""),
             protocol_major_version=result["protocolVersion"]["major"],
             protocol_minor_version=result["protocolVersion"]["minor"],
-            min_utxo=self._get_min_utxo(),
+            min_utxo=self._get_min_utxo(result),
             min_pool_cost=result["minPoolCost"],
             price_mem=(
                 result["executionUnitPrices"]["priceMemory"]
@@ -426,70 +562,113 @@ class CardanoCliChainContext(ChainContext):
         Returns:
             List[UTxO]: A list of UTxOs.
         """
-        key = (self.last_block_slot, address)
-        if key in self._utxo_cache:
-            return self._utxo_cache[key]
+        return self._utxos_many([address])
 
-        result = self._run_command(
-            ["query", "utxo", "--address", address, "--out-file", "/dev/stdout"]
-            + self._network_args
-        )
+    def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        """Get all UTxOs associated with any of several addresses with a single cardano-cli query.
 
-        raw_utxos = json.loads(result)
+        Args:
+            addresses (List[str]): Distinct addresses encoded with bech32.
 
-        utxos = []
-        for tx_hash in raw_utxos.keys():
-            tx_id, tx_idx = tx_hash.split("#")
-            utxo = raw_utxos[tx_hash]
-            tx_in = TransactionInput.from_primitive([tx_id, int(tx_idx)])
+        Returns:
+            List[UTxO]: A list of UTxOs, grouped by address in the order the addresses are given.
+        """
+        slot = self.last_block_slot
+        found = {
+            address: self._utxo_cache[(slot, address)]
+            for address in addresses
+            if (slot, address) in self._utxo_cache
+        }
+        missing = [address for address in addresses if address not in found]
+        if missing:
+            results = _group_by_address(
+                missing,
+                self._query_utxos(missing).items(),
+                lambda result: result[1]["address"],
+            )
+            if results is None:
+                # Results of an address given in another form can't be told apart from the others: look them up alone.
+                results = {
+                    address: list(self._query_utxos([address]).items())
+                    for address in missing
+                }
+            for address in missing:
+                found[address] = [
+                    self._utxo_from_cli_result(tx_hash, utxo)
+                    for tx_hash, utxo in results[address]
+                ]
+                self._utxo_cache[(slot, address)] = found[address]
+
+        return [utxo for address in addresses for utxo in found[address]]
+
+    def _query_utxos(self, addresses: List[str]) -> JsonDict:
+        """Query the UTxOs of addresses with cardano-cli.
 
-            value = Value()
-            multi_asset = MultiAsset()
-            for asset in utxo["value"].keys():
-                if asset == "lovelace":
-                    value.coin = utxo["value"][asset]
-                else:
-                    policy_id = asset
-                    policy = ScriptHash.from_primitive(policy_id)
+        Args:
+            addresses (List[str]): Addresses encoded with bech32.
 
-                    for asset_hex_name in utxo["value"][asset].keys():
-                        asset_name = AssetName.from_primitive(asset_hex_name)
-                        amount = utxo["value"][asset][asset_hex_name]
-                        multi_asset.setdefault(policy, Asset())[asset_name] = amount
+        Returns:
+            JsonDict: UTxOs by "<transaction id>#<index>".
+        """
+        address_args = []
+        for address in addresses:
+            address_args += ["--address", address]
+        result = self._run_command(
+            ["query", "utxo"]
+            + address_args
+            + ["--out-file", "/dev/stdout"]
+            + self._network_args
+        )
+        return json.loads(result)
 
-            value.multi_asset = multi_asset
+    def _utxo_from_cli_result(self, tx_hash: str, utxo: JsonDict) -> UTxO:
+        """Convert an entry of a cardano-cli UTxO query result to a PyCardano UTxO."""
+        tx_id, tx_idx = tx_hash.split("#")
+        tx_in = TransactionInput.from_primitive([tx_id, int(tx_idx)])
 
-            datum_hash = (
-                DatumHash.from_primitive(utxo["datumhash"])
-                if utxo.get("datumhash") is not None
-                else None
-            )
+        value = Value()
+        multi_asset = MultiAsset()
+        for asset in utxo["value"].keys():
+            if asset == "lovelace":
+                value.coin = utxo["value"][asset]
+            else:
+                policy_id = asset
+                policy = ScriptHash.from_primitive(policy_id)
 
-            datum: Optional[Datum] = None
+                for asset_hex_name in utxo["value"][asset].keys():
+                    asset_name = AssetName.from_primitive(asset_hex_name)
+                    amount = utxo["value"][asset][asset_hex_name]
+                    multi_asset.setdefault(policy, Asset())[asset_name] = amount
 
-            if utxo.get("datum"):
-                datum = RawCBOR(bytes.fromhex(utxo["datum"]))
-            elif utxo.get("inlineDatumhash"):
-                datum = RawPlutusData.from_dict(utxo["inlineDatum"])
+        value.multi_asset = multi_asset
 
-            script = None
+        datum_hash = (
+            DatumHash.from_primitive(utxo["datumhash"])
+            if utxo.get("datumhash") is not None
+            else None
+        )
 
-            if utxo.get("referenceScript"):
-                script = self._get_script(utxo["referenceScript"])
+        datum: Optional[Datum] = None
 
-            tx_out = TransactionOutput(
-                Address.from_primitive(utxo["address"]),
-                amount=value,
-                datum_hash=datum_hash,
-                datum=datum,
-                script=script,
-            )
+        if utxo.get("datum"):
+            datum = RawCBOR(bytes.fromhex(utxo["datum"]))
+        elif utxo.get("inlineDatumhash"):
+            datum = RawPlutusData.from_dict(utxo["inlineDatum"])
+
+        script = None
 
-            utxos.append(UTxO(tx_in, tx_out))
+        if utxo.get("referenceScript"):
+            script = self._get_script(utxo["referenceScript"])
 
-        self._utxo_cache[key] = utxos
+        tx_out = TransactionOutput(
+            Address.from_primitive(utxo["address"]),
+            amount=value,
+            datum_hash=datum_hash,
+            datum=datum,
+            script=script,
+        )
 
-        return utxos
+        return UTxO(tx_in, tx_out)
 
     def submit_tx_cbor(self, cbor: Union[bytes, str]) -> str:
         """Submit a transaction to the blockchain.
@@ -518,41 +697,46 @@ class CardanoCliChainContext(ChainContext):
 
             tmp_tx_file.flush()
 
-            try:
-                self._run_command(
-                    [
-                        "latest",
-                        "transaction",
-                        "submit",
-                        "--tx-file",
-                        tmp_tx_file.name,
-                    ]
-                    + self._network_args
-                )
-            except CardanoCliError:
+            def submit():
                 try:
                     self._run_command(
-                        ["transaction", "submit", "--tx-file", tmp_tx_file.name]
+                        [
+                            "latest",
+                            "transaction",
+                            "submit",
+                            "--tx-file",
+                            tmp_tx_file.name,
+                        ]
                         + self._network_args
                     )
-                except CardanoCliError as err:
-                    raise TransactionFailedException(
-                        "Failed to submit transaction"
-                    ) from err
+                except CardanoCliError:
+                    try:
+                        self._run_command(
+                            ["transaction", "submit", "--tx-file", tmp_tx_file.name]
+                            + self._network_args
+                        )
+                    except CardanoCliError as err:
+                        raise TransactionFailedException(
+                            "Failed to submit transaction"
+                        ) from err
 
             # Get the transaction ID
-            try:
-                txid = self._run_command(
-                    ["latest", "transaction", "txid", "--tx-file", tmp_tx_file.name]
-                )
-            except CardanoCliError:
+            def get_txid() -> str:
                 try:
-                    txid = self._run_command(
-                        ["transaction", "txid", "--tx-file", tmp_tx_file.name]
+                    return self._run_command(
+                        ["latest", "transaction", "txid", "--tx-file", tmp_tx_file.name]
                     )
-                except CardanoCliError as err:
-                    raise PyCardanoException(
-                        f"Unable to get transaction id for {tmp_tx_file.name}"
-                    ) from err
+                except CardanoCliError:
+                    try:
+                        return self._run_command(
+                            ["transaction", "txid", "--tx-file", tmp_tx_file.name]
+                        )
+                    except CardanoCliError as err:
+                        raise PyCardanoException(
+                            f"Unable to get transaction id for {tmp_tx_file.name}"
+                        ) from err
+
+            # The id doesn't depend on the submission, so both can run at once.
+            _, txid = self._run_commands_in_parallel(submit, get_txid)
 
         return txid
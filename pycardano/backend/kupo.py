@@ -1,11 +1,21 @@
-from typing import Dict, List, Optional, Tuple, Union
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 import requests
-from cachetools import Cache, LRUCache, TTLCache
+from cachetools import Cache, TTLCache
+from requests.adapters import HTTPAdapter
 
 from pycardano.address import Address
-from pycardano.backend.base import ChainContext, GenesisParameters, ProtocolParameters
+from pycardano.backend.base import (
+    AsyncChainContext,
+    ChainContext,
+    ExecutorAsyncChainContext,
+    GenesisParameters,
+    ProtocolParameters,
+)
 from pycardano.backend.blockfrost import _try_fix_script
+from pycardano.backend.cache import CacheStore, MemoryCacheStore
 from pycardano.hash import DatumHash, ScriptHash
 from pycardano.network import Network
 from pycardano.plutus import ExecutionUnits, PlutusScript
@@ -20,7 +30,13 @@ from pycardano.transaction import (
     Value,
 )
 
-__all__ = ["KupoChainContextExtension"]
+__all__ = ["KupoChainContextExtension", "AsyncKupoChainContextExtension"]
+
+# Kupo serves one pattern per request, so batched address lookups are spread across this many concurrent requests.
+_MAX_CONCURRENT_REQUESTS = 16
+
+K = TypeVar("K")
+V = TypeVar("V")
 
 
 def extract_asset_info(asset_hash: str) -> Tuple[str, ScriptHash, AssetName]:
@@ -40,10 +56,30 @@ def extract_asset_info(asset_hash: str) -> Tuple[str, ScriptHash, AssetName]:
 
 
 class KupoChainContextExtension(ChainContext):
+    """Looks up UTxOs in `Kupo <https://cardanosolutions.github.io/kupo/>`_, and delegates everything else to a
+    wrapped context.
+
+    Requests to Kupo share a pool of keep-alive connections. Datums and scripts of the UTxOs found are cached by
+    hash, and those not cached yet are fetched concurrently, each of them once per lookup, on a pool of threads shared
+    by all lookups.
+
+    Args:
+        wrapped_backend (ChainContext): Context serving everything but UTxO lookups.
+        kupo_url (Optional[str]): URL of Kupo. UTxOs are looked up through the wrapped context when not given.
+        refetch_chain_tip_interval (int): Seconds UTxO lookups are cached for.
+        utxo_cache_size (int): Max number of cached UTxO lookups.
+        datum_cache_size (int): Max number of cached datums.
+        script_cache_size (int): Max number of cached scripts.
+        max_fetch_workers (int): Max number of concurrent requests for datums and scripts, across all UTxO lookups.
+        content_store (Optional[CacheStore]): Store datums and scripts are cached in, which can be shared with other
+            contexts. Defaults to in-memory stores of `datum_cache_size` datums and `script_cache_size` scripts.
+    """
+
     _wrapped_backend: ChainContext
     _kupo_url: Optional[str]
     _utxo_cache: Cache
-    _datum_cache: Cache
+    _datum_cache: CacheStore
+    _script_cache: CacheStore
     _refetch_chain_tip_interval: int
 
     def __init__(
@@ -53,6 +89,9 @@ class KupoChainContextExtension(ChainContext):
         refetch_chain_tip_interval: int = 10,
         utxo_cache_size: int = 1000,
         datum_cache_size: int = 1000,
+        script_cache_size: int = 1000,
+        max_fetch_workers: int = _MAX_CONCURRENT_REQUESTS,
+        content_store: Optional[CacheStore] = None,
     ):
         self._kupo_url = kupo_url
         self._wrapped_backend = wrapped_backend
@@ -60,7 +99,28 @@ class KupoChainContextExtension(ChainContext):
         self._utxo_cache = TTLCache(
             ttl=self._refetch_chain_tip_interval, maxsize=utxo_cache_size
         )
-        self._datum_cache = LRUCache(maxsize=datum_cache_size)
+        self._datum_cache = (
+            content_store
+            if content_store is not None
+            else MemoryCacheStore(maxsize=datum_cache_size)
+        )
+        self._script_cache = (
+            content_store
+            if content_store is not None
+            else MemoryCacheStore(maxsize=script_cache_size)
+        )
+        self._max_fetch_workers = max_fetch_workers
+        # Threads are only started once there is something to fetch.
+        self._fetch_executor = ThreadPoolExecutor(
+            max_workers=max(1, max_fetch_workers), thread_name_prefix="kupo-fetch"
+        )
+
+        # Enough pooled connections for concurrent address lookups, and datums and scripts fetched meanwhile.
+        self._session = requests.Session()
+        pool_size = _MAX_CONCURRENT_REQUESTS + max(1, max_fetch_workers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     @property
     def genesis_param(self) -> GenesisParameters:
@@ -110,6 +170,37 @@ class KupoChainContextExtension(ChainContext):
 
         return utxos
 
+    def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        """Get all UTxOs associated with any of several addresses.
+
+        Args:
+            addresses (List[str]): Distinct addresses encoded with bech32.
+
+        Returns:
+            List[UTxO]: A list of UTxOs, grouped by address in the order the addresses are given.
+        """
+        if not self._kupo_url:
+            return self._wrapped_backend.utxos_many(addresses)
+
+        slot = self.last_block_slot
+        found = {
+            address: self._utxo_cache[(slot, address)]
+            for address in addresses
+            if (slot, address) in self._utxo_cache
+        }
+        missing = [address for address in addresses if address not in found]
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=min(len(missing), _MAX_CONCURRENT_REQUESTS)
+            ) as executor:
+                for address, utxos in zip(
+                    missing, executor.map(self._utxos_kupo, missing)
+                ):
+                    found[address] = utxos
+                    self._utxo_cache[(slot, address)] = utxos
+
+        return [utxo for address in addresses for utxo in found[address]]
+
     def _get_datum_from_kupo(self, datum_hash: str) -> Optional[RawCBOR]:
         """Get datum from Kupo.
 
@@ -119,7 +210,7 @@ class KupoChainContextExtension(ChainContext):
         Returns:
             Optional[RawCBOR]: A datum.
         """
-        datum = self._datum_cache.get(datum_hash, None)
+        datum = self._datum_cache.get(("datum", datum_hash))
 
         if datum is not None:
             return datum
@@ -130,13 +221,47 @@ class KupoChainContextExtension(ChainContext):
             )
 
         kupo_datum_url = self._kupo_url + "/datums/" + datum_hash
-        datum_result = requests.get(kupo_datum_url).json()
+        datum_result = self._session.get(kupo_datum_url).json()
         if datum_result and datum_result["datum"] != datum_hash:
             datum = RawCBOR(bytes.fromhex(datum_result["datum"]))
 
-        self._datum_cache[datum_hash] = datum
+        if datum is not None:
+            self._datum_cache.set(("datum", datum_hash), datum)
         return datum
 
+    def _get_script_from_kupo(self, script_hash: str) -> PlutusScript:
+        """Get script from Kupo.
+
+        Args:
+            script_hash (str): A script hash.
+
+        Returns:
+            PlutusScript: A script.
+        """
+        script = self._script_cache.get(("script", script_hash))
+
+        if script is not None:
+            return script
+
+        if self._kupo_url is None:
+            raise AssertionError(
+                "kupo_url object attribute has not been assigned properly."
+            )
+
+        kupo_script_url = self._kupo_url + "/scripts/" + script_hash
+        script_result = self._session.get(kupo_script_url).json()
+        ver = int(script_result["language"].removeprefix("plutus:v"))
+        if 1 <= ver <= 3:
+            script = PlutusScript.from_version(
+                ver, bytes.fromhex(script_result["script"])
+            )
+            script = _try_fix_script(script_hash, script)
+        else:
+            raise ValueError("Unknown plutus script type")
+
+        self._script_cache.set(("script", script_hash), script)
+        return script
+
     def _utxos_kupo(self, address: str) -> List[UTxO]:
         """Get all UTxOs associated with an address with Kupo.
         Since UTxO querying will be deprecated from Ogmios in next
@@ -154,7 +279,25 @@ class KupoChainContextExtension(ChainContext):
             )
 
         kupo_utxo_url = self._kupo_url + "/matches/" + address + "?unspent"
-        results = requests.get(kupo_utxo_url).json()
+        results = [
+            result
+            for result in self._session.get(kupo_utxo_url).json()
+            if result["spent_at"] is None
+        ]
+
+        # Fetch each distinct script and datum once, concurrently.
+        scripts = self._fetch_many(
+            self._get_script_from_kupo,
+            (result["script_hash"] for result in results if result.get("script_hash")),
+        )
+        datums = self._fetch_many(
+            self._get_datum_from_kupo,
+            (
+                result["datum_hash"]
+                for result in results
+                if result["datum_hash"] and result.get("datum_type", "inline")
+            ),
+        )
 
         utxos = []
 
@@ -162,64 +305,65 @@ class KupoChainContextExtension(ChainContext):
             tx_id = result["transaction_id"]
             index = result["output_index"]
 
-            if result["spent_at"] is None:
-                tx_in = TransactionInput.from_primitive([tx_id, index])
-
-                lovelace_amount = result["value"]["coins"]
-
-                script = None
-                script_hash = result.get("script_hash", None)
-                if script_hash:
-                    kupo_script_url = self._kupo_url + "/scripts/" + script_hash
-                    script = requests.get(kupo_script_url).json()
-                    ver = int(script["language"].removeprefix("plutus:v"))
-                    if 1 <= ver <= 3:
-                        script = PlutusScript.from_version(
-                            ver, bytes.fromhex(script["script"])
-                        )
-                        script = _try_fix_script(script_hash, script)
-                    else:
-                        raise ValueError("Unknown plutus script type")
-
-                datum = None
-                datum_hash = (
-                    DatumHash.from_primitive(result["datum_hash"])
-                    if result["datum_hash"]
-                    else None
+            tx_in = TransactionInput.from_primitive([tx_id, index])
+
+            lovelace_amount = result["value"]["coins"]
+
+            script = None
+            script_hash = result.get("script_hash", None)
+            if script_hash:
+                script = scripts[script_hash]
+
+            datum = None
+            datum_hash = (
+                DatumHash.from_primitive(result["datum_hash"])
+                if result["datum_hash"]
+                else None
+            )
+            if datum_hash and result.get("datum_type", "inline"):
+                datum = datums[result["datum_hash"]]
+
+            if not result["value"]["assets"]:
+                tx_out = TransactionOutput(
+                    Address.from_primitive(address),
+                    amount=lovelace_amount,
+                    datum_hash=datum_hash,
+                    datum=datum,
+                    script=script,
                 )
-                if datum_hash and result.get("datum_type", "inline"):
-                    datum = self._get_datum_from_kupo(result["datum_hash"])
-
-                if not result["value"]["assets"]:
-                    tx_out = TransactionOutput(
-                        Address.from_primitive(address),
-                        amount=lovelace_amount,
-                        datum_hash=datum_hash,
-                        datum=datum,
-                        script=script,
-                    )
-                else:
-                    multi_assets = MultiAsset()
-
-                    for asset, quantity in result["value"]["assets"].items():
-                        policy_hex, policy, asset_name_hex = extract_asset_info(asset)
-                        multi_assets.setdefault(policy, Asset())[
-                            asset_name_hex
-                        ] = quantity
-
-                    tx_out = TransactionOutput(
-                        Address.from_primitive(address),
-                        amount=Value(lovelace_amount, multi_assets),
-                        datum_hash=datum_hash,
-                        datum=datum,
-                        script=script,
-                    )
-                utxos.append(UTxO(tx_in, tx_out))
             else:
-                continue
+                multi_assets = MultiAsset()
+
+                for asset, quantity in result["value"]["assets"].items():
+                    policy_hex, policy, asset_name_hex = extract_asset_info(asset)
+                    multi_assets.setdefault(policy, Asset())[asset_name_hex] = quantity
+
+                tx_out = TransactionOutput(
+                    Address.from_primitive(address),
+                    amount=Value(lovelace_amount, multi_assets),
+                    datum_hash=datum_hash,
+                    datum=datum,
+                    script=script,
+                )
+            utxos.append(UTxO(tx_in, tx_out))
 
         return utxos
 
+    def _fetch_many(self, fetch: Callable[[K], V], keys: Iterable[K]) -> Dict[K, V]:
+        """Fetch values for distinct keys, concurrently on the shared fetch threads when there are several.
+
+        Args:
+            fetch (Callable[[K], V]): Function fetching the value of a key.
+            keys (Iterable[K]): Keys to fetch values for, possibly with duplicates.
+
+        Returns:
+            Dict[K, V]: Values by key.
+        """
+        distinct = list(dict.fromkeys(keys))
+        if len(distinct) <= 1 or self._max_fetch_workers <= 1:
+            return {key: fetch(key) for key in distinct}
+        return dict(zip(distinct, self._fetch_executor.map(fetch, distinct)))
+
     def submit_tx_cbor(self, cbor: Union[bytes, str]):
         """Submit a transaction to the blockchain.
 
@@ -245,3 +389,109 @@ class KupoChainContextExtension(ChainContext):
             :class:`TransactionFailedException`: When fails to evaluate the transaction.
         """
         return self._wrapped_backend.evaluate_tx_cbor(cbor)
+
+
+class AsyncKupoChainContextExtension(ExecutorAsyncChainContext):
+    """Asyncio counterpart of :class:`KupoChainContextExtension`.
+
+    UTxOs are looked up in Kupo, and everything else is delegated to the wrapped async context. Kupo is queried over
+    blocking HTTP calls run on an executor, at most `max_concurrent_requests` at a time.
+
+    Args:
+        wrapped_backend (AsyncChainContext): Context serving everything but UTxO lookups.
+        kupo_url (Optional[str]): URL of Kupo. UTxOs are looked up through the wrapped context when not given.
+        refetch_chain_tip_interval (int): Seconds UTxO lookups are cached for.
+        utxo_cache_size (int): Max number of cached UTxO lookups.
+        datum_cache_size (int): Max number of cached datums.
+        script_cache_size (int): Max number of cached scripts.
+        content_store (Optional[CacheStore]): Store datums and scripts are cached in.
+        executor (Optional[Executor]): Executor HTTP calls run on. Defaults to the event loop's default executor.
+        max_concurrent_requests (int): Max number of HTTP calls running at the same time.
+    """
+
+    _wrapped_backend: AsyncChainContext
+
+    def __init__(
+        self,
+        wrapped_backend: AsyncChainContext,
+        kupo_url: Optional[str] = None,
+        refetch_chain_tip_interval: int = 10,
+        utxo_cache_size: int = 1000,
+        datum_cache_size: int = 1000,
+        script_cache_size: int = 1000,
+        content_store: Optional[CacheStore] = None,
+        executor: Optional[Executor] = None,
+        max_concurrent_requests: int = _MAX_CONCURRENT_REQUESTS,
+    ):
+        # The sync extension only serves Kupo lookups, so it doesn't need a backend of its own.
+        super().__init__(
+            KupoChainContextExtension(
+                ChainContext(),
+                kupo_url,
+                refetch_chain_tip_interval=refetch_chain_tip_interval,
+                utxo_cache_size=utxo_cache_size,
+                datum_cache_size=datum_cache_size,
+                script_cache_size=script_cache_size,
+                content_store=content_store,
+            ),
+            executor=executor,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        self._kupo_url = kupo_url
+        self._wrapped_backend = wrapped_backend
+        self._utxo_cache = TTLCache(
+            ttl=refetch_chain_tip_interval, maxsize=utxo_cache_size
+        )
+
+    @property
+    def network(self) -> Network:
+        return self._wrapped_backend.network
+
+    async def protocol_param(self) -> ProtocolParameters:
+        return await self._wrapped_backend.protocol_param()
+
+    async def genesis_param(self) -> GenesisParameters:
+        return await self._wrapped_backend.genesis_param()
+
+    async def epoch(self) -> int:
+        return await self._wrapped_backend.epoch()
+
+    async def last_block_slot(self) -> int:
+        return await self._wrapped_backend.last_block_slot()
+
+    async def _utxos(self, address: str) -> List[UTxO]:
+        return await self._utxos_many([address])
+
+    async def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        if not self._kupo_url:
+            return await self._wrapped_backend.utxos_many(addresses)
+
+        slot = await self.last_block_slot()
+        found = {
+            address: self._utxo_cache[(slot, address)]
+            for address in addresses
+            if (slot, address) in self._utxo_cache
+        }
+        missing = [address for address in addresses if address not in found]
+        results = await asyncio.gather(
+            *(
+                self._run(KupoChainContextExtension._utxos_kupo, address)
+                for address in missing
+            )
+        )
+        for address, utxos in zip(missing, results):
+            found[address] = utxos
+            self._utxo_cache[(slot, address)] = utxos
+
+        return [utxo for address in addresses for utxo in found[address]]
+
+    async def submit_tx_cbor(self, cbor: Union[bytes, str]):
+        return await self._wrapped_backend.submit_tx_cbor(cbor)
+
+    async def evaluate_tx_cbor(
+        self, cbor: Union[bytes, str]
+    ) -> Dict[str, ExecutionUnits]:
+        return await self._wrapped_backend.evaluate_tx_cbor(cbor)
+
+    async def close(self):
+        await self._wrapped_backend.close()
@@ -0,0 +1,219 @@
+"""A chain context aware of the transactions it submitted and which aren't on chain yet.
+
+Backends only know about transactions once they are in a block. An application chaining transactions faster than
+blocks are produced would otherwise be served UTxOs already spent by its own pending transactions, and not the UTxOs
+created by them. :class:`MempoolChainContext` records the transactions submitted through it, and overlays them on
+the UTxOs of the context it wraps until they are on chain, or can no longer be.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Union
+
+from pycardano.backend.base import ChainContext, GenesisParameters, ProtocolParameters
+from pycardano.hash import TransactionId
+from pycardano.network import Network
+from pycardano.plutus import ExecutionUnits
+from pycardano.transaction import Transaction, TransactionInput, UTxO
+
+__all__ = ["MempoolChainContext"]
+
+
+@dataclass
+class _PendingTransaction:
+    """A submitted transaction, not known to be on chain yet."""
+
+    inputs: Set[TransactionInput]
+
+    outputs: List[UTxO]
+
+    expiry: int
+    """Slot from which the transaction can no longer be added to a block."""
+
+    seen: Dict[TransactionInput, str] = field(default_factory=dict)
+    """Inputs of the transaction seen among the UTxOs of the wrapped context, with their address."""
+
+
+class MempoolChainContext(ChainContext):
+    """Overlays the transactions submitted through it on the UTxOs of another chain context.
+
+    UTxOs spent by pending transactions are removed from the UTxOs of an address, and UTxOs they create are added to
+    them, so transactions spending the outputs of previous ones can be built and submitted without waiting for the
+    previous ones to be in a block.
+
+    A transaction stops being pending when:
+
+    - The wrapped context returns any of its outputs: the transaction, and the pending transactions it spends the
+      outputs of, are on chain.
+    - An input of the transaction that the wrapped context returned before is no longer returned: the transaction,
+      or another one spending the same input, is on chain. It is taken to be the transaction itself.
+    - The chain reaches the end of its validity interval, i.e. its `ttl`, or `pending_slots` slots after it was
+      submitted if it has none.
+
+    Pending transactions spending the outputs of an expired transaction are forgotten with it.
+
+    Args:
+        context (ChainContext): The context to overlay pending transactions on.
+        pending_slots (int): Number of slots a transaction without `ttl` is pending for, at most.
+    """
+
+    def __init__(self, context: ChainContext, pending_slots: int = 3600):
+        self._context = context
+        self.pending_slots = pending_slots
+        self._pending: Dict[TransactionId, _PendingTransaction] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def wrapped_context(self) -> ChainContext:
+        """The context pending transactions are overlaid on."""
+        return self._context
+
+    @property
+    def pending_transactions(self) -> List[TransactionId]:
+        """Ids of the pending transactions, in the order they were submitted."""
+        with self._lock:
+            return list(self._pending)
+
+    def clear(self):
+        """Forget all the pending transactions, e.g. after they were rejected."""
+        with self._lock:
+            self._pending.clear()
+
+    def _record(self, tx: Transaction):
+        body = tx.transaction_body
+        tx_id = body.id
+        if tx.valid is False:
+            # Only the collaterals are spent and the collateral return created when phase-2 validation fails.
+            inputs = set(body.collateral or [])
+            outputs = (
+                {len(body.outputs): body.collateral_return}
+                if body.collateral_return
+                else {}
+            )
+        else:
+            inputs = set(body.inputs)
+            outputs = dict(enumerate(body.outputs))
+        expiry = (
+            body.ttl
+            if body.ttl is not None
+            else self._context.last_block_slot + self.pending_slots
+        )
+        with self._lock:
+            self._pending[tx_id] = _PendingTransaction(
+                inputs,
+                [
+                    UTxO(TransactionInput(tx_id, index), output)
+                    for index, output in outputs.items()
+                ],
+                expiry,
+            )
+
+    def _confirm(self, tx_id: TransactionId):
+        pending = self._pending.pop(tx_id, None)
+        if pending is not None:
+            for tx_in in pending.inputs:
+                self._confirm(tx_in.transaction_id)
+
+    def _discard(self, tx_id: TransactionId):
+        """Forget a pending transaction, and the pending transactions spending its outputs."""
+        if self._pending.pop(tx_id, None) is None:
+            return
+        for child_id, pending in list(self._pending.items()):
+            if any(tx_in.transaction_id == tx_id for tx_in in pending.inputs):
+                self._discard(child_id)
+
+    def _overlay(self, found: Dict[str, List[UTxO]]) -> Dict[str, List[UTxO]]:
+        """Update the pending transactions with the UTxOs found by the wrapped context, and overlay them on these."""
+        slot = self._context.last_block_slot
+        with self._lock:
+            owners = {
+                utxo.input: address
+                for address, utxos in found.items()
+                for utxo in utxos
+            }
+            confirmed, discarded = [], []
+            for tx_id, pending in self._pending.items():
+                if pending.expiry <= slot:
+                    discarded.append(tx_id)
+                elif any(utxo.input in owners for utxo in pending.outputs):
+                    confirmed.append(tx_id)
+                elif any(
+                    address in found and tx_in not in owners
+                    for tx_in, address in pending.seen.items()
+                ):
+                    # Most likely the transaction itself is on chain, so the ones spending its outputs are kept.
+                    confirmed.append(tx_id)
+                else:
+                    for tx_in in pending.inputs:
+                        if tx_in in owners:
+                            pending.seen[tx_in] = owners[tx_in]
+            for tx_id in confirmed:
+                self._confirm(tx_id)
+            for tx_id in discarded:
+                self._discard(tx_id)
+
+            spent = {
+                tx_in for pending in self._pending.values() for tx_in in pending.inputs
+            }
+            created: Dict[str, List[UTxO]] = {}
+            for pending in self._pending.values():
+                for utxo in pending.outputs:
+                    if utxo.input not in spent:
+                        created.setdefault(str(utxo.output.address), []).append(utxo)
+
+        return {
+            address: [utxo for utxo in utxos if utxo.input not in spent]
+            + created.get(address, [])
+            for address, utxos in found.items()
+        }
+
+    @property
+    def network(self) -> Network:
+        return self._context.network
+
+    @property
+    def epoch(self) -> int:
+        return self._context.epoch
+
+    @property
+    def last_block_slot(self) -> int:
+        return self._context.last_block_slot
+
+    @property
+    def protocol_param(self) -> ProtocolParameters:
+        return self._context.protocol_param
+
+    @property
+    def genesis_param(self) -> GenesisParameters:
+        return self._context.genesis_param
+
+    def _utxos(self, address: str) -> List[UTxO]:
+        return self._overlay({address: self._context.utxos(address)})[address]
+
+    def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        found: Dict[str, List[UTxO]] = {address: [] for address in addresses}
+        for utxo in self._context.utxos_many(addresses):
+            owner = found.get(str(utxo.output.address))
+            if owner is None:
+                # Results of an address given in another form can't be told apart from the others: look them up alone.
+                found = {address: self._context.utxos(address) for address in addresses}
+                break
+            owner.append(utxo)
+        overlaid = self._overlay(found)
+        return [utxo for address in addresses for utxo in overlaid[address]]
+
+    def submit_tx(self, tx: Union[Transaction, bytes, str]):
+        if not isinstance(tx, Transaction):
+            return super().submit_tx(tx)
+        result = self._context.submit_tx_cbor(tx.to_cbor())
+        self._record(tx)
+        return result
+
+    def submit_tx_cbor(self, cbor: Union[bytes, str]):
+        result = self._context.submit_tx_cbor(cbor)
+        # The original CBOR is kept, so the id is that of the submitted bytes even if they aren't canonical.
+        self._record(Transaction.from_cbor(cbor, preserve_cbor=True))
+        return result
+
+    def evaluate_tx_cbor(self, cbor: Union[bytes, str]) -> Dict[str, ExecutionUnits]:
+        return self._context.evaluate_tx_cbor(cbor)
@@ -1,5 +1,22 @@
+import asyncio
+import itertools
+import json
+import threading
 import time
-from typing import Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from cachetools import Cache, LRUCache, TTLCache, func
 from ogmios.client import Client as OgmiosClient
@@ -9,12 +26,34 @@ from ogmios.datatypes import ProtocolParameters as OgmiosProtocolParameters
 from ogmios.datatypes import Tip as OgmiosTip
 from ogmios.datatypes import TxOutputReference as OgmiosTxOutputReference
 from ogmios.datatypes import Utxo as OgmiosUtxo
+from ogmios.model.ogmios_model import Jsonrpc
+from ogmios.statequery import (
+    QueryEpoch,
+    QueryEraSummaries,
+    QueryGenesisConfiguration,
+    QueryNetworkTip,
+    QueryProtocolParameters,
+    QueryUtxo,
+)
+from ogmios.txsubmit import EvaluateTransaction, SubmitTransaction
 from ogmios.utils import GenesisParameters as OgmiosGenesisParameters
 from ogmios.utils import get_current_era
+from websockets.asyncio.client import ClientConnection
+from websockets.asyncio.client import connect as websocket_connect
+from websockets.exceptions import WebSocketException
 
 from pycardano.address import Address
-from pycardano.backend.base import ChainContext, GenesisParameters, ProtocolParameters
-from pycardano.backend.kupo import KupoChainContextExtension
+from pycardano.backend.base import (
+    AsyncChainContext,
+    ChainContext,
+    GenesisParameters,
+    ProtocolParameters,
+    _group_by_address,
+)
+from pycardano.backend.kupo import (
+    AsyncKupoChainContextExtension,
+    KupoChainContextExtension,
+)
 from pycardano.hash import DatumHash, ScriptHash
 from pycardano.network import Network
 from pycardano.plutus import (
@@ -37,11 +76,183 @@ from pycardano.transaction import (
 ALONZO_COINS_PER_UTXO_WORD = 34482
 DEFAULT_REFETCH_INTERVAL = 1000
 
-__all__ = ["OgmiosV6ChainContext", "OgmiosChainContext", "KupoOgmiosV6ChainContext"]
+T = TypeVar("T")
+
+__all__ = [
+    "OgmiosV6ChainContext",
+    "OgmiosChainContext",
+    "KupoOgmiosV6ChainContext",
+    "AsyncOgmiosV6ChainContext",
+    "AsyncKupoOgmiosV6ChainContext",
+]
+
+
+class _OgmiosV6Results:
+    """Conversion of Ogmios v6 query results to PyCardano types, shared by the sync and async contexts."""
+
+    @staticmethod
+    def _fraction_parser(fraction: str) -> float:
+        x, y = fraction.split("/")
+        return int(x) / int(y)
+
+    def _parse_protocol_param(
+        self, protocol_parameters: OgmiosProtocolParameters
+    ) -> ProtocolParameters:
+        pyc_protocol_params = ProtocolParameters(
+            min_fee_constant=protocol_parameters.min_fee_constant.lovelace,
+            min_fee_coefficient=protocol_parameters.min_fee_coefficient,
+            min_pool_cost=protocol_parameters.min_stake_pool_cost.lovelace,
+            max_block_size=protocol_parameters.max_block_body_size.get("bytes"),
+            max_tx_size=protocol_parameters.max_transaction_size.get("bytes"),
+            max_block_header_size=protocol_parameters.max_block_header_size.get(
+                "bytes"
+            ),
+            key_deposit=protocol_parameters.stake_credential_deposit.lovelace,
+            pool_deposit=protocol_parameters.stake_pool_deposit.lovelace,
+            pool_influence=eval(protocol_parameters.stake_pool_pledge_influence),
+            monetary_expansion=eval(protocol_parameters.monetary_expansion),
+            treasury_expansion=eval(protocol_parameters.treasury_expansion),
+            decentralization_param=None,  # type: ignore[arg-type]
+            extra_entropy=protocol_parameters.extra_entropy,
+            protocol_major_version=protocol_parameters.version.get("major"),
+            protocol_minor_version=protocol_parameters.version.get("minor"),
+            min_utxo=None,  # type: ignore[arg-type]
+            price_mem=eval(protocol_parameters.script_execution_prices.get("memory")),
+            price_step=eval(protocol_parameters.script_execution_prices.get("cpu")),
+            max_tx_ex_mem=protocol_parameters.max_execution_units_per_transaction.get(
+                "memory"
+            ),
+            max_tx_ex_steps=protocol_parameters.max_execution_units_per_transaction.get(
+                "cpu"
+            ),
+            max_block_ex_mem=protocol_parameters.max_execution_units_per_block.get(
+                "memory"
+            ),
+            max_block_ex_steps=protocol_parameters.max_execution_units_per_block.get(
+                "cpu"
+            ),
+            max_val_size=protocol_parameters.max_value_size.get("bytes"),
+            collateral_percent=protocol_parameters.collateral_percentage,
+            max_collateral_inputs=protocol_parameters.max_collateral_inputs,
+            coins_per_utxo_word=ALONZO_COINS_PER_UTXO_WORD,
+            coins_per_utxo_byte=protocol_parameters.min_utxo_deposit_coefficient,
+            cost_models=self._parse_cost_models(protocol_parameters.plutus_cost_models),
+            maximum_reference_scripts_size=protocol_parameters.max_ref_script_size,
+            min_fee_reference_scripts=protocol_parameters.min_fee_ref_scripts,
+        )
+        return pyc_protocol_params
+
+    def _utxo_from_ogmios_result(self, utxo: OgmiosUtxo) -> UTxO:
+        """Convert an Ogmios UTxO result to a PyCardano UTxO."""
+        tx_in = TransactionInput.from_primitive([utxo.tx_id, utxo.index])
+        lovelace_amount = utxo.value.get("ada").get("lovelace", 0)
+        script = utxo.script
+        if script:
+            # TODO: Need to test with native scripts
+            if script["language"].startswith("plutus:v"):
+                script = PlutusScript.from_version(
+                    int(script["language"].removeprefix("plutus:v")),
+                    bytes.fromhex(script["cbor"]),
+                )
+            else:
+                raise ValueError("Unknown plutus script type")
+        datum_hash = (
+            DatumHash.from_primitive(utxo.datum_hash) if utxo.datum_hash else None
+        )
+        datum = None
+        if utxo.datum and utxo.datum != utxo.datum_hash:
+            datum = RawCBOR(bytes.fromhex(utxo.datum))
+        if set(utxo.value.keys()) == {"ada"}:
+            tx_out = TransactionOutput(
+                Address.from_primitive(utxo.address),
+                amount=lovelace_amount,
+                datum_hash=datum_hash,
+                datum=datum,
+                script=script,
+            )
+        else:
+            multi_assets = MultiAsset()
+            for asset_hex, token in utxo.value.items():
+                if asset_hex != "ada":
+                    for token_name_hex, quantity in token.items():
+                        policy = ScriptHash.from_primitive(asset_hex)
+                        token_name = AssetName.from_primitive(token_name_hex)
+                        multi_assets.setdefault(policy, Asset())[token_name] = quantity
+
+            tx_out = TransactionOutput(
+                Address.from_primitive(utxo.address),
+                amount=Value(lovelace_amount, multi_assets),
+                datum_hash=datum_hash,
+                datum=datum,
+                script=script,
+            )
+        pyc_utxo = UTxO(tx_in, tx_out)
+        return pyc_utxo
 
+    def _parse_evaluation(self, result: List[dict]) -> Dict[str, ExecutionUnits]:
+        result_dict = {}
+        for res in result:
+            purpose = res["validator"]["purpose"]
+            # Hotfix: this purpose has been renamed in the latest version of Ogmios
+            if purpose == "withdraw":
+                purpose = "withdrawal"
+            result_dict[f"{purpose}:{res['validator']['index']}"] = ExecutionUnits(
+                mem=res["budget"]["memory"],
+                steps=res["budget"]["cpu"],
+            )
+        return result_dict
 
-class OgmiosV6ChainContext(ChainContext):
-    """Ogmios chain context for use with PyCardano"""
+    def _parse_cost_models(self, plutus_cost_models):
+        ogmios_cost_models = plutus_cost_models or {}
+
+        cost_models = {}
+        if "plutus:v1" in ogmios_cost_models:
+            cost_models["PlutusV1"] = dict(
+                zip(
+                    sorted(PLUTUS_V1_COST_MODEL.keys()),
+                    ogmios_cost_models["plutus:v1"].copy(),
+                )
+            )
+        if "plutus:v2" in ogmios_cost_models:
+            cost_models["PlutusV2"] = dict(
+                zip(
+                    sorted(PLUTUS_V2_COST_MODEL.keys()),
+                    ogmios_cost_models["plutus:v2"].copy(),
+                )
+            )
+        if "plutus:v3" in ogmios_cost_models:
+            cost_models["PlutusV3"] = {}
+            width = len(f'{len(ogmios_cost_models["plutus:v3"])}')
+            for i, v in enumerate(ogmios_cost_models["plutus:v3"].copy()):
+                cost_models["PlutusV3"][f"{i:0{width}d}"] = v
+        return cost_models
+
+
+class OgmiosV6ChainContext(_OgmiosV6Results, ChainContext):
+    """Ogmios chain context for use with PyCardano
+
+    By default, every query opens a new websocket connection to Ogmios. When `persistent_connections` is set,
+    connections are instead kept open and reused across queries, so a transaction build that touches the chain tip,
+    UTxOs and script evaluation only pays for the handshake once. A pooled connection that turns out to be broken is
+    dropped and the query is retried on a fresh one.
+
+    Args:
+        host (str): Host of the Ogmios server.
+        port (int): Port of the Ogmios server.
+        path (str): Path of the Ogmios websocket endpoint.
+        secure (bool): Whether to connect with wss.
+        refetch_chain_tip_interval (float): Seconds between chain tip refreshes.
+        utxo_cache_size (int): Max number of cached UTxO query results.
+        datum_cache_size (int): Max number of cached datums.
+        network (Network): Network of the chain.
+        additional_headers (dict): Extra headers sent when opening a connection.
+        persistent_connections (bool): Keep connections open and reuse them across queries. Call :meth:`close`
+            to release them.
+        max_idle_connections (int): Max number of open connections kept around for reuse when
+            `persistent_connections` is set.
+        max_retries (int): Number of times a query is retried on a fresh connection after a pooled connection
+            failed, when `persistent_connections` is set. Transaction submission is never retried.
+    """
 
     _network: Network
     _client: OgmiosClient
@@ -52,6 +263,7 @@ class OgmiosV6ChainContext(ChainContext):
     _protocol_param: Optional[OgmiosProtocolParameters]
     _utxo_cache: Cache
     _datum_cache: Cache
+    _idle_clients: List[OgmiosClient]
 
     def __init__(
         self,
@@ -64,6 +276,9 @@ class OgmiosV6ChainContext(ChainContext):
         datum_cache_size: int = 10000,
         network: Network = Network.TESTNET,
         additional_headers: Optional[dict] = None,
+        persistent_connections: bool = False,
+        max_idle_connections: int = 4,
+        max_retries: int = 1,
     ):
         self.host = host
         self.port = port
@@ -87,41 +302,133 @@ class OgmiosV6ChainContext(ChainContext):
         )
         self._datum_cache = LRUCache(maxsize=datum_cache_size)
 
-    def _query_current_era(self) -> OgmiosEra:
-        with OgmiosClient(
+        self.persistent_connections = persistent_connections
+        self.max_idle_connections = max_idle_connections
+        self.max_retries = max_retries
+        self._idle_clients = []
+        self._pool_lock = threading.Lock()
+
+    def _connect(self) -> OgmiosClient:
+        return OgmiosClient(
             self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            return get_current_era(client)
+        )
+
+    @contextmanager
+    def _client(self) -> Iterator[OgmiosClient]:
+        """Check out a connection, from the pool when connections are persistent.
+
+        A connection is only returned to the pool when the block exits cleanly, so a connection left in an unknown
+        state by an error is never reused.
+        """
+        client = None
+        if self.persistent_connections:
+            with self._pool_lock:
+                if self._idle_clients:
+                    client = self._idle_clients.pop()
+        if client is None:
+            client = self._connect()
+        try:
+            yield client
+        except BaseException:
+            self._close_client(client)
+            raise
+        if self.persistent_connections:
+            with self._pool_lock:
+                if len(self._idle_clients) < self.max_idle_connections:
+                    self._idle_clients.append(client)
+                    return
+        self._close_client(client)
+
+    @staticmethod
+    def _close_client(client: OgmiosClient):
+        try:
+            client.connection.close()
+        except (WebSocketException, OSError):
+            pass
+
+    def _execute(self, request: Callable[[OgmiosClient], T], retry: bool = True) -> T:
+        """Run a request against Ogmios, retrying on a fresh connection if a pooled connection fails.
+
+        Args:
+            request (Callable[[OgmiosClient], T]): Function issuing the request on a client.
+            retry (bool): Whether the request may be retried. Should be False for requests that are not safe to
+                send twice.
+
+        Returns:
+            T: The result of the request.
+        """
+        if not self.persistent_connections:
+            # A fresh connection was opened for the request, retrying it would only resend the query.
+            retry = False
+        for _ in range(self.max_retries if retry else 0):
+            try:
+                with self._client() as client:
+                    return request(client)
+            except (WebSocketException, OSError):
+                # Idle connections opened before the failure are likely broken as well.
+                self.close()
+        with self._client() as client:
+            return request(client)
+
+    def _pipeline(self, requests: List[Tuple[str, tuple]]) -> List[Any]:
+        """Send several requests on one connection before reading any response.
+
+        Ogmios answers requests on a connection in the order they were sent, so this saves a round trip per request
+        over issuing them one by one.
+
+        Args:
+            requests (List[Tuple[str, tuple]]): Pairs of an Ogmios client method name (e.g. "query_utxo") and the
+                arguments of the request.
+
+        Returns:
+            List[Any]: The results of the requests, in order.
+        """
+        return self._execute(lambda client: self._send_pipelined(client, requests))
+
+    @staticmethod
+    def _send_pipelined(
+        client: OgmiosClient, requests: List[Tuple[str, tuple]]
+    ) -> List[Any]:
+        methods = [getattr(client, name) for name, _ in requests]
+        for method, (_, args) in zip(methods, requests):
+            method.send(*args)
+        return [method.receive()[0] for method in methods]
+
+    def close(self):
+        """Close all idle pooled connections."""
+        with self._pool_lock:
+            clients, self._idle_clients = self._idle_clients, []
+        for client in clients:
+            self._close_client(client)
+
+    def _query_current_era(self) -> OgmiosEra:
+        return self._execute(get_current_era)
 
     def _query_current_epoch(self) -> int:
-        with OgmiosClient(
-            self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            epoch, _ = client.query_epoch.execute()
-            return epoch
+        epoch, _ = self._execute(lambda client: client.query_epoch.execute())
+        return epoch
 
     def _query_chain_tip(self) -> OgmiosTip:
-        with OgmiosClient(
-            self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            tip, _ = client.query_network_tip.execute()
-            return tip
+        tip, _ = self._execute(lambda client: client.query_network_tip.execute())
+        return tip
 
     def _query_utxos_by_address(self, address: Address) -> List[OgmiosUtxo]:
-        with OgmiosClient(
-            self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            utxos, _ = client.query_utxo.execute([address])
-            return utxos
+        utxos, _ = self._execute(lambda client: client.query_utxo.execute([address]))
+        return utxos
+
+    def _query_utxos_by_addresses(
+        self, addresses: List[OgmiosAddress]
+    ) -> List[OgmiosUtxo]:
+        utxos, _ = self._execute(lambda client: client.query_utxo.execute(addresses))
+        return utxos
 
     def _query_utxos_by_tx_id(self, tx_id: str, index: int) -> List[OgmiosUtxo]:
-        with OgmiosClient(
-            self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            utxos, _ = client.query_utxo.execute(
+        utxos, _ = self._execute(
+            lambda client: client.query_utxo.execute(
                 [OgmiosTxOutputReference(tx_id, index)]
             )
-            return utxos
+        )
+        return utxos
 
     def _is_chain_tip_updated(self):
         # fetch at most every twenty seconds!
@@ -135,11 +442,6 @@ class OgmiosV6ChainContext(ChainContext):
         else:
             return False
 
-    @staticmethod
-    def _fraction_parser(fraction: str) -> float:
-        x, y = fraction.split("/")
-        return int(x) / int(y)
-
     @property
     def protocol_param(self) -> ProtocolParameters:
         if not self._protocol_param or self._is_chain_tip_updated():
@@ -147,57 +449,10 @@ class OgmiosV6ChainContext(ChainContext):
         return self._protocol_param
 
     def _fetch_protocol_param(self) -> ProtocolParameters:
-        with OgmiosClient(
-            self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            protocol_parameters, _ = client.query_protocol_parameters.execute()
-            pyc_protocol_params = ProtocolParameters(
-                min_fee_constant=protocol_parameters.min_fee_constant.lovelace,
-                min_fee_coefficient=protocol_parameters.min_fee_coefficient,
-                min_pool_cost=protocol_parameters.min_stake_pool_cost.lovelace,
-                max_block_size=protocol_parameters.max_block_body_size.get("bytes"),
-                max_tx_size=protocol_parameters.max_transaction_size.get("bytes"),
-                max_block_header_size=protocol_parameters.max_block_header_size.get(
-                    "bytes"
-                ),
-                key_deposit=protocol_parameters.stake_credential_deposit.lovelace,
-                pool_deposit=protocol_parameters.stake_pool_deposit.lovelace,
-                pool_influence=eval(protocol_parameters.stake_pool_pledge_influence),
-                monetary_expansion=eval(protocol_parameters.monetary_expansion),
-                treasury_expansion=eval(protocol_parameters.treasury_expansion),
-                decentralization_param=None,  # type: ignore[arg-type]
-                extra_entropy=protocol_parameters.extra_entropy,
-                protocol_major_version=protocol_parameters.version.get("major"),
-                protocol_minor_version=protocol_parameters.version.get("minor"),
-                min_utxo=None,  # type: ignore[arg-type]
-                price_mem=eval(
-                    protocol_parameters.script_execution_prices.get("memory")
-                ),
-                price_step=eval(protocol_parameters.script_execution_prices.get("cpu")),
-                max_tx_ex_mem=protocol_parameters.max_execution_units_per_transaction.get(
-                    "memory"
-                ),
-                max_tx_ex_steps=protocol_parameters.max_execution_units_per_transaction.get(
-                    "cpu"
-                ),
-                max_block_ex_mem=protocol_parameters.max_execution_units_per_block.get(
-                    "memory"
-                ),
-                max_block_ex_steps=protocol_parameters.max_execution_units_per_block.get(
-                    "cpu"
-                ),
-                max_val_size=protocol_parameters.max_value_size.get("bytes"),
-                collateral_percent=protocol_parameters.collateral_percentage,
-                max_collateral_inputs=protocol_parameters.max_collateral_inputs,
-                coins_per_utxo_word=ALONZO_COINS_PER_UTXO_WORD,
-                coins_per_utxo_byte=protocol_parameters.min_utxo_deposit_coefficient,
-                cost_models=self._parse_cost_models(
-                    protocol_parameters.plutus_cost_models
-                ),
-                maximum_reference_scripts_size=protocol_parameters.max_ref_script_size,
-                min_fee_reference_scripts=protocol_parameters.min_fee_ref_scripts,
-            )
-            return pyc_protocol_params
+        protocol_parameters, _ = self._execute(
+            lambda client: client.query_protocol_parameters.execute()
+        )
+        return self._parse_protocol_param(protocol_parameters)
 
     @property
     def genesis_param(self) -> GenesisParameters:
@@ -219,10 +474,29 @@ class OgmiosV6ChainContext(ChainContext):
         return self._genesis_param  # type: ignore[return-value]
 
     def _fetch_genesis_param(self) -> OgmiosGenesisParameters:
-        with OgmiosClient(
-            self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            return OgmiosGenesisParameters(client, self._query_current_era())
+        return self._execute(self._query_genesis_param)
+
+    def _query_genesis_param(self, client: OgmiosClient) -> OgmiosGenesisParameters:
+        """Same as :class:`ogmios.utils.GenesisParameters`, with the configurations of all eras queried at once.
+
+        The configuration of each era adds to those of the previous ones, up to the current era.
+        """
+        current_era = get_current_era(client)
+        eras = []
+        for era in OgmiosEra:
+            if OgmiosEra.is_genesis_era(era):
+                eras.append(era)
+            if era == current_era:
+                break
+        configurations = self._send_pipelined(
+            client, [("query_genesis_configuration", (era.value,)) for era in eras]
+        )
+        genesis_param = OgmiosGenesisParameters.__new__(OgmiosGenesisParameters)
+        for era, configuration in zip(eras, configurations):
+            genesis_param.era = era.value
+            for key, value in configuration.__dict__.items():
+                setattr(genesis_param, key, value)
+        return genesis_param
 
     @property
     def network(self) -> Network:
@@ -249,6 +523,39 @@ class OgmiosV6ChainContext(ChainContext):
 
         return utxos
 
+    def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        slot = self.last_block_slot
+        found = {
+            address: self._utxo_cache[(slot, address)]
+            for address in addresses
+            if (slot, address) in self._utxo_cache
+        }
+        missing = [address for address in addresses if address not in found]
+        if missing:
+            # Ogmios looks up any number of addresses in a single query.
+            results = _group_by_address(
+                missing,
+                self._query_utxos_by_addresses(
+                    [OgmiosAddress(address=address) for address in missing]
+                ),
+                lambda result: result.address,
+            )
+            if results is None:
+                # Results of an address given in another form can't be told apart from the others: look them up alone.
+                results = {
+                    address: self._query_utxos_by_addresses(
+                        [OgmiosAddress(address=address)]
+                    )
+                    for address in missing
+                }
+            for address in missing:
+                found[address] = [
+                    self._utxo_from_ogmios_result(result) for result in results[address]
+                ]
+                self._utxo_cache[(slot, address)] = found[address]
+
+        return [utxo for address in addresses for utxo in found[address]]
+
     def _check_utxo_unspent(self, tx_id: str, index: int) -> bool:
         results = self._query_utxos_by_tx_id(tx_id, index)
         return len(results) > 0
@@ -270,53 +577,6 @@ class OgmiosV6ChainContext(ChainContext):
 
         return utxos
 
-    def _utxo_from_ogmios_result(self, utxo: OgmiosUtxo) -> UTxO:
-        """Convert an Ogmios UTxO result to a PyCardano UTxO."""
-        tx_in = TransactionInput.from_primitive([utxo.tx_id, utxo.index])
-        lovelace_amount = utxo.value.get("ada").get("lovelace", 0)
-        script = utxo.script
-        if script:
-            # TODO: Need to test with native scripts
-            if script["language"].startswith("plutus:v"):
-                script = PlutusScript.from_version(
-                    int(script["language"].removeprefix("plutus:v")),
-                    bytes.fromhex(script["cbor"]),
-                )
-            else:
-                raise ValueError("Unknown plutus script type")
-        datum_hash = (
-            DatumHash.from_primitive(utxo.datum_hash) if utxo.datum_hash else None
-        )
-        datum = None
-        if utxo.datum and utxo.datum != utxo.datum_hash:
-            datum = RawCBOR(bytes.fromhex(utxo.datum))
-        if set(utxo.value.keys()) == {"ada"}:
-            tx_out = TransactionOutput(
-                Address.from_primitive(utxo.address),
-                amount=lovelace_amount,
-                datum_hash=datum_hash,
-                datum=datum,
-                script=script,
-            )
-        else:
-            multi_assets = MultiAsset()
-            for asset_hex, token in utxo.value.items():
-                if asset_hex != "ada":
-                    for token_name_hex, quantity in token.items():
-                        policy = ScriptHash.from_primitive(asset_hex)
-                        token_name = AssetName.from_primitive(token_name_hex)
-                        multi_assets.setdefault(policy, Asset())[token_name] = quantity
-
-            tx_out = TransactionOutput(
-                Address.from_primitive(utxo.address),
-                amount=Value(lovelace_amount, multi_assets),
-                datum_hash=datum_hash,
-                datum=datum,
-                script=script,
-            )
-        pyc_utxo = UTxO(tx_in, tx_out)
-        return pyc_utxo
-
     def utxo_by_tx_id(self, tx_id: str, index: int) -> Optional[UTxO]:
         utxos = self._query_utxos_by_tx_id(tx_id, index)
         if len(utxos) > 0:
@@ -326,65 +586,27 @@ class OgmiosV6ChainContext(ChainContext):
     def query_account_reward_summaries(
         self, scripts: Optional[List[str]] = None, keys: Optional[List[str]] = None
     ) -> List[dict]:
-        with OgmiosClient(
-            self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            summaries, _ = client.query_reward_account_summaries.execute(
+        summaries, _ = self._execute(
+            lambda client: client.query_reward_account_summaries.execute(
                 scripts=scripts, keys=keys
             )
-            return summaries
+        )
+        return summaries
 
     def submit_tx_cbor(self, cbor: Union[bytes, str]):
         if isinstance(cbor, bytes):
             cbor = cbor.hex()
-        with OgmiosClient(
-            self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            client.submit_transaction.execute(cbor)
+        self._execute(
+            lambda client: client.submit_transaction.execute(cbor), retry=False
+        )
 
     def evaluate_tx_cbor(self, cbor: Union[bytes, str]) -> Dict[str, ExecutionUnits]:
         if isinstance(cbor, bytes):
             cbor = cbor.hex()
-        with OgmiosClient(
-            self.host, self.port, self.path, self.secure, self.additional_headers
-        ) as client:
-            result, _ = client.evaluate_transaction.execute(cbor)
-            result_dict = {}
-            for res in result:
-                purpose = res["validator"]["purpose"]
-                # Hotfix: this purpose has been renamed in the latest version of Ogmios
-                if purpose == "withdraw":
-                    purpose = "withdrawal"
-                result_dict[f"{purpose}:{res['validator']['index']}"] = ExecutionUnits(
-                    mem=res["budget"]["memory"],
-                    steps=res["budget"]["cpu"],
-                )
-            return result_dict
-
-    def _parse_cost_models(self, plutus_cost_models):
-        ogmios_cost_models = plutus_cost_models or {}
-
-        cost_models = {}
-        if "plutus:v1" in ogmios_cost_models:
-            cost_models["PlutusV1"] = dict(
-                zip(
-                    sorted(PLUTUS_V1_COST_MODEL.keys()),
-                    ogmios_cost_models["plutus:v1"].copy(),
-                )
-            )
-        if "plutus:v2" in ogmios_cost_models:
-            cost_models["PlutusV2"] = dict(
-                zip(
-                    sorted(PLUTUS_V2_COST_MODEL.keys()),
-                    ogmios_cost_models["plutus:v2"].copy(),
-                )
-            )
-        if "plutus:v3" in ogmios_cost_models:
-            cost_models["PlutusV3"] = {}
-            width = len(f'{len(ogmios_cost_models["plutus:v3"])}')
-            for i, v in enumerate(ogmios_cost_models["plutus:v3"].copy()):
-                cost_models["PlutusV3"][f"{i:0{width}d}"] = v
-        return cost_models
+        result, _ = self._execute(
+            lambda client: client.evaluate_transaction.execute(cbor)
+        )
+        return self._parse_evaluation(result)
 
 
 class OgmiosChainContext(OgmiosV6ChainContext):
@@ -404,6 +626,7 @@ def KupoOgmiosV6ChainContext(
     network: Network = Network.TESTNET,
     additional_headers: Optional[dict] = None,
     kupo_url: Optional[str] = None,
+    persistent_connections: bool = False,
 ) -> KupoChainContextExtension:
     return KupoChainContextExtension(
         OgmiosV6ChainContext(
@@ -416,6 +639,350 @@ def KupoOgmiosV6ChainContext(
             datum_cache_size,
             network,
             additional_headers,
+            persistent_connections=persistent_connections,
+        ),
+        kupo_url,
+    )
+
+
+class _OgmiosMessage:
+    """Stands in for an ogmios-python client, so that its method classes can build requests and parse responses
+    that are sent and received over an asyncio connection instead."""
+
+    rpc_version = Jsonrpc.field_2_0
+
+    def __init__(self, response: Optional[dict] = None):
+        self.request: Optional[str] = None
+        self.response = response
+
+    def send(self, request: str):
+        self.request = request
+
+    def receive(self) -> Optional[dict]:
+        return self.response
+
+
+class _AsyncOgmiosConnection:
+    """A websocket connection to Ogmios on which many requests can be in flight at once.
+
+    Responses are matched to requests by their JSON-RPC id, by a task reading from the connection.
+    """
+
+    def __init__(self, websocket: ClientConnection):
+        self.websocket = websocket
+        self.closed = False
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader = asyncio.ensure_future(self._read())
+
+    async def _read(self):
+        error: BaseException = ConnectionError("Ogmios connection closed")
+        try:
+            async for message in self.websocket:
+                response = json.loads(message)
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (WebSocketException, OSError) as e:
+            error = e
+        finally:
+            self.closed = True
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    async def request(self, request_id: int, message: str) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self.websocket.send(message)
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def close(self):
+        self.closed = True
+        try:
+            await self.websocket.close()
+        except (WebSocketException, OSError):
+            pass
+        await asyncio.gather(self._reader, return_exceptions=True)
+
+
+class AsyncOgmiosV6ChainContext(_OgmiosV6Results, AsyncChainContext):
+    """Asyncio Ogmios chain context, see :class:`OgmiosV6ChainContext`.
+
+    All queries share one websocket connection, on which any number of requests can be in flight at once, so
+    hundreds of concurrent queries from one event loop don't need hundreds of connections. Concurrent queries for the
+    chain tip, protocol parameters or genesis parameters are coalesced into one request. The connection is opened on
+    first use and reopened if it breaks.
+
+    Args:
+        host (str): Host of the Ogmios server.
+        port (int): Port of the Ogmios server.
+        path (str): Path of the Ogmios websocket endpoint.
+        secure (bool): Whether to connect with wss.
+        refetch_chain_tip_interval (float): Seconds between protocol and genesis parameters refreshes.
+        utxo_cache_size (int): Max number of cached UTxO query results.
+        network (Network): Network of the chain.
+        additional_headers (dict): Extra headers sent when opening the connection.
+        max_concurrent_requests (int): Max number of requests in flight at once.
+        max_retries (int): Number of times a query is retried on a fresh connection after a connection failure.
+            Transaction submission is never retried.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 1337,
+        path: str = "",
+        secure: bool = False,
+        refetch_chain_tip_interval: Optional[float] = None,
+        utxo_cache_size: int = 10000,
+        network: Network = Network.TESTNET,
+        additional_headers: Optional[dict] = None,
+        max_concurrent_requests: int = 256,
+        max_retries: int = 1,
+    ):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.secure = secure
+        self.additional_headers = additional_headers or {}
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_retries = max_retries
+        self._network = network
+        self._refetch_chain_tip_interval = (
+            refetch_chain_tip_interval
+            if refetch_chain_tip_interval is not None
+            else DEFAULT_REFETCH_INTERVAL
+        )
+        self._utxo_cache: Cache = TTLCache(
+            ttl=self._refetch_chain_tip_interval, maxsize=utxo_cache_size
+        )
+
+        self._request_ids = itertools.count()
+        self._connection: Optional[_AsyncOgmiosConnection] = None
+        # Created on first use, so that they belong to the event loop the context is used from.
+        self._connection_lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        # Cached results, with the time they were fetched.
+        self._fetched: Dict[str, Tuple[float, Any]] = {}
+
+    @property
+    def network(self) -> Network:
+        return self._network
+
+    async def _connect(self) -> _AsyncOgmiosConnection:
+        if self._connection_lock is None:
+            self._connection_lock = asyncio.Lock()
+        async with self._connection_lock:
+            if self._connection is None or self._connection.closed:
+                protocol = "wss" if self.secure else "ws"
+                websocket = await websocket_connect(
+                    f"{protocol}://{self.host}:{self.port}/{self.path}",
+                    additional_headers=self.additional_headers,
+                )
+                self._connection = _AsyncOgmiosConnection(websocket)
+            return self._connection
+
+    async def _request(self, method: Type, *args: Any, retry: bool = True) -> Any:
+        """Send a request to Ogmios and wait for its response.
+
+        Args:
+            method (Type): The ogmios-python class of the request, e.g. `QueryUtxo`.
+            *args (Any): Arguments of the request.
+            retry (bool): Whether the request may be retried on a fresh connection. Should be False for requests
+                that are not safe to send twice.
+
+        Returns:
+            Any: The parsed response, as returned by the `receive` method of the ogmios-python class.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        async with self._semaphore:
+            for attempt in itertools.count():
+                request_id = next(self._request_ids)
+                message = _OgmiosMessage()
+                method(message).send(*args, id=request_id)
+                try:
+                    connection = await self._connect()
+                    response = await connection.request(
+                        request_id, message.request  # type: ignore[arg-type]
+                    )
+                except (WebSocketException, OSError):
+                    if not retry or attempt >= self.max_retries:
+                        raise
+                    continue
+                return method(_OgmiosMessage(response)).receive()
+
+    async def _shared(
+        self, key: str, fetch: Callable[[], Awaitable[T]], max_age: float
+    ) -> T:
+        """Fetch a value, reusing a result younger than `max_age` seconds or joining a fetch already in flight."""
+        fetched = self._fetched.get(key)
+        if fetched is not None and time.time() - fetched[0] < max_age:
+            return fetched[1]
+
+        future = self._in_flight.get(key)
+        if future is None:
+
+            async def run():
+                try:
+                    value = await fetch()
+                    self._fetched[key] = (time.time(), value)
+                    return value
+                finally:
+                    del self._in_flight[key]
+
+            future = asyncio.ensure_future(run())
+            self._in_flight[key] = future
+        # A cancelled caller must not cancel the fetch other callers are waiting for.
+        return await asyncio.shield(future)
+
+    async def close(self):
+        """Close the connection to Ogmios."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.close()
+
+    async def _query_current_era(self) -> OgmiosEra:
+        era_summaries, _ = await self._request(QueryEraSummaries)
+        return OgmiosEra.by_index(len(era_summaries) - 1)
+
+    async def _query_utxos_by_addresses(
+        self, addresses: List[OgmiosAddress]
+    ) -> List[OgmiosUtxo]:
+        utxos, _ = await self._request(QueryUtxo, addresses)
+        return utxos
+
+    async def epoch(self) -> int:
+        epoch, _ = await self._request(QueryEpoch)
+        return epoch
+
+    async def last_block_slot(self) -> int:
+        async def fetch() -> int:
+            tip, _ = await self._request(QueryNetworkTip)
+            return tip.slot
+
+        return await self._shared("last_block_slot", fetch, max_age=1)
+
+    async def protocol_param(self) -> ProtocolParameters:
+        async def fetch() -> ProtocolParameters:
+            protocol_parameters, _ = await self._request(QueryProtocolParameters)
+            return self._parse_protocol_param(protocol_parameters)
+
+        return await self._shared(
+            "protocol_param", fetch, max_age=self._refetch_chain_tip_interval
+        )
+
+    async def genesis_param(self) -> GenesisParameters:
+        async def fetch() -> OgmiosGenesisParameters:
+            # Same as ogmios.utils.GenesisParameters, with the eras queried concurrently.
+            current_era = await self._query_current_era()
+            eras = []
+            for i in range(len(OgmiosEra)):
+                era = OgmiosEra.by_index(i)
+                if OgmiosEra.is_genesis_era(era):
+                    eras.append(era)
+                if era == current_era:
+                    break
+            configurations = await asyncio.gather(
+                *(self._request(QueryGenesisConfiguration, era.value) for era in eras)
+            )
+            genesis_parameters = OgmiosGenesisParameters.__new__(
+                OgmiosGenesisParameters
+            )
+            for era, (configuration, _) in zip(eras, configurations):
+                genesis_parameters.era = era.value
+                for key, value in configuration.__dict__.items():
+                    setattr(genesis_parameters, key, value)
+            return genesis_parameters
+
+        return await self._shared(
+            "genesis_param", fetch, max_age=self._refetch_chain_tip_interval
+        )
+
+    async def _utxos(self, address: str) -> List[UTxO]:
+        return await self._utxos_many([address])
+
+    async def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        slot = await self.last_block_slot()
+        found = {
+            address: self._utxo_cache[(slot, address)]
+            for address in addresses
+            if (slot, address) in self._utxo_cache
+        }
+        missing = [address for address in addresses if address not in found]
+        if missing:
+            # Ogmios looks up any number of addresses in a single query.
+            results = _group_by_address(
+                missing,
+                await self._query_utxos_by_addresses(
+                    [OgmiosAddress(address=address) for address in missing]
+                ),
+                lambda result: result.address,
+            )
+            if results is None:
+                # Results of an address given in another form can't be told apart from the others: look them up alone.
+                results = {
+                    address: await self._query_utxos_by_addresses(
+                        [OgmiosAddress(address=address)]
+                    )
+                    for address in missing
+                }
+            for address in missing:
+                found[address] = [
+                    self._utxo_from_ogmios_result(result) for result in results[address]
+                ]
+                self._utxo_cache[(slot, address)] = found[address]
+
+        return [utxo for address in addresses for utxo in found[address]]
+
+    async def utxo_by_tx_id(self, tx_id: str, index: int) -> Optional[UTxO]:
+        utxos, _ = await self._request(
+            QueryUtxo, [OgmiosTxOutputReference(tx_id, index)]
+        )
+        if len(utxos) > 0:
+            return self._utxo_from_ogmios_result(utxos[0])
+        return None
+
+    async def submit_tx_cbor(self, cbor: Union[bytes, str]):
+        if isinstance(cbor, bytes):
+            cbor = cbor.hex()
+        await self._request(SubmitTransaction, cbor, retry=False)
+
+    async def evaluate_tx_cbor(
+        self, cbor: Union[bytes, str]
+    ) -> Dict[str, ExecutionUnits]:
+        if isinstance(cbor, bytes):
+            cbor = cbor.hex()
+        result, _ = await self._request(EvaluateTransaction, cbor)
+        return self._parse_evaluation(result)
+
+
+def AsyncKupoOgmiosV6ChainContext(
+    host: str,
+    port: int,
+    path: str,
+    secure: bool,
+    refetch_chain_tip_interval: Optional[float] = None,
+    utxo_cache_size: int = 10000,
+    network: Network = Network.TESTNET,
+    additional_headers: Optional[dict] = None,
+    kupo_url: Optional[str] = None,
+) -> AsyncKupoChainContextExtension:
+    return AsyncKupoChainContextExtension(
+        AsyncOgmiosV6ChainContext(
+            host,
+            port,
+            path,
+            secure,
+            refetch_chain_tip_interval,
+            utxo_cache_size,
+            network,
+            additional_headers,
         ),
         kupo_url,
     )
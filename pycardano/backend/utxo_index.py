@@ -0,0 +1,515 @@
+"""A chain context serving the UTxOs of watched addresses from a local index.
+
+:class:`UTxOIndexChainContext` loads the UTxOs of a set of watched addresses once from another chain context, then
+keeps them current by following the chain: each block removes the UTxOs spent by its transactions and adds their
+outputs to watched addresses or credentials, and rollbacks undo the blocks rolled back. Looking up the UTxOs of a
+watched address is then a lookup in memory, without querying any backend.
+
+Blocks come from a :class:`BlockSource`: :class:`OgmiosChainSyncSource` follows the chain with the chain-sync protocol
+of Ogmios, and :class:`RecordedBlockSource` replays recorded chain-sync responses, e.g. to test offline.
+"""
+
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from ogmios.chainsync import NextBlock
+from ogmios.client import Client as OgmiosClient
+from ogmios.datatypes import Block, Direction, Origin, Point, Tip
+from ogmios.datatypes import Utxo as OgmiosUtxo
+from websockets.exceptions import WebSocketException
+
+from pycardano.address import Address
+from pycardano.backend.base import ChainContext, GenesisParameters, ProtocolParameters
+from pycardano.backend.ogmios_v6 import _OgmiosV6Results
+from pycardano.hash import ScriptHash, VerificationKeyHash
+from pycardano.logging import logger
+from pycardano.network import Network
+from pycardano.plutus import ExecutionUnits
+from pycardano.transaction import TransactionInput, UTxO
+
+__all__ = [
+    "BlockSource",
+    "OgmiosChainSyncSource",
+    "RecordedBlockSource",
+    "UTxOIndexChainContext",
+]
+
+ChainPoint = Union[Point, Origin]
+"""A point on the chain: a block or the origin of the chain."""
+
+ChainTip = Union[Tip, Origin]
+"""The tip of the chain: its most recent block, or its origin when it has no blocks."""
+
+
+class BlockSource:
+    """A stream of blocks, following the chain like the chain-sync protocol of Ogmios."""
+
+    def find_intersection(
+        self, points: List[ChainPoint]
+    ) -> Tuple[ChainPoint, ChainTip]:
+        """Move the stream to the most recent of some points on the chain.
+
+        Args:
+            points (List[ChainPoint]): Candidate points, most recent first.
+
+        Returns:
+            Tuple[ChainPoint, ChainTip]: The point the stream moved to, and the chain tip.
+        """
+        raise NotImplementedError()
+
+    def next_block(
+        self,
+    ) -> Optional[Tuple[Direction, ChainTip, Union[Block, ChainPoint]]]:
+        """Get the next step of the stream, waiting for it if the stream is at the chain tip.
+
+        Returns:
+            Optional[Tuple[Direction, ChainTip, Union[Block, ChainPoint]]]: The direction of the step, the chain tip,
+            and the block to roll forward to or the point to roll back to. None when the stream has ended.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """Release the resources held by the stream."""
+        pass
+
+
+class OgmiosChainSyncSource(BlockSource):
+    """Follows the chain with the chain-sync protocol of Ogmios.
+
+    Args:
+        host (str): Host of Ogmios.
+        port (int): Port of Ogmios.
+        path (str): Path of Ogmios.
+        secure (bool): Whether to connect with TLS.
+        additional_headers (Optional[dict]): Headers sent when connecting.
+        pipeline_depth (int): Number of blocks requested ahead, so blocks are downloaded while the previous ones are
+            applied.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 1337,
+        path: str = "",
+        secure: bool = False,
+        additional_headers: Optional[dict] = None,
+        pipeline_depth: int = 50,
+    ):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.secure = secure
+        self.additional_headers = additional_headers or {}
+        self.pipeline_depth = max(pipeline_depth, 1)
+        self._client: Optional[OgmiosClient] = None
+        self._in_flight = 0
+
+    @property
+    def client(self) -> OgmiosClient:
+        if self._client is None:
+            self._client = OgmiosClient(
+                self.host, self.port, self.path, self.secure, self.additional_headers
+            )
+            self._in_flight = 0
+        return self._client
+
+    def find_intersection(
+        self, points: List[ChainPoint]
+    ) -> Tuple[ChainPoint, ChainTip]:
+        try:
+            # Responses of blocks requested ahead are meant for the previous position of the stream.
+            while self._in_flight:
+                self.client.next_block.receive()
+                self._in_flight -= 1
+            intersection, tip, _ = self.client.find_intersection.execute(points)
+        except (WebSocketException, OSError):
+            self.close()
+            raise
+        return intersection, tip
+
+    def next_block(
+        self,
+    ) -> Optional[Tuple[Direction, ChainTip, Union[Block, ChainPoint]]]:
+        try:
+            while self._in_flight < self.pipeline_depth:
+                self.client.next_block.send()
+                self._in_flight += 1
+            direction, tip, block, _ = self.client.next_block.receive()
+            self._in_flight -= 1
+        except (WebSocketException, OSError):
+            self.close()
+            raise
+        return direction, tip, block
+
+    def close(self):
+        if self._client is not None:
+            client, self._client = self._client, None
+            try:
+                client.connection.close()
+            except (WebSocketException, OSError):
+                pass
+
+
+class RecordedBlockSource(BlockSource):
+    """Replays recorded chain-sync responses.
+
+    The replay always starts from the first response, wherever :meth:`find_intersection` is asked to move the stream.
+
+    Args:
+        responses (Iterable[dict]): Ogmios responses to ``nextBlock`` requests, in the order they were received.
+        tip (Optional[ChainTip]): Chain tip reported by :meth:`find_intersection`, i.e. the point the recording
+            starts after. Defaults to the origin of the chain.
+    """
+
+    def __init__(self, responses: Iterable[dict], tip: Optional[ChainTip] = None):
+        self._steps = [
+            NextBlock._parse_NextBlock_response(response)[:3] for response in responses
+        ]
+        self._tip = tip if tip is not None else Origin()
+        self._position = 0
+
+    @classmethod
+    def from_file(
+        cls, path: Union[str, Path], tip: Optional[ChainTip] = None
+    ) -> "RecordedBlockSource":
+        """Load responses recorded in a file, one JSON response per line.
+
+        Args:
+            path (Union[str, Path]): Path of the file.
+            tip (Optional[ChainTip]): Chain tip reported by :meth:`find_intersection`.
+
+        Returns:
+            RecordedBlockSource: The source replaying the responses.
+        """
+        with open(path) as f:
+            return cls([json.loads(line) for line in f if line.strip()], tip)
+
+    def find_intersection(
+        self, points: List[ChainPoint]
+    ) -> Tuple[ChainPoint, ChainTip]:
+        return (points[0] if points else Origin()), self._tip
+
+    def next_block(
+        self,
+    ) -> Optional[Tuple[Direction, ChainTip, Union[Block, ChainPoint]]]:
+        if self._position >= len(self._steps):
+            return None
+        self._position += 1
+        return self._steps[self._position - 1]
+
+
+@dataclass
+class _AppliedBlock:
+    """Changes made to the index by a block, to undo them on rollback."""
+
+    point: Point
+
+    added: List[TransactionInput] = field(default_factory=list)
+
+    removed: List[UTxO] = field(default_factory=list)
+
+
+def _slot(point: Union[ChainPoint, ChainTip]) -> int:
+    return -1 if isinstance(point, Origin) else point.slot
+
+
+class UTxOIndexChainContext(_OgmiosV6Results, ChainContext):
+    """Serves the UTxOs of watched addresses from an index kept current by following the chain.
+
+    The index is loaded from `context` at the chain tip by :meth:`bootstrap`, then kept current by applying the
+    blocks of `source`, either one at a time with :meth:`step`, or in a background thread started by :meth:`start`.
+    Until the index is loaded, and for addresses that aren't watched, queries are delegated to `context`, as are
+    all the queries but UTxOs.
+
+    UTxOs are only known from the blocks the index applied for addresses that are watched through their credentials
+    only, since a context can't look up the UTxOs of a credential. Watching credentials is meant for addresses that
+    aren't used yet, e.g. addresses derived on demand by a wallet.
+
+    `context` should not lag behind `source`: UTxOs created in blocks the context hasn't seen yet, when the index is
+    loaded, are missed.
+
+    Args:
+        context (ChainContext): Context the index is loaded from, and queries are delegated to.
+        source (BlockSource): Blocks to follow the chain with.
+        addresses (Iterable[Union[str, Address]]): Watched addresses.
+        credentials (Iterable[Union[VerificationKeyHash, ScriptHash]]): Watched payment or staking credentials:
+            outputs to any address with one of them are indexed.
+        max_rollback (int): Number of most recent blocks that can be rolled back. The index is loaded again when the
+            chain rolls back further.
+    """
+
+    def __init__(
+        self,
+        context: ChainContext,
+        source: BlockSource,
+        addresses: Iterable[Union[str, Address]] = (),
+        credentials: Iterable[Union[VerificationKeyHash, ScriptHash]] = (),
+        max_rollback: int = 2160,
+    ):
+        self._context = context
+        self._source = source
+        self._addresses: Set[str] = {
+            str(
+                address
+                if isinstance(address, Address)
+                else Address.from_primitive(address)
+            )
+            for address in addresses
+        }
+        self._credentials = set(credentials)
+        self.max_rollback = max_rollback
+
+        self._lock = threading.RLock()
+        self._point: Optional[ChainPoint] = None
+        self._tip: Optional[ChainTip] = None
+        self._index: Dict[str, Dict[TransactionInput, UTxO]] = {}
+        self._owners: Dict[TransactionInput, str] = {}
+        self._applied: Deque[_AppliedBlock] = deque()
+        self._oldest_slot = -1
+
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def wrapped_context(self) -> ChainContext:
+        """The context the index is loaded from."""
+        return self._context
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index is loaded, and serves the UTxOs of watched addresses."""
+        return self._point is not None
+
+    @property
+    def synced(self) -> bool:
+        """Whether the index has applied all the blocks up to the chain tip."""
+        with self._lock:
+            return (
+                self._point is not None
+                and self._tip is not None
+                and _slot(self._point) >= _slot(self._tip)
+            )
+
+    def _watches(self, address: str) -> bool:
+        if address in self._addresses:
+            return True
+        if not self._credentials or not address.startswith("addr"):
+            return False
+        parsed = Address.from_primitive(address)
+        return (
+            parsed.payment_part in self._credentials
+            or parsed.staking_part in self._credentials
+        )
+
+    def _add(self, owner: str, utxo: UTxO) -> bool:
+        if utxo.input in self._owners:
+            return False
+        self._index.setdefault(owner, {})[utxo.input] = utxo
+        self._owners[utxo.input] = owner
+        return True
+
+    def _remove(self, tx_in: TransactionInput) -> Optional[UTxO]:
+        owner = self._owners.pop(tx_in, None)
+        if owner is None:
+            return None
+        utxos = self._index[owner]
+        utxo = utxos.pop(tx_in)
+        if not utxos and owner not in self._addresses:
+            del self._index[owner]
+        return utxo
+
+    def bootstrap(self):
+        """Load the UTxOs of the watched addresses from the wrapped context, and move the source to the chain tip."""
+        _, tip = self._source.find_intersection([Origin()])
+        start = Point(tip.slot, tip.id) if isinstance(tip, Tip) else Origin()
+        point, tip = self._source.find_intersection([start])
+        addresses = sorted(self._addresses)
+        utxos = self._context.utxos_many(addresses) if addresses else []
+
+        with self._lock:
+            self._index = {address: {} for address in addresses}
+            self._owners = {}
+            for utxo in utxos:
+                self._add(str(utxo.output.address), utxo)
+            self._applied.clear()
+            self._oldest_slot = _slot(point)
+            self._point = point
+            self._tip = tip
+
+    def _outputs(self, tx: dict) -> Iterable[Tuple[int, dict]]:
+        if tx.get("spends") == "collaterals":
+            # Phase-2 validation failed: only the collateral return, if any, is created, after the regular outputs.
+            if tx.get("collateralReturn"):
+                return [(len(tx.get("outputs", [])), tx["collateralReturn"])]
+            return []
+        return enumerate(tx.get("outputs", []))
+
+    def _apply_block(self, block: Block):
+        applied = _AppliedBlock(block.to_point())
+        for tx in block.transactions or []:
+            spent = tx.get(
+                "collaterals" if tx.get("spends") == "collaterals" else "inputs"
+            )
+            for ref in spent or []:
+                tx_in = TransactionInput.from_primitive(
+                    [ref["transaction"]["id"], ref["index"]]
+                )
+                utxo = self._remove(tx_in)
+                if utxo is not None:
+                    applied.removed.append(utxo)
+            for index, output in self._outputs(tx):
+                owner = output["address"]
+                if not self._watches(owner):
+                    continue
+                utxo = self._utxo_from_ogmios_result(
+                    OgmiosUtxo(
+                        tx["id"],
+                        index,
+                        owner,
+                        output["value"],
+                        output.get("datumHash"),
+                        output.get("datum"),
+                        output.get("script"),
+                    )
+                )
+                if self._add(owner, utxo):
+                    applied.added.append(utxo.input)
+
+        self._applied.append(applied)
+        if len(self._applied) > self.max_rollback:
+            self._oldest_slot = self._applied.popleft().point.slot
+        self._point = applied.point
+
+    def _roll_back(self, point: ChainPoint) -> bool:
+        slot = _slot(point)
+        if slot < self._oldest_slot:
+            return False
+        while self._applied and self._applied[-1].point.slot > slot:
+            applied = self._applied.pop()
+            for tx_in in applied.added:
+                self._remove(tx_in)
+            for utxo in applied.removed:
+                self._add(str(utxo.output.address), utxo)
+        self._point = point
+        return True
+
+    def step(self) -> bool:
+        """Apply the next step of the source to the index, waiting for it if the index is at the chain tip.
+
+        The index is loaded first if it isn't yet.
+
+        Returns:
+            bool: False when the source has ended, True otherwise.
+        """
+        if self._point is None:
+            self.bootstrap()
+        next_block = self._source.next_block()
+        if next_block is None:
+            return False
+        direction, tip, block = next_block
+
+        with self._lock:
+            self._tip = tip
+            if direction == Direction.forward:
+                self._apply_block(block)
+                return True
+            if self._roll_back(block):
+                return True
+
+        logger.warning(
+            f"Rollback to {block} is deeper than {self.max_rollback} blocks, loading the UTxO index again."
+        )
+        self.bootstrap()
+        return True
+
+    def follow(self):
+        """Apply the steps of the source until it ends, or until the background thread is stopped."""
+        while not self._stopped.is_set():
+            if not self.step():
+                return
+
+    def start(self, retry_interval: float = 5):
+        """Load the index, then keep it current in a background thread.
+
+        When following the chain fails, queries are delegated to the wrapped context until the index is loaded again.
+
+        Args:
+            retry_interval (float): Seconds to wait for before loading the index again, after following the chain
+                failed.
+        """
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        if self._point is None:
+            self.bootstrap()
+
+        def run():
+            while not self._stopped.is_set():
+                try:
+                    self.follow()
+                    return
+                except Exception as e:
+                    logger.error(f"Following the chain failed: {e}")
+                    with self._lock:
+                        self._point = None
+                    if self._stopped.wait(retry_interval):
+                        return
+
+        self._thread = threading.Thread(
+            target=run, name="UTxOIndexChainContext", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread after the step it is waiting for."""
+        self._stopped.set()
+        self._thread = None
+
+    def close(self):
+        """Stop the background thread and close the source."""
+        self.stop()
+        self._source.close()
+
+    @property
+    def network(self) -> Network:
+        return self._context.network
+
+    @property
+    def epoch(self) -> int:
+        return self._context.epoch
+
+    @property
+    def last_block_slot(self) -> int:
+        with self._lock:
+            point = self._point
+        if point is None:
+            return self._context.last_block_slot
+        return max(_slot(point), 0)
+
+    @property
+    def protocol_param(self) -> ProtocolParameters:
+        return self._context.protocol_param
+
+    @property
+    def genesis_param(self) -> GenesisParameters:
+        return self._context.genesis_param
+
+    def _utxos(self, address: str) -> List[UTxO]:
+        with self._lock:
+            if self._point is not None:
+                utxos = self._index.get(address)
+                if utxos is not None:
+                    return list(utxos.values())
+                if self._watches(address):
+                    return []
+        return self._context.utxos(address)
+
+    def submit_tx_cbor(self, cbor: Union[bytes, str]):
+        return self._context.submit_tx_cbor(cbor)
+
+    def evaluate_tx_cbor(self, cbor: Union[bytes, str]) -> Dict[str, ExecutionUnits]:
+        return self._context.evaluate_tx_cbor(cbor)
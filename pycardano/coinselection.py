@@ -2,9 +2,10 @@
 This module contains algorithms that select UTxOs from a parent list to satisfy some output constraints.
 """
 
+import heapq
 import random
-from copy import deepcopy
-from typing import Iterable, List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from pycardano.address import Address
 from pycardano.backend.base import ChainContext
@@ -14,16 +15,305 @@ from pycardano.exception import (
     MaxInputCountExceededException,
     UTxOSelectionException,
 )
-from pycardano.transaction import TransactionOutput, UTxO, Value
+from pycardano.hash import ScriptHash
+from pycardano.transaction import (
+    Asset,
+    AssetName,
+    MultiAsset,
+    TransactionInput,
+    TransactionOutput,
+    UTxO,
+    Value,
+)
 from pycardano.utils import max_tx_fee, min_lovelace_post_alonzo
 
-__all__ = ["UTxOSelector", "LargestFirstSelector", "RandomImproveMultiAsset"]
+__all__ = [
+    "UTxOPool",
+    "UTxOSelector",
+    "LargestFirstSelector",
+    "RandomImproveMultiAsset",
+]
 
 _FAKE_ADDR = Address.from_primitive(
     "addr1q8m9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwta8k2v59pcduem5uw253zwke30x9mwes62kfvqnzg38kuh6q966kg7"
 )
 
 
+class UTxOPool:
+    """An indexed, mutable collection of UTxOs that coin selectors can draw from.
+
+    The pool keeps UTxOs in insertion order and supports positional access like a list, but every operation
+    selectors rely on runs in O(log n): indexing and popping by position, popping the UTxO with the most lovelace,
+    adding and removing UTxOs, and membership tests (by transaction input). The total value held by the pool and an
+    index of UTxOs by native asset are maintained incrementally, so a wallet can keep one pool around and update it
+    as UTxOs are spent or received instead of rebuilding it for every transaction.
+
+    Selectors never spend from a pool they are given: every UTxO taken out during selection is put back in its
+    original position before :meth:`UTxOSelector.select` returns.
+
+    Args:
+        utxos (Iterable[UTxO]): Initial UTxOs of the pool. UTxOs sharing a transaction input with one already in
+            the pool are ignored.
+    """
+
+    def __init__(self, utxos: Iterable[UTxO] = ()):
+        self._journals: List[List[int]] = []
+        self._reset(utxos)
+
+    def _reset(self, utxos: Iterable[UTxO]):
+        self._slots: List[UTxO] = []
+        self._present = bytearray()
+        # Fenwick tree over presence flags (1-based), used to map positions to slots.
+        self._tree: List[int] = [0]
+        self._size = 0
+        self._seqs: Dict[TransactionInput, int] = {}
+        self._largest: List[Tuple[int, int]] = []
+        # Whether the heap holds an entry for a slot, so restoring a UTxO doesn't push a duplicate entry.
+        self._in_heap = bytearray()
+        self._by_asset: Dict[Tuple[ScriptHash, AssetName], Set[int]] = {}
+        self._coin = 0
+        self._assets: Dict[Tuple[ScriptHash, AssetName], int] = {}
+
+        for utxo in utxos:
+            if utxo.input in self._seqs:
+                continue
+            seq = len(self._slots)
+            self._slots.append(utxo)
+            self._present.append(1)
+            self._tree.append(1)
+            self._seqs[utxo.input] = seq
+            self._largest.append((-utxo.output.lovelace, -seq))
+            self._in_heap.append(1)
+            self._index(seq, 1)
+        tree = self._tree
+        for i in range(1, len(tree)):
+            j = i + (i & -i)
+            if j < len(tree):
+                tree[j] += tree[i]
+        heapq.heapify(self._largest)
+        self._size = len(self._slots)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[UTxO]:
+        present = self._present
+        return (u for seq, u in enumerate(self._slots) if present[seq])
+
+    def __contains__(self, utxo: object) -> bool:
+        return isinstance(utxo, UTxO) and self._seq_of(utxo) is not None
+
+    def __getitem__(self, index: int) -> UTxO:
+        return self._slots[self._locate(index)]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)})"
+
+    @property
+    def total(self) -> Value:
+        """Value: Sum of the values of all UTxOs in the pool."""
+        multi_asset = MultiAsset()
+        for (policy_id, asset_name), amount in self._assets.items():
+            if amount:
+                multi_asset.setdefault(policy_id, Asset())[asset_name] = amount
+        return Value(self._coin, multi_asset)
+
+    def add(self, utxo: UTxO):
+        """Add a UTxO to the end of the pool. Adding a UTxO already in the pool has no effect.
+
+        Args:
+            utxo (UTxO): UTxO to add.
+        """
+        if utxo.input in self._seqs:
+            return
+        seq = len(self._slots)
+        self._slots.append(utxo)
+        self._present.append(1)
+        # The new tree node covers itself plus the slots in (seq + 1 - lowbit, seq].
+        node = seq + 1
+        self._tree.append(1 + self._prefix(seq) - self._prefix(node - (node & -node)))
+        self._size += 1
+        self._seqs[utxo.input] = seq
+        heapq.heappush(self._largest, (-utxo.output.lovelace, -seq))
+        self._in_heap.append(1)
+        self._index(seq, 1)
+
+    def remove(self, utxo: UTxO):
+        """Remove a UTxO from the pool, e.g. once it is spent.
+
+        Args:
+            utxo (UTxO): UTxO to remove.
+
+        Raises:
+            KeyError: When the UTxO is not in the pool.
+        """
+        seq = self._seq_of(utxo)
+        if seq is None:
+            raise KeyError(utxo)
+        self._take(seq)
+
+    def discard(self, utxo: UTxO):
+        """Remove a UTxO from the pool if it is present.
+
+        Args:
+            utxo (UTxO): UTxO to remove.
+        """
+        seq = self._seq_of(utxo)
+        if seq is not None:
+            self._take(seq)
+
+    def pop(self, index: int = -1) -> UTxO:
+        """Remove and return the UTxO at a position, shifting later UTxOs down like :meth:`list.pop`.
+
+        Args:
+            index (int): Position of the UTxO. Defaults to the last one.
+
+        Returns:
+            UTxO: The removed UTxO.
+        """
+        seq = self._locate(index)
+        utxo = self._slots[seq]
+        self._take(seq)
+        return utxo
+
+    def pop_largest(self) -> UTxO:
+        """Remove and return the UTxO holding the most lovelace. Ties are broken in favor of the most recently added.
+
+        Returns:
+            UTxO: The removed UTxO.
+
+        Raises:
+            IndexError: When the pool is empty.
+        """
+        heap = self._largest
+        while heap:
+            seq = -heapq.heappop(heap)[1]
+            self._in_heap[seq] = 0
+            if self._present[seq]:
+                utxo = self._slots[seq]
+                self._take(seq)
+                return utxo
+        raise IndexError("pop from empty UTxOPool")
+
+    def utxos_with_asset(
+        self, policy_id: ScriptHash, asset_name: AssetName
+    ) -> List[UTxO]:
+        """UTxOs in the pool holding a native asset.
+
+        Args:
+            policy_id (ScriptHash): Policy ID of the asset.
+            asset_name (AssetName): Name of the asset.
+
+        Returns:
+            List[UTxO]: Matching UTxOs, in pool order.
+        """
+        seqs = self._by_asset.get((policy_id, asset_name), ())
+        return [self._slots[seq] for seq in sorted(seqs)]
+
+    def copy(self) -> "UTxOPool":
+        """Create an independent pool with the same UTxOs in the same order.
+
+        Returns:
+            UTxOPool: The copy.
+        """
+        return self.__class__(self)
+
+    def _seq_of(self, utxo: UTxO) -> Optional[int]:
+        seq = self._seqs.get(utxo.input)
+        if seq is None or not self._present[seq]:
+            return None
+        return seq
+
+    def _prefix(self, end: int) -> int:
+        """Number of present UTxOs among the first `end` slots."""
+        tree = self._tree
+        total = 0
+        while end > 0:
+            total += tree[end]
+            end -= end & -end
+        return total
+
+    def _update(self, seq: int, delta: int):
+        tree = self._tree
+        node = seq + 1
+        while node < len(tree):
+            tree[node] += delta
+            node += node & -node
+
+    def _locate(self, index: int) -> int:
+        """Find the slot of the `index`-th present UTxO."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("UTxOPool index out of range")
+        tree = self._tree
+        node = 0
+        rank = index + 1
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = node + step
+            if nxt < len(tree) and tree[nxt] < rank:
+                node = nxt
+                rank -= tree[nxt]
+            step >>= 1
+        return node
+
+    def _index(self, seq: int, sign: int):
+        output = self._slots[seq].output
+        self._coin += sign * output.lovelace
+        if isinstance(output.amount, Value):
+            for policy_id, assets in output.amount.multi_asset.items():
+                for asset_name, amount in assets.items():
+                    key = (policy_id, asset_name)
+                    self._assets[key] = self._assets.get(key, 0) + sign * amount
+                    if sign > 0:
+                        self._by_asset.setdefault(key, set()).add(seq)
+                    else:
+                        self._by_asset[key].discard(seq)
+
+    def _take(self, seq: int):
+        self._present[seq] = 0
+        self._update(seq, -1)
+        self._size -= 1
+        self._index(seq, -1)
+        if self._journals:
+            self._journals[-1].append(seq)
+        else:
+            del self._seqs[self._slots[seq].input]
+            self._maybe_compact()
+
+    def _restore(self, seq: int):
+        self._present[seq] = 1
+        self._update(seq, 1)
+        self._size += 1
+        self._index(seq, 1)
+        if not self._in_heap[seq]:
+            heapq.heappush(self._largest, (-self._slots[seq].output.lovelace, -seq))
+            self._in_heap[seq] = 1
+
+    def _maybe_compact(self):
+        # Drop slots of removed UTxOs once they outnumber the live ones, keeping removal amortized O(log n).
+        if len(self._slots) > 32 and self._size * 2 < len(self._slots):
+            self._reset(list(self))
+
+    @contextmanager
+    def _restoring(self):
+        """Put back every UTxO taken out of the pool within this block, at its original position."""
+        journal: List[int] = []
+        self._journals.append(journal)
+        try:
+            yield
+        finally:
+            self._journals.pop()
+            for seq in journal:
+                if not self._present[seq]:
+                    self._restore(seq)
+
+
+def _as_pool(utxos: Union[List[UTxO], UTxOPool]) -> UTxOPool:
+    return utxos if isinstance(utxos, UTxOPool) else UTxOPool(utxos)
+
+
 class UTxOSelector:
     """UTxOSelector defines an interface through which a subset of UTxOs should be selected from a parent set
     with a selection strategy and given constraints.
@@ -31,7 +321,7 @@ class UTxOSelector:
 
     def select(
         self,
-        utxos: List[UTxO],
+        utxos: Union[List[UTxO], UTxOPool],
         outputs: List[TransactionOutput],
         context: ChainContext,
         max_input_count: Optional[int] = None,
@@ -43,7 +333,8 @@ class UTxOSelector:
         is equal to or larger than the sum of a set of outputs.
 
         Args:
-            utxos (List[UTxO]): A list of UTxO to select from.
+            utxos (Union[List[UTxO], UTxOPool]): A list or a pool of UTxO to select from. A pool is left unchanged
+                after selection, which makes it cheap to reuse across transactions.
             outputs (List[TransactionOutput]): A list of transaction outputs which the selected set should satisfy.
             context (ChainContext): A chain context where protocol parameters could be retrieved.
             max_input_count (int): Max number of input UTxOs to select.
@@ -80,7 +371,7 @@ class LargestFirstSelector(UTxOSelector):
 
     def select(
         self,
-        utxos: List[UTxO],
+        utxos: Union[List[UTxO], UTxOPool],
         outputs: List[TransactionOutput],
         context: ChainContext,
         max_input_count: Optional[int] = None,
@@ -88,19 +379,53 @@ class LargestFirstSelector(UTxOSelector):
         respect_min_utxo: Optional[bool] = True,
         existing_amount: Optional[Value] = None,
     ) -> Tuple[List[UTxO], Value]:
-        available: List[UTxO] = sorted(utxos, key=lambda utxo: utxo.output.lovelace)
+        if isinstance(utxos, UTxOPool):
+            with utxos._restoring():
+                return self._select(
+                    utxos,
+                    outputs,
+                    context,
+                    max_input_count,
+                    include_max_fee,
+                    respect_min_utxo,
+                    existing_amount,
+                )
+        return self._select(
+            UTxOPool(utxos),
+            outputs,
+            context,
+            max_input_count,
+            include_max_fee,
+            respect_min_utxo,
+            existing_amount,
+        )
+
+    def _select(
+        self,
+        available: UTxOPool,
+        outputs: List[TransactionOutput],
+        context: ChainContext,
+        max_input_count: Optional[int],
+        include_max_fee: Optional[bool],
+        respect_min_utxo: Optional[bool],
+        existing_amount: Optional[Value],
+    ) -> Tuple[List[UTxO], Value]:
         max_fee = max_tx_fee(context) if include_max_fee else 0
-        total_requested = Value(max_fee)
-        for o in outputs:
-            total_requested += o.amount
+        total_requested = Value.sum([max_fee] + [o.amount for o in outputs])
 
         selected = []
         selected_amount = existing_amount if existing_amount is not None else Value()
 
+        if not max_input_count and not total_requested <= (
+            selected_amount + available.total
+        ):
+            # Selection would drain the pool and still fall short.
+            raise InsufficientUTxOBalanceException("UTxO Balance insufficient!")
+
         while not total_requested <= selected_amount:
             if not available:
                 raise InsufficientUTxOBalanceException("UTxO Balance insufficient!")
-            to_add = available.pop()
+            to_add = available.pop_largest()
             selected.append(to_add)
             selected_amount += to_add.output.amount
             if max_input_count and len(selected) > max_input_count:
@@ -111,7 +436,7 @@ class LargestFirstSelector(UTxOSelector):
         if respect_min_utxo:
             change = selected_amount - total_requested
             min_change_amount = min_lovelace_post_alonzo(
-                TransactionOutput(_FAKE_ADDR, deepcopy(change)), context
+                TransactionOutput(_FAKE_ADDR, change), context
             )
             if change.coin < min_change_amount:
                 additional, _ = self.select(
@@ -153,7 +478,7 @@ class RandomImproveMultiAsset(UTxOSelector):
     def __init__(self, random_generator: Optional[Iterable[int]] = None):
         self.random_generator = iter(random_generator) if random_generator else None
 
-    def _get_next_random(self, utxos: List[UTxO]) -> Tuple[int, UTxO]:
+    def _get_next_random(self, utxos: UTxOPool) -> Tuple[int, UTxO]:
         if not utxos:
             raise InputUTxODepletedException("Input UTxOs depleted!")
         if self.random_generator:
@@ -169,7 +494,7 @@ class RandomImproveMultiAsset(UTxOSelector):
     def _random_select_subset(
         self,
         amount: Value,
-        remaining: List[UTxO],
+        remaining: UTxOPool,
         selected: List[UTxO],
         selected_amount: Value,
     ):
@@ -210,63 +535,69 @@ class RandomImproveMultiAsset(UTxOSelector):
         else:
             return list(list(value.multi_asset.values())[0].values())[0]
 
+    @staticmethod
+    def _single_asset_amount(a: Value, b: Value) -> int:
+        """The first argument contains only one asset. Find the amount of the same asset in the second argument"""
+        if a.coin:
+            return b.coin
+        else:
+            policy_id = next(iter(a.multi_asset))
+            asset_name = next(iter(a.multi_asset[policy_id]))
+            assets = b.multi_asset.get(policy_id)
+            return assets.get(asset_name, 0) if assets else 0
+
     @staticmethod
     def _find_diff_by_former(a: Value, b: Value) -> int:
         """The first argument contains only one asset. Find the absolute difference between this asset and
         the corresponding value of the same asset in the second argument"""
-        if a.coin:
-            return a.coin - b.coin
-        else:
-            policy_id = list(a.multi_asset.keys())[0]
-            asset_name = list(a.multi_asset[policy_id].keys())[0]
-            return a.multi_asset[policy_id].get(asset_name, 0) - b.multi_asset[
-                policy_id
-            ].get(asset_name, 0)
+        return RandomImproveMultiAsset._single_asset_amount(
+            a, a
+        ) - RandomImproveMultiAsset._single_asset_amount(a, b)
 
     def _improve(
         self,
         selected: List[UTxO],
         selected_amount: Value,
-        remaining: List[UTxO],
+        remaining: UTxOPool,
         ideal: Value,
         upper_bound: Value,
         max_input_count: Optional[int] = None,
     ):
-        if not remaining or self._find_diff_by_former(ideal, selected_amount) <= 0:
-            # In case where there is no remaining UTxOs or we already selected more than ideal,
-            # we cannot improve by randomly adding more UTxOs, therefore return immediate.
-            return
-        if max_input_count is not None and len(selected) > max_input_count:
-            raise MaxInputCountExceededException(
-                f"Max input count: {max_input_count} exceeded!"
-            )
-
-        i, to_add = self._get_next_random(remaining)
-        if (
-            abs(
-                self._find_diff_by_former(ideal, selected_amount + to_add.output.amount)
-            )
-            < abs(self._find_diff_by_former(ideal, selected_amount))
-            and self._find_diff_by_former(
-                upper_bound, selected_amount + to_add.output.amount
-            )
-            >= 0
-        ):
-            selected.append(to_add)
-            selected_amount += to_add.output.amount
+        ideal_amount = self._single_asset_amount(ideal, ideal)
+        upper_amount = self._single_asset_amount(upper_bound, upper_bound)
+        current = self._single_asset_amount(ideal, selected_amount)
+        improved = []
+        try:
+            # Candidates are drawn without replacement; the ones that are not kept go back to the pool afterwards.
+            with remaining._restoring():
+                # In case where there is no remaining UTxOs or we already selected more than ideal,
+                # we cannot improve by randomly adding more UTxOs, therefore stop.
+                while remaining and ideal_amount - current > 0:
+                    if max_input_count is not None and len(selected) > max_input_count:
+                        raise MaxInputCountExceededException(
+                            f"Max input count: {max_input_count} exceeded!"
+                        )
 
-        self._improve(
-            selected,
-            selected_amount,
-            remaining[:i] + remaining[i + 1 :],
-            ideal,
-            upper_bound,
-            max_input_count,
-        )
+                    i, to_add = self._get_next_random(remaining)
+                    remaining.pop(i)
+                    candidate = current + self._single_asset_amount(
+                        ideal, to_add.output.amount
+                    )
+                    if (
+                        abs(ideal_amount - candidate) < abs(ideal_amount - current)
+                        and upper_amount - candidate >= 0
+                    ):
+                        selected.append(to_add)
+                        selected_amount += to_add.output.amount
+                        improved.append(to_add)
+                        current = candidate
+        finally:
+            for utxo in improved:
+                remaining.remove(utxo)
 
     def select(
         self,
-        utxos: List[UTxO],
+        utxos: Union[List[UTxO], UTxOPool],
         outputs: List[TransactionOutput],
         context: ChainContext,
         max_input_count: Optional[int] = None,
@@ -274,12 +605,39 @@ class RandomImproveMultiAsset(UTxOSelector):
         respect_min_utxo: Optional[bool] = True,
         existing_amount: Optional[Value] = None,
     ) -> Tuple[List[UTxO], Value]:
-        # Shallow copy the list
-        remaining = list(utxos)
+        if isinstance(utxos, UTxOPool):
+            with utxos._restoring():
+                return self._select(
+                    utxos,
+                    outputs,
+                    context,
+                    max_input_count,
+                    include_max_fee,
+                    respect_min_utxo,
+                    existing_amount,
+                )
+        return self._select(
+            UTxOPool(utxos),
+            outputs,
+            context,
+            max_input_count,
+            include_max_fee,
+            respect_min_utxo,
+            existing_amount,
+        )
+
+    def _select(
+        self,
+        remaining: UTxOPool,
+        outputs: List[TransactionOutput],
+        context: ChainContext,
+        max_input_count: Optional[int],
+        include_max_fee: Optional[bool],
+        respect_min_utxo: Optional[bool],
+        existing_amount: Optional[Value],
+    ) -> Tuple[List[UTxO], Value]:
         max_fee = max_tx_fee(context) if include_max_fee else 0
-        request_sum = Value(max_fee)
-        for o in outputs:
-            request_sum += o.amount
+        request_sum = Value.sum([max_fee] + [o.amount for o in outputs])
 
         assets = self._split_by_asset(request_sum)
 
@@ -289,6 +647,14 @@ class RandomImproveMultiAsset(UTxOSelector):
         selected: List[UTxO] = []
         selected_amount = existing_amount if existing_amount is not None else Value()
 
+        if (
+            not max_input_count
+            and self.random_generator is None
+            and not request_sum <= selected_amount + remaining.total
+        ):
+            # Random selection would drain the pool and still fall short.
+            raise InputUTxODepletedException("Input UTxOs depleted!")
+
         for r in request_sorted:
             self._random_select_subset(r, remaining, selected, selected_amount)
             if max_input_count and len(selected) > max_input_count:
@@ -300,25 +666,22 @@ class RandomImproveMultiAsset(UTxOSelector):
         for request in reversed(request_sorted):
             ideal = request + request
             upper_bound = ideal + request
-            num_selected_before = len(selected)
             try:
                 self._improve(
                     selected,
                     selected_amount,
-                    list(remaining),
+                    remaining,
                     ideal,
                     upper_bound,
                     max_input_count,
                 )
             except UTxOSelectionException:
                 pass
-            new_selected = selected[num_selected_before:]
-            remaining = [utxo for utxo in remaining if utxo not in new_selected]
 
         if respect_min_utxo:
             change = selected_amount - request_sum
             min_change_amount = min_lovelace_post_alonzo(
-                TransactionOutput(_FAKE_ADDR, deepcopy(change)), context
+                TransactionOutput(_FAKE_ADDR, change), context
             )
 
             if change.coin < min_change_amount:
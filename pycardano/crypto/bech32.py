@@ -19,9 +19,17 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-"""Reference implementation for Bech32/Bech32m and segwit addresses."""
+"""Reference implementation for Bech32/Bech32m and segwit addresses.
 
+The checksum is computed two characters at a time with a lookup table indexed by the top ten bits of the checksum
+state, and conversion between 8-bit bytes and 5-bit groups is delegated to :func:`base64.b32encode`,
+:meth:`bytes.translate` and :class:`int`, which is what makes encoding and decoding large numbers of addresses cheap.
+"""
+
+import base64
 from enum import Enum
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
 
 
 class Encoding(Enum):
@@ -34,17 +42,57 @@ class Encoding(Enum):
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 BECH32M_CONST = 0x2BC830A3
 
+_GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+
+def _polymod_step(chk, value):
+    top = chk >> 25
+    chk = (chk & 0x1FFFFFF) << 5 ^ value
+    for i in range(5):
+        chk ^= _GENERATOR[i] if ((top >> i) & 1) else 0
+    return chk
+
+
+# Checksum steps are linear, so two steps on state `chk` with values `a`, `b` are
+# `(chk & 0xFFFFF) << 10 ^ a << 5 ^ b ^ _GENERATOR_TABLE[chk >> 20]`, where the table holds two steps with zero
+# values applied to each possible top ten bits of the state.
+_GENERATOR_TABLE = tuple(
+    _polymod_step(_polymod_step(top << 20, 0), 0) for top in range(1024)
+)
+
+_MAX_LENGTH = 108
+
+_B32_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+_B32_DIGITS = b"0123456789abcdefghijklmnopqrstuv"
+_VALUES = bytes(range(32))
+
+# Maps the base32 alphabet of base64.b32encode to 5-bit values
+_B32_TO_VALUES = bytes.maketrans(_B32_ALPHABET, _VALUES)
+# Maps 5-bit values to bech32 characters
+_VALUES_TO_CHARSET = bytes.maketrans(_VALUES, CHARSET.encode())
+# Maps 5-bit values to digits of int(..., 32)
+_VALUES_TO_DIGITS = bytes.maketrans(_VALUES, _B32_DIGITS)
+# Maps bech32 characters to 5-bit values, and anything else to 0xFF
+_CHARSET_TO_VALUES = bytes(
+    CHARSET.find(chr(c)) if chr(c) in CHARSET else 0xFF for c in range(256)
+)
+
+
+def _polymod(values, chk):
+    table = _GENERATOR_TABLE
+    it = iter(values)
+    for a, b in zip(it, it):
+        chk = ((chk & 0xFFFFF) << 10 ^ a << 5 ^ b) ^ table[chk >> 20]
+    if len(values) & 1:
+        chk = _polymod_step(chk, values[-1])
+    return chk
+
 
 def bech32_polymod(values):
     """Internal function that computes the Bech32 checksum."""
-    generator = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
-    chk = 1
-    for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1FFFFFF) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
-    return chk
+    if not isinstance(values, (list, tuple, bytes, bytearray)):
+        values = list(values)
+    return _polymod(values, 1)
 
 
 def bech32_hrp_expand(hrp):
@@ -52,9 +100,15 @@ def bech32_hrp_expand(hrp):
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
+@lru_cache(maxsize=64)
+def _hrp_polymod(hrp):
+    """Checksum state after the expanded HRP, shared by all strings with the same HRP."""
+    return _polymod(bech32_hrp_expand(hrp), 1)
+
+
 def bech32_verify_checksum(hrp, data):
     """Verify a checksum given HRP and converted data characters."""
-    const = bech32_polymod(bech32_hrp_expand(hrp) + data)
+    const = _polymod(data, _hrp_polymod(hrp))
     if const == 1:
         return Encoding.BECH32
     if const == BECH32M_CONST:
@@ -64,40 +118,80 @@ def bech32_verify_checksum(hrp, data):
 
 def bech32_create_checksum(hrp, data, spec):
     """Compute the checksum values given HRP and data."""
-    values = bech32_hrp_expand(hrp) + data
+    if not isinstance(data, (list, tuple, bytes, bytearray)):
+        data = list(data)
     const = BECH32M_CONST if spec == Encoding.BECH32M else 1
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ const
+    polymod = _polymod((0, 0, 0, 0, 0, 0), _polymod(data, _hrp_polymod(hrp))) ^ const
     return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
 
 
 def bech32_encode(hrp, data, spec):
     """Compute a Bech32 string given HRP and data values."""
-    combined = data + bech32_create_checksum(hrp, data, spec)
-    return hrp + "1" + "".join([CHARSET[d] for d in combined])
+    data = bytes(data)
+    combined = data + bytes(bech32_create_checksum(hrp, data, spec))
+    return hrp + "1" + combined.translate(_VALUES_TO_CHARSET).decode()
 
 
-def bech32_decode(bech):
-    """Validate a Bech32/Bech32m string, and determine HRP and data."""
-    if (any(ord(x) < 33 or ord(x) > 126 for x in bech)) or (
-        bech.lower() != bech and bech.upper() != bech
+def _bech32_decode(bech):
+    """Validate a Bech32/Bech32m string. Returns HRP, 5-bit data values without the checksum, and encoding."""
+    # Printable ASCII, minus the space, is the [33, 126] range allowed by the spec.
+    if (
+        not (bech.isascii() and bech.isprintable())
+        or " " in bech
+        or (bech.lower() != bech and bech.upper() != bech)
     ):
         return (None, None, None)
     bech = bech.lower()
     pos = bech.rfind("1")
-    if pos < 1 or pos + 7 > len(bech) or len(bech) > 108:
+    if pos < 1 or pos + 7 > len(bech) or len(bech) > _MAX_LENGTH:
         return (None, None, None)
-    if not all(x in CHARSET for x in bech[pos + 1 :]):
+    data = bech[pos + 1 :].encode().translate(_CHARSET_TO_VALUES)
+    if b"\xff" in data:
         return (None, None, None)
     hrp = bech[:pos]
-    data = [CHARSET.find(x) for x in bech[pos + 1 :]]
     spec = bech32_verify_checksum(hrp, data)
     if spec is None:
         return (None, None, None)
     return (hrp, data[:-6], spec)
 
 
+def bech32_decode(bech):
+    """Validate a Bech32/Bech32m string, and determine HRP and data."""
+    hrp, data, spec = _bech32_decode(bech)
+    if data is None:
+        return (None, None, None)
+    return (hrp, list(data), spec)
+
+
+def _bytes_to_5bit(data) -> bytes:
+    """Convert bytes to 5-bit values, padding the last one with zero bits."""
+    return base64.b32encode(data).rstrip(b"=").translate(_B32_TO_VALUES)
+
+
+def _5bit_to_bytes(data) -> Optional[bytes]:
+    """Convert 5-bit values to bytes. Returns None if the padding bits are invalid."""
+    m = len(data)
+    n = 5 * m // 8
+    padding = 5 * m - 8 * n
+    if padding >= 5:
+        return None
+    if not m:
+        return b""
+    value = int(bytes(data).translate(_VALUES_TO_DIGITS), 32)
+    if value & ((1 << padding) - 1):
+        return None
+    return (value >> padding).to_bytes(n, "big")
+
+
 def convertbits(data, frombits, tobits, pad=True):
     """General power-of-2 base conversion."""
+    if frombits == 8 and tobits == 5 and pad and isinstance(data, (bytes, bytearray)):
+        return list(_bytes_to_5bit(data))
+    if frombits == 5 and tobits == 8 and not pad and data is not None:
+        data = list(data)
+        if all(0 <= value < 32 for value in data):
+            converted = _5bit_to_bytes(data)
+            return None if converted is None else list(converted)
     acc = 0
     bits = 0
     ret = []
@@ -119,18 +213,67 @@ def convertbits(data, frombits, tobits, pad=True):
     return ret
 
 
-def decode(addr):
-    """Decode a segwit address."""
-    _, data, _ = bech32_decode(addr)
-    decoded = convertbits(data, 5, 8, False)
-    if decoded is None or len(decoded) < 2 or len(decoded) > 108:
+def _decode(addr) -> Optional[bytes]:
+    """Decode a segwit address into bytes."""
+    _, data, _ = _bech32_decode(addr)
+    if data is None:
+        return None
+    decoded = _5bit_to_bytes(data)
+    if decoded is None or len(decoded) < 2 or len(decoded) > _MAX_LENGTH:
         return None
     return decoded
 
 
+def decode(addr):
+    """Decode a segwit address."""
+    decoded = _decode(addr)
+    return None if decoded is None else list(decoded)
+
+
 def encode(hrp, witprog):
     """Encode a segwit address."""
-    ret = bech32_encode(hrp, convertbits(witprog, 8, 5), 0)
-    if bech32_decode(ret) == (None, None, None):
+    if not hrp or not (hrp.isascii() and hrp.isprintable()) or " " in hrp:
         return None
-    return ret
+    if hrp.lower() != hrp:
+        # Would mix an upper case prefix with lower case data.
+        return None
+    if isinstance(witprog, (bytes, bytearray)):
+        data = _bytes_to_5bit(witprog)
+    else:
+        data = convertbits(witprog, 8, 5)
+    if data is None:
+        return None
+    # Same bound bech32_decode enforces, so every encoded string can be decoded back.
+    if len(hrp) + 1 + len(data) + 6 > _MAX_LENGTH:
+        return None
+    return bech32_encode(hrp, data, 0)
+
+
+def decode_many(addrs: Iterable[str]) -> List[Optional[List[int]]]:
+    """Decode several bech32 strings.
+
+    Args:
+        addrs (Iterable[str]): Bech32 strings.
+
+    Returns:
+        List[Optional[List[int]]]: Decoded bytes of each string, as :func:`decode` returns them, None for invalid
+        strings.
+    """
+    return [decode(addr) for addr in addrs]
+
+
+def encode_many(
+    hrp: Union[str, Iterable[str]], witprogs: Iterable[Union[bytes, bytearray]]
+) -> List[Optional[str]]:
+    """Encode several byte strings in bech32.
+
+    Args:
+        hrp (Union[str, Iterable[str]]): Human-readable prefix shared by all strings, or one per string.
+        witprogs (Iterable[Union[bytes, bytearray]]): Data to encode.
+
+    Returns:
+        List[Optional[str]]: Bech32 strings, None for data that cannot be encoded.
+    """
+    if isinstance(hrp, str):
+        return [encode(hrp, witprog) for witprog in witprogs]
+    return [encode(h, witprog) for h, witprog in zip(hrp, witprogs)]
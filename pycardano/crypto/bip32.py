@@ -9,16 +9,25 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import threading
 import unicodedata
 from binascii import hexlify, unhexlify
-from typing import Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from mnemonic import Mnemonic
 from nacl import bindings
 
+from pycardano.hash import VERIFICATION_KEY_HASH_SIZE, VerificationKeyHash
 from pycardano.logging import logger
 
-__all__ = ["BIP32ED25519PrivateKey", "BIP32ED25519PublicKey", "HDWallet"]
+__all__ = [
+    "BIP32ED25519PrivateKey",
+    "BIP32ED25519PublicKey",
+    "HDWallet",
+    "DerivedKeyRange",
+]
 
 
 SUPPORTED_MNEMONIC_LANGS = {
@@ -75,11 +84,183 @@ def _Fk(message, secret):
     return hmac.new(secret, message, hashlib.sha512).digest()
 
 
+def _derive_children(
+    xprivate_key: Optional[bytes],
+    public_key: bytes,
+    chain_code: bytes,
+    start: int,
+    count: int,
+) -> Tuple[bytes, bytes, Optional[bytes]]:
+    """Derive consecutive child keys of a node.
+
+    Follows the same steps as :meth:`HDWallet._derive_private_child_key_by_index` and
+    :meth:`HDWallet._derive_public_child_key_by_index`, but keys the two HMACs with the parent node only once and
+    packs the results into flat byte strings.
+
+    Args:
+        xprivate_key: 64 bytes parent private key, or None for public derivation.
+        public_key: 32 bytes parent public key.
+        chain_code: 32 bytes parent chain code.
+        start: First child index, hardened if >= 0x80000000.
+        count: Number of children.
+
+    Returns:
+        Concatenated public keys, chain codes and, for private derivation, private keys of the children.
+    """
+    assert 0 <= start and start + count <= 2**32
+    hardened = start >= 2**31
+    if hardened != (start + count > 2**31) and count > 0:
+        raise ValueError("A range of child keys cannot mix hardened and soft indexes")
+
+    if xprivate_key is None:
+        if hardened:
+            raise ValueError("Cannot derive hardened index with public key")
+        z_mac = hmac.new(chain_code, b"\x02" + public_key, hashlib.sha512)
+        c_mac = hmac.new(chain_code, b"\x03" + public_key, hashlib.sha512)
+    elif hardened:
+        z_mac = hmac.new(chain_code, b"\x00" + xprivate_key, hashlib.sha512)
+        c_mac = hmac.new(chain_code, b"\x01" + xprivate_key, hashlib.sha512)
+    else:
+        z_mac = hmac.new(chain_code, b"\x02" + public_key, hashlib.sha512)
+        c_mac = hmac.new(chain_code, b"\x03" + public_key, hashlib.sha512)
+
+    if xprivate_key is not None:
+        kLP = int.from_bytes(xprivate_key[:32], "little")
+        kRP = int.from_bytes(xprivate_key[32:], "little")
+
+    public_keys = bytearray()
+    chain_codes = bytearray()
+    xprivate_keys = bytearray() if xprivate_key is not None else None
+
+    for index in range(start, start + count):
+        i_bytes = index.to_bytes(4, "little")
+        z = z_mac.copy()
+        z.update(i_bytes)
+        Z = z.digest()
+        c = c_mac.copy()
+        c.update(i_bytes)
+        chain_codes += c.digest()[32:]
+
+        ZL = int.from_bytes(Z[:28], "little")
+        if xprivate_keys is None:
+            public_keys += bindings.crypto_core_ed25519_add(
+                public_key,
+                bindings.crypto_scalarmult_ed25519_base_noclamp(
+                    (8 * ZL).to_bytes(32, "little")
+                ),
+            )
+        else:
+            kL = (ZL * 8 + kLP).to_bytes(32, "little")
+            kR = ((int.from_bytes(Z[32:], "little") + kRP) % 2**256).to_bytes(
+                32, "little"
+            )
+            xprivate_keys += kL + kR
+            public_keys += bindings.crypto_scalarmult_ed25519_base_noclamp(kL)
+
+    return (
+        bytes(public_keys),
+        bytes(chain_codes),
+        bytes(xprivate_keys) if xprivate_keys is not None else None,
+    )
+
+
+class DerivedKeyRange:
+    """Keys of consecutive children of an HD wallet node, packed into flat byte strings.
+
+    Created by :meth:`HDWallet.derive_range`. Holding 100k keys this way takes a few megabytes, instead of one
+    :class:`HDWallet` per key.
+
+    Args:
+        path: Derivation path of the parent node.
+        start: Index of the first child, including the hardened offset if any.
+        public_keys: Concatenated 32 bytes public keys.
+        chain_codes: Concatenated 32 bytes chain codes.
+        xprivate_keys: Concatenated 64 bytes private keys, for private derivation.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        start: int,
+        public_keys: bytes,
+        chain_codes: bytes,
+        xprivate_keys: Optional[bytes] = None,
+    ):
+        self.path = path
+        self.start = start
+        self.public_keys = public_keys
+        self.chain_codes = chain_codes
+        self.xprivate_keys = xprivate_keys
+
+    def __len__(self) -> int:
+        return len(self.public_keys) // 32
+
+    def __iter__(self) -> Iterator[HDWallet]:
+        return (self.hdwallet(i) for i in range(len(self)))
+
+    def _check(self, i: int) -> int:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("DerivedKeyRange index out of range")
+        return i
+
+    def public_key(self, i: int) -> bytes:
+        """Public key of the `i`-th child."""
+        i = self._check(i)
+        return self.public_keys[32 * i : 32 * (i + 1)]
+
+    def chain_code(self, i: int) -> bytes:
+        """Chain code of the `i`-th child."""
+        i = self._check(i)
+        return self.chain_codes[32 * i : 32 * (i + 1)]
+
+    def xprivate_key(self, i: int) -> Optional[bytes]:
+        """Private key of the `i`-th child, if keys were derived privately."""
+        i = self._check(i)
+        if self.xprivate_keys is None:
+            return None
+        return self.xprivate_keys[64 * i : 64 * (i + 1)]
+
+    def hdwallet(self, i: int) -> HDWallet:
+        """The `i`-th child as an :class:`HDWallet`, without the root key material of the wallet it came from."""
+        i = self._check(i)
+        return HDWallet(
+            xprivate_key=self.xprivate_key(i),
+            public_key=self.public_key(i),
+            chain_code=self.chain_code(i),
+            path=f"{self.path}/{self.start + i}",
+        )
+
+    def verification_key_hashes(self) -> List[VerificationKeyHash]:
+        """Hashes of the children's verification keys, ready to be used as payment or staking parts of addresses.
+
+        Returns:
+            List[VerificationKeyHash]: One hash per child, in order.
+        """
+        public_keys = self.public_keys
+        return [
+            VerificationKeyHash(
+                hashlib.blake2b(
+                    public_keys[i : i + 32], digest_size=VERIFICATION_KEY_HASH_SIZE
+                ).digest()
+            )
+            for i in range(0, len(public_keys), 32)
+        ]
+
+
 class HDWallet:
     """
     Hierarchical Deterministic Wallet for Cardano
+
+    Intermediate nodes derived by :meth:`derive_from_path` are kept in a bounded LRU cache, keyed by path and
+    derivation mode, so that derivation paths sharing a prefix (e.g. "m/1852'/1815'/0'/0/i" for many `i`) only
+    compute that prefix once. Private key material of evicted nodes is zeroed.
     """
 
+    DEFAULT_NODE_CACHE_SIZE = 32
+    """Default maximum number of intermediate nodes cached by :meth:`derive_from_path`."""
+
     def __init__(
         self,
         root_xprivate_key: Optional[bytes] = None,
@@ -93,6 +274,7 @@ class HDWallet:
         mnemonic: Optional[str] = None,
         passphrase: Optional[str] = None,
         entropy: Optional[str] = None,
+        node_cache_size: int = DEFAULT_NODE_CACHE_SIZE,
     ):
         self._root_xprivate_key = root_xprivate_key
         self._root_public_key = root_public_key
@@ -109,6 +291,99 @@ class HDWallet:
         self._passphrase = passphrase
         self._entropy = entropy
 
+        if node_cache_size < 0:
+            raise ValueError("node_cache_size must be non-negative.")
+        self._node_cache_size = node_cache_size
+        self._node_cache: OrderedDict[Tuple[Tuple[int, ...], bool], HDWallet] = (
+            OrderedDict()
+        )
+        self._node_cache_lock = threading.Lock()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_node_cache"]
+        del state["_node_cache_lock"]
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._node_cache = OrderedDict()
+        self._node_cache_lock = threading.Lock()
+
+    @property
+    def node_cache_size(self) -> int:
+        """Maximum number of intermediate nodes cached by :meth:`derive_from_path`. Set to 0 to disable caching.
+
+        Shrinking the cache evicts the least recently used nodes.
+        """
+        return self._node_cache_size
+
+    @node_cache_size.setter
+    def node_cache_size(self, size: int):
+        if size < 0:
+            raise ValueError("node_cache_size must be non-negative.")
+        with self._node_cache_lock:
+            self._node_cache_size = size
+            self._evict_nodes()
+
+    def clear_node_cache(self):
+        """Evict all cached intermediate nodes, zeroing their private keys."""
+        with self._node_cache_lock:
+            while self._node_cache:
+                self._wipe_node(self._node_cache.popitem(last=False)[1])
+
+    def _evict_nodes(self):
+        while len(self._node_cache) > self._node_cache_size:
+            self._wipe_node(self._node_cache.popitem(last=False)[1])
+
+    @staticmethod
+    def _wipe_node(node: HDWallet):
+        if isinstance(node._xprivate_key, bytearray):
+            node._xprivate_key[:] = bytes(len(node._xprivate_key))
+        node._xprivate_key = None
+        node._root_xprivate_key = None
+        node._seed = None
+        node._mnemonic = None
+        node._passphrase = None
+        node._entropy = None
+
+    def _cached_node(
+        self, indexes: Tuple[int, ...], private: bool
+    ) -> Tuple[Optional[HDWallet], int]:
+        """Find the deepest cached node on a derivation path.
+
+        Args:
+            indexes: Child indexes from this node, hardened indexes included the 0x80000000 offset.
+            private: Derivation mode.
+
+        Returns:
+            A copy of the cached node, safe to use after it is evicted, and its depth. (None, 0) if none is cached.
+        """
+        with self._node_cache_lock:
+            for depth in range(len(indexes), 0, -1):
+                key = (indexes[:depth], private)
+                node = self._node_cache.get(key)
+                if node is not None:
+                    self._node_cache.move_to_end(key)
+                    return node._copy_hdwallet(), depth
+        return None, 0
+
+    def _cache_node(self, indexes: Tuple[int, ...], private: bool, node: HDWallet):
+        if self._node_cache_size == 0:
+            return
+        cached = node._copy_hdwallet()
+        if private and cached._xprivate_key is not None:
+            # Owned by the cache only, so that it can be zeroed on eviction.
+            cached._xprivate_key = bytearray(cached._xprivate_key)
+        with self._node_cache_lock:
+            if self._node_cache_size == 0:
+                return
+            old = self._node_cache.pop((indexes, private), None)
+            self._node_cache[(indexes, private)] = cached
+            if old is not None:
+                self._wipe_node(old)
+            self._evict_nodes()
+
     @classmethod
     def from_seed(
         cls,
@@ -243,7 +518,9 @@ class HDWallet:
             root_xprivate_key=self._root_xprivate_key,
             root_public_key=self._root_public_key,
             root_chain_code=self._root_chain_code,
-            xprivate_key=self._xprivate_key,
+            xprivate_key=(
+                bytes(self._xprivate_key) if self._xprivate_key is not None else None
+            ),
             public_key=self._public_key,
             chain_code=self._chain_code,
             path=self._path,
@@ -257,6 +534,9 @@ class HDWallet:
         """
         Derive keys from a path following CIP-1852 specifications.
 
+        Intermediate nodes on the path are cached (see :attr:`node_cache_size`), so deriving many paths with a
+        common prefix only derives the prefix once.
+
         Args:
             path: Derivation path for the key generation.
             private: whether to derive private child keys or public child keys.
@@ -277,16 +557,19 @@ class HDWallet:
                 'Bad path, please insert like this type of path "m/0\'/0"! '
             )
 
-        derived_hdwallet = self._copy_hdwallet()
-        for index in path.lstrip("m/").split("/"):
-            if index.endswith("'"):
-                derived_hdwallet = derived_hdwallet.derive(
-                    int(index[:-1]), private=private, hardened=True
-                )
-            else:
-                derived_hdwallet = derived_hdwallet.derive(
-                    int(index), private=private, hardened=False
-                )
+        indexes = tuple(
+            int(index[:-1]) + 2**31 if index.endswith("'") else int(index)
+            for index in path.lstrip("m/").split("/")
+        )
+
+        derived_hdwallet, depth = self._cached_node(indexes, private)
+        if derived_hdwallet is None:
+            derived_hdwallet = self._copy_hdwallet()
+
+        for i in range(depth, len(indexes)):
+            derived_hdwallet = derived_hdwallet.derive(indexes[i], private=private)
+            if i < len(indexes) - 1:
+                self._cache_node(indexes[: i + 1], private, derived_hdwallet)
 
         return derived_hdwallet
 
@@ -353,6 +636,91 @@ class HDWallet:
 
         return self._derive_public_child_key_by_index(public_node, index)  # type: ignore
 
+    def derive_range(
+        self,
+        parent_path: str,
+        start: int,
+        count: int,
+        private: bool = False,
+        hardened: bool = False,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1000,
+    ) -> DerivedKeyRange:
+        """
+        Derive many consecutive child keys of a node at once.
+
+        The parent node is derived once, and children are returned in a compact :class:`DerivedKeyRange` instead of
+        one :class:`HDWallet` each.
+
+        Args:
+            parent_path: Derivation path of the parent node, e.g. "m/1852'/1815'/0'/0". Use "m" for this node.
+            start: Index of the first child.
+            count: Number of children.
+            private: whether to derive private child keys or public child keys.
+            hardened: whether to derive hardened children. Requires private derivation.
+            executor: A :class:`concurrent.futures.ProcessPoolExecutor` (or thread pool) to spread derivation over.
+            chunk_size: Number of children derived per task on the executor.
+
+        Returns:
+            DerivedKeyRange: Keys of the children.
+
+        Examples:
+            >>> mnemonic_words = "test walk nut penalty hip pave soap entry language right filter choice"
+            >>> hdwallet = HDWallet.from_mnemonic(mnemonic_words)
+            >>> keys = hdwallet.derive_range("m/1852'/1815'/0'/0", 0, 20)
+            >>> keys.public_key(0).hex()
+            '73fea80d424276ad0978d4fe5310e8bc2d485f5f6bb3bf87612989f112ad5a7d'
+        """
+
+        if parent_path == "m":
+            parent = self
+        else:
+            parent = self.derive_from_path(
+                parent_path, private=self._xprivate_key is not None
+            )
+
+        if private and parent._xprivate_key is None:
+            raise ValueError("Missing private key. Can't do private derivation.")
+        if parent._public_key is None or parent._chain_code is None:
+            raise ValueError(
+                f"None values in parent node: {(parent._public_key, parent._chain_code)}"
+            )
+        if not 0 <= start or not 0 <= count or start + count > 2**31:
+            raise ValueError("Bad index range, indexes must be in [0, 2^31).")
+
+        if hardened:
+            start += 2**31
+
+        node = (
+            parent._xprivate_key if private else None,
+            parent._public_key,
+            parent._chain_code,
+        )
+        if executor is None or count <= chunk_size:
+            public_keys, chain_codes, xprivate_keys = _derive_children(
+                *node, start, count
+            )
+        else:
+            futures = [
+                executor.submit(
+                    _derive_children,
+                    *node,
+                    chunk_start,
+                    min(chunk_size, start + count - chunk_start),
+                )
+                for chunk_start in range(start, start + count, chunk_size)
+            ]
+            chunks = [future.result() for future in futures]
+            public_keys = b"".join(chunk[0] for chunk in chunks)
+            chain_codes = b"".join(chunk[1] for chunk in chunks)
+            xprivate_keys = (
+                b"".join(chunk[2] for chunk in chunks) if private else None  # type: ignore
+            )
+
+        return DerivedKeyRange(
+            parent._path, start, public_keys, chain_codes, xprivate_keys
+        )
+
     def _derive_private_child_key_by_index(
         self, private_pnode: Tuple[bytes, bytes, bytes, bytes, str], index: int
     ) -> HDWallet:
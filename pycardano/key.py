@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from functools import cached_property
 from typing import Optional, Type
 
 from nacl.encoding import RawEncoder
@@ -143,18 +144,26 @@ class Key(CBORSerializable):
 
 
 class SigningKey(Key):
-    def sign(self, data: bytes) -> bytes:
-        signed_message = NACLSigningKey(self.payload).sign(data)
-        return signed_message.signature
+    @cached_property
+    def _nacl_key(self) -> NACLSigningKey:
+        # Keys are immutable, so the expanded key is derived once and reused for every signature.
+        return NACLSigningKey(self.payload)
 
-    def to_verification_key(self) -> VerificationKey:
-        verification_key = NACLSigningKey(self.payload).verify_key
+    @cached_property
+    def _verification_key(self) -> VerificationKey:
         return VerificationKey(
-            bytes(verification_key),
+            bytes(self._nacl_key.verify_key),
             self.key_type.replace("Signing", "Verification"),
             self.description.replace("Signing", "Verification"),
         )
 
+    def sign(self, data: bytes) -> bytes:
+        signed_message = self._nacl_key.sign(data)
+        return signed_message.signature
+
+    def to_verification_key(self) -> VerificationKey:
+        return self._verification_key
+
     @classmethod
     def generate(cls) -> SigningKey:
         signing_key = PrivateKey.generate()
@@ -162,15 +171,19 @@ class SigningKey(Key):
 
 
 class VerificationKey(Key):
+    @cached_property
+    def _hash(self) -> VerificationKeyHash:
+        return VerificationKeyHash(
+            blake2b(self.payload, VERIFICATION_KEY_HASH_SIZE, encoder=RawEncoder)
+        )
+
     def hash(self) -> VerificationKeyHash:
         """Compute a blake2b hash from the key
 
         Returns:
             VerificationKeyHash: Hash output in bytes.
         """
-        return VerificationKeyHash(
-            blake2b(self.payload, VERIFICATION_KEY_HASH_SIZE, encoder=RawEncoder)
-        )
+        return self._hash
 
     @classmethod
     def from_signing_key(cls, key: SigningKey) -> VerificationKey:
@@ -178,17 +191,25 @@ class VerificationKey(Key):
 
 
 class ExtendedSigningKey(Key):
-    def sign(self, data: bytes) -> bytes:
-        private_key = BIP32ED25519PrivateKey(self.payload[:64], self.payload[96:])
-        return private_key.sign(data)
+    @cached_property
+    def _private_key(self) -> BIP32ED25519PrivateKey:
+        # Keys are immutable, so the public point is derived once and reused for every signature.
+        return BIP32ED25519PrivateKey(self.payload[:64], self.payload[96:])
 
-    def to_verification_key(self) -> ExtendedVerificationKey:
+    @cached_property
+    def _verification_key(self) -> ExtendedVerificationKey:
         return ExtendedVerificationKey(
             self.payload[64:],
             self.key_type.replace("Signing", "Verification"),
             self.description.replace("Signing", "Verification"),
         )
 
+    def sign(self, data: bytes) -> bytes:
+        return self._private_key.sign(data)
+
+    def to_verification_key(self) -> ExtendedVerificationKey:
+        return self._verification_key
+
     @classmethod
     def from_hdwallet(cls, hdwallet: HDWallet) -> ExtendedSigningKey:
         if hdwallet.xprivate_key is None or hdwallet.chain_code is None:
@@ -210,7 +231,7 @@ class ExtendedVerificationKey(Key):
         Returns:
             VerificationKeyHash: Hash output in bytes.
         """
-        return self.to_non_extended().hash()
+        return self._non_extended.hash()
 
     @classmethod
     def from_signing_key(cls, key: ExtendedSigningKey) -> ExtendedVerificationKey:
@@ -224,6 +245,10 @@ class ExtendedVerificationKey(Key):
         """
         return VerificationKey(self.payload[:32])
 
+    @cached_property
+    def _non_extended(self) -> VerificationKey:
+        return self.to_non_extended()
+
 
 class PaymentSigningKey(SigningKey):
     KEY_TYPE = "PaymentSigningKeyShelley_ed25519"
@@ -119,8 +119,10 @@ class AlonzoMetadata(MapCBORSerializable):
 class AuxiliaryData(CBORSerializable):
     data: Union[Metadata, ShelleyMarryMetadata, AlonzoMetadata]
 
-    def to_primitive(self) -> Primitive:
-        return self.data.to_primitive()
+    def to_shallow_primitive(
+        self,
+    ) -> Union[Metadata, ShelleyMarryMetadata, AlonzoMetadata]:
+        return self.data
 
     @classmethod
     def from_primitive(
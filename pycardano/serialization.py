@@ -6,24 +6,29 @@ import json
 import os
 import re
 import typing
+import weakref
 from collections import OrderedDict, UserList, defaultdict
+from contextvars import ContextVar
 from copy import deepcopy
-from dataclasses import Field, dataclass, field, fields
+from dataclasses import MISSING, Field, dataclass, field, fields, is_dataclass
 from datetime import datetime
 from decimal import Decimal
 from fractions import Fraction
-from functools import wraps
+from functools import cached_property, lru_cache, partial, wraps
 from inspect import getfullargspec, isclass
+from io import BytesIO
 from typing import (
     Any,
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -254,7 +259,240 @@ def default_encoder(
     elif isinstance(value, FrozenDict):
         encoder.encode(dict(value))
     else:
-        encoder.encode(value.to_validated_primitive())
+        value.validate()
+        _stream_encode(encoder, value)
+
+
+def _stream_encode(encoder: CBOREncoder, value: Any):
+    """Write a value to the encoder while walking it, without building an intermediate primitive tree.
+
+    CBORSerializables are expanded through :meth:`CBORSerializable.to_shallow_primitive` (or an overridden
+    :meth:`CBORSerializable.to_primitive`) and containers are written item by item, producing the same bytes as
+    encoding the result of :meth:`CBORSerializable.to_primitive`. Nested CBORSerializables are not validated,
+    which matches the behavior of :meth:`CBORSerializable.to_validated_primitive`.
+
+    Args:
+        encoder (CBOREncoder): The encoder to write to.
+        value (Any): A CBOR primitive or a CBORSerializable.
+    """
+    while isinstance(value, CBORSerializable):
+        if _ORIGINAL_CBOR:
+            original = _get_original_cbor(value)
+            if original is not None:
+                encoder.write(bytes(original))
+                return
+        if type(value).to_primitive is CBORSerializable.to_primitive:
+            value = value.to_shallow_primitive()
+        else:
+            value = value.to_primitive()
+
+    value_type = type(value)
+    if value_type is list or value_type is tuple:
+        encoder.encode_length(4, len(value))
+        for item in value:
+            _stream_encode(encoder, item)
+    elif isinstance(value, dict):
+        encoder.encode_length(5, len(value))
+        for k, v in value.items():
+            _stream_encode(encoder, k)
+            _stream_encode(encoder, v)
+    elif isinstance(value, (IndefiniteList, IndefiniteFrozenList)):
+        encoder.write(b"\x9f")
+        for item in value:
+            _stream_encode(encoder, item)
+        encoder.write(b"\xff")
+    elif isinstance(value, (list, tuple, FrozenList)):
+        encoder.encode_length(4, len(value))
+        for item in value:
+            _stream_encode(encoder, item)
+    elif isinstance(value, FrozenDict):
+        encoder.encode_length(5, len(value))
+        for k, v in value.items():
+            _stream_encode(encoder, k)
+            _stream_encode(encoder, v)
+    elif isinstance(value, (set, frozenset)):
+        encoder.encode_length(6, 258)
+        encoder.encode_length(4, len(value))
+        for item in value:
+            _stream_encode(encoder, item)
+    elif isinstance(value, CBORTag):
+        encoder.encode_length(6, value.tag)
+        _stream_encode(encoder, value.value)
+    else:
+        encoder.encode(value)
+
+
+_SPAN_TYPES = (list, dict, CBORTag, FrozenList, UserList)
+"""Types of decoded primitives whose source byte spans are recorded when preserving original CBOR."""
+
+_DECODE_SPANS: ContextVar[Optional[Dict[int, Tuple[Any, memoryview]]]] = ContextVar(
+    "_DECODE_SPANS", default=None
+)
+"""Source byte spans of the primitives decoded by the ongoing :meth:`CBORSerializable.from_cbor` call, keyed by
+object id. Only set when original CBOR is preserved."""
+
+
+class _SpanDecoder(cbor2._decoder.CBORDecoder):  # type: ignore
+    """A CBOR decoder that records the source byte span of every decoded container."""
+
+    def __init__(self, payload: bytes, spans: Dict[int, Tuple[Any, memoryview]]):
+        super().__init__(BytesIO(payload))
+        self._payload = memoryview(payload)
+        self._spans = spans
+
+    def _decode(self, immutable: bool = False, unshared: bool = False) -> Any:
+        start = self.fp.tell()
+        value = super()._decode(  # type: ignore[misc]
+            immutable=immutable, unshared=unshared
+        )
+        if isinstance(value, _SPAN_TYPES):
+            self._spans[id(value)] = (value, self._payload[start : self.fp.tell()])
+        return value
+
+
+class _State(tuple):
+    """A snapshot of the attributes of an object, used to detect changes made to objects with original CBOR."""
+
+
+class _OriginalCBOR:
+    """Original CBOR bytes of a decoded object, with a snapshot of the object's state right after decoding."""
+
+    __slots__ = ("cbor", "state")
+
+    def __init__(self, cbor: memoryview, state: _State):
+        self.cbor = cbor
+        self.state = state
+
+
+_ORIGINAL_CBOR: Dict[int, Tuple[weakref.ref, _OriginalCBOR]] = {}
+"""Original CBOR of objects restored with ``preserve_cbor=True``, keyed by object id."""
+
+
+_NO_VALUE = object()
+"""Placeholder in state snapshots for a field that is not set on the object."""
+
+
+@lru_cache(maxsize=None)
+def _cache_attributes(cls: type) -> FrozenSet[str]:
+    """Names of the attributes in which instances of a class cache values derived from their state.
+
+    These are the ``cached_property`` attributes of the class, and the names listed in its ``_CACHE_ATTRIBUTES``.
+    """
+    names = set(getattr(cls, "_CACHE_ATTRIBUTES", ()))
+    for klass in cls.__mro__:
+        names.update(
+            name
+            for name, value in vars(klass).items()
+            if isinstance(value, cached_property)
+        )
+    return frozenset(names)
+
+
+def _object_state(obj: Any) -> _State:
+    """Take a snapshot of the attributes of an object.
+
+    Only the fields of dataclasses are part of the snapshot, and caches are left out of it (see
+    :func:`_cache_attributes`), so that caches filled when reading an object do not count as changes.
+
+    The snapshot holds the attributes themselves, the items of list and dict attributes, and the snapshots of
+    CBORSerializable attributes that do not have original CBOR. CBORSerializable attributes that have original
+    CBOR keep track of their own state.
+    """
+    state: List[Any] = []
+    attributes = vars(obj)
+    if is_dataclass(obj):
+        for f in fields(obj):
+            _append_state(state, attributes.get(f.name, _NO_VALUE))
+    else:
+        cache_attributes = _cache_attributes(type(obj))
+        for name, value in attributes.items():
+            if name not in cache_attributes:
+                _append_state(state, value)
+    return _State(state)
+
+
+def _append_state(state: List[Any], value: Any):
+    state.append(value)
+    if isinstance(value, (list, UserList, FrozenList)):
+        state.append(len(value))
+        for item in value:
+            _append_state(state, item)
+    elif isinstance(value, dict):
+        state.append(len(value))
+        for k, v in value.items():
+            _append_state(state, k)
+            _append_state(state, v)
+    elif (
+        isinstance(value, CBORSerializable)
+        and hasattr(value, "__dict__")
+        and id(value) not in _ORIGINAL_CBOR
+    ):
+        state.append(_object_state(value))
+
+
+def _same_state(current: _State, preserved: _State) -> bool:
+    if len(current) != len(preserved):
+        return False
+    for c, p in zip(current, preserved):
+        if type(p) is _State:
+            if type(c) is not _State or not _same_state(c, p):
+                return False
+        elif c is not p:
+            return False
+        elif (
+            isinstance(c, CBORSerializable)
+            and id(c) in _ORIGINAL_CBOR
+            and _get_original_cbor(c) is None
+        ):
+            return False
+    return True
+
+
+def _preserve_original_cbor(
+    obj: Any, value: Primitive, spans: Dict[int, Tuple[Any, memoryview]]
+):
+    """Keep the source bytes of a decoded primitive as the original CBOR of the object restored from it.
+
+    If the object is a list or an :class:`OrderedSet` restored item by item from the primitive, the original CBOR
+    of its items is kept as well.
+
+    Args:
+        obj (Any): The restored object.
+        value (:const:`Primitive`): The decoded primitive ``obj`` is restored from.
+        spans (Dict[int, Tuple[Any, memoryview]]): Source byte spans recorded while decoding.
+    """
+    if isinstance(obj, (list, OrderedSet)):
+        items = value.value if isinstance(value, CBORTag) else value
+        if isinstance(items, (list, UserList, FrozenList)) and len(items) == len(obj):
+            for item, item_value in zip(obj, items):
+                _preserve_original_cbor(item, item_value, spans)
+    if isinstance(obj, CBORSerializable) and hasattr(obj, "__dict__"):
+        span = spans.get(id(value))
+        if span is not None and span[0] is value:
+            key = id(obj)
+            _ORIGINAL_CBOR[key] = (
+                weakref.ref(obj, lambda _: _ORIGINAL_CBOR.pop(key, None)),
+                _OriginalCBOR(span[1], _object_state(obj)),
+            )
+
+
+def _get_original_cbor(obj: Any) -> Optional[memoryview]:
+    """Get the original CBOR of an object restored with ``preserve_cbor=True``.
+
+    Args:
+        obj (Any): An object.
+
+    Returns:
+        Optional[memoryview]: The original CBOR, or None if the object has no original CBOR, or if the object or
+            any object it holds has been modified since decoding.
+    """
+    entry = _ORIGINAL_CBOR.get(id(obj))
+    if entry is None or entry[0]() is not obj:
+        return None
+    original = entry[1]
+    if not _same_state(_object_state(obj), original.state):
+        return None
+    return original.cbor
 
 
 @typechecked
@@ -359,7 +597,7 @@ class CBORSerializable:
         Raises:
             InvalidDataException: When the data is invalid.
         """
-        type_hints = get_type_hints(self.__class__)
+        type_hints = _serialization_plan(self.__class__).type_hints
 
         def _check_recursive(value, type_hint):
             if type_hint is Any:
@@ -461,6 +699,10 @@ class CBORSerializable:
             >>> a.to_cbor().hex()
             '820102'
         """
+        if _ORIGINAL_CBOR:
+            original = _get_original_cbor(self)
+            if original is not None:
+                return bytes(original)
         return dumps(self, default=default_encoder)
 
     def to_cbor_hex(self) -> str:
@@ -472,11 +714,25 @@ class CBORSerializable:
         return self.to_cbor().hex()
 
     @classmethod
-    def from_cbor(cls: Type[CBORBase], payload: Union[str, bytes]) -> CBORBase:
+    def from_cbor(
+        cls: Type[CBORBase],
+        payload: Union[str, bytes],
+        preserve_cbor: bool = False,
+        lazy: bool = False,
+    ) -> CBORBase:
         """Restore a CBORSerializable object from a CBOR.
 
         Args:
             payload (Union[str, bytes]): CBOR bytes or hex string to restore from.
+            preserve_cbor (bool): Keep the original bytes of the restored object and of the objects nested in it.
+                :meth:`to_cbor` (and therefore hashing) of these objects will return the original bytes without
+                re-encoding, even if they were not encoded canonically, until the object is modified. Modifications
+                are detected when an attribute is reassigned, or when a list or dict attribute is changed in place.
+            lazy (bool): Only index the top-level items of the CBOR, and restore each field of the object from its
+                CBOR when it is accessed for the first time. Fields whose type supports lazy restoration are restored
+                lazily as well. Only dataclass-based :class:`ArrayCBORSerializable` and :class:`MapCBORSerializable`
+                that do not customize restoration support it, other classes are restored eagerly.
+                Cannot be combined with ``preserve_cbor``.
 
         Returns:
             CBORBase: Restored CBORSerializable object of the specific subclass type.
@@ -539,9 +795,25 @@ class CBORSerializable:
 
         assert isinstance(payload, bytes)
 
-        value = cbor2.loads(payload)
+        if lazy:
+            if preserve_cbor:
+                raise ValueError("preserve_cbor and lazy cannot be used together.")
+            if _serialization_plan(cls).supports_lazy:
+                return _lazy_from_cbor(cls, payload)
 
-        return cls.from_primitive(value)
+        if not preserve_cbor:
+            value = cbor2.loads(payload)
+            return cls.from_primitive(value)
+
+        spans: Dict[int, Tuple[Any, memoryview]] = {}
+        value = _SpanDecoder(payload, spans).decode()
+        token = _DECODE_SPANS.set(spans)
+        try:
+            obj = cls.from_primitive(value)
+            _preserve_original_cbor(obj, value, spans)
+        finally:
+            _DECODE_SPANS.reset(token)
+        return obj
 
     def __repr__(self):
         return pformat(vars(self), indent=2)
@@ -668,22 +940,381 @@ class CBORSerializable:
             return cls.from_json(f.read())
 
 
-def _restore_dataclass_field(
-    f: Field, v: Primitive
-) -> Union[Primitive, CBORSerializable]:
-    """Try to restore a value back to its original type based on information given in field.
+class _SerializationPlan:
+    """Reflection results of a CBORSerializable class, computed once and reused by every instance.
+
+    Resolving type hints, walking dataclass fields and inspecting ``from_primitive`` signatures is far more
+    expensive than (de)serializing a single object, so these results are computed lazily on first use and cached
+    on the class itself (see :func:`_serialization_plan`).
+    """
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self._type_hints: Optional[Dict[str, Any]] = None
+        self._encode_fields: Optional[Tuple[Tuple[str, Any, bool], ...]] = None
+        self._decode_fields: Optional[
+            Tuple[Tuple[Any, str, Callable[[Primitive], Any]], ...]
+        ] = None
+        self._decode_keys: Optional[
+            Dict[Any, Tuple[str, Callable[[Primitive], Any]]]
+        ] = None
+        self._lazy_restorers: Optional[Dict[str, Callable[[bytes], Any]]] = None
+        self._lazy_class: Optional[type] = None
+
+    @property
+    def type_hints(self) -> Dict[str, Any]:
+        """Resolved type hints of the class."""
+        if self._type_hints is None:
+            self._type_hints = get_type_hints(self.cls)
+        return self._type_hints
+
+    @property
+    def encode_fields(self) -> Tuple[Tuple[str, Any, bool], ...]:
+        """A tuple of (attribute name, map key, optional) for all dataclass fields, in declaration order."""
+        if self._encode_fields is None:
+            self._encode_fields = tuple(
+                (
+                    f.name,
+                    f.metadata.get("key", f.name),
+                    bool(f.metadata.get("optional")),
+                )
+                for f in fields(self.cls)
+            )
+        return self._encode_fields
+
+    @property
+    def decode_fields(self) -> Tuple[Tuple[Any, str, Callable[[Primitive], Any]], ...]:
+        """A tuple of (map key, attribute name, restore function) for all init fields, in declaration order."""
+        if self._decode_fields is None:
+            decode_fields = []
+            for f in fields(self.cls):
+                if not f.init:
+                    continue
+                if not isclass(f.type):
+                    f.type = self.type_hints[f.name]
+                decode_fields.append(
+                    (f.metadata.get("key", f.name), f.name, _field_restorer(f))
+                )
+            self._decode_fields = tuple(decode_fields)
+        return self._decode_fields
+
+    @property
+    def decode_keys(self) -> Dict[Any, Tuple[str, Callable[[Primitive], Any]]]:
+        """A mapping from map key to (attribute name, restore function) for all init fields."""
+        if self._decode_keys is None:
+            self._decode_keys = {
+                key: (name, restorer) for key, name, restorer in self.decode_fields
+            }
+        return self._decode_keys
+
+    @property
+    def supports_lazy(self) -> bool:
+        """Whether instances can be restored lazily, which requires the class to be restored only from its fields.
+
+        This is the case for dataclasses that neither override ``from_primitive`` nor define ``__post_init__``.
+        """
+        cls: Any = self.cls
+        if issubclass(cls, ArrayCBORSerializable):
+            base: Any = ArrayCBORSerializable
+        elif issubclass(cls, MapCBORSerializable):
+            base = MapCBORSerializable
+        else:
+            return False
+        return (
+            cls.from_primitive.__func__ is base.from_primitive.__func__
+            and not hasattr(cls, "__post_init__")
+        )
+
+    @property
+    def lazy_restorers(self) -> Dict[str, Callable[[bytes], Any]]:
+        """A mapping from attribute name to the function that restores the field from its CBOR, for init fields.
+
+        Fields whose type supports lazy restoration are restored lazily as well.
+        """
+        if self._lazy_restorers is None:
+            lazy_restorers: Dict[str, Callable[[bytes], Any]] = {}
+            for f, (_, name, restorer) in zip(
+                [f for f in fields(self.cls) if f.init], self.decode_fields
+            ):
+                if (
+                    "object_hook" not in f.metadata
+                    and isclass(f.type)
+                    and issubclass(f.type, CBORSerializable)
+                    and _serialization_plan(f.type).supports_lazy
+                ):
+                    lazy_restorers[name] = partial(_lazy_from_cbor, f.type)
+                else:
+                    lazy_restorers[name] = partial(_restore_from_cbor, restorer)
+            self._lazy_restorers = lazy_restorers
+        return self._lazy_restorers
+
+    @property
+    def lazy_class(self) -> type:
+        """The class of the objects of the class whose fields are not all restored yet, see :func:`_lazy_from_cbor`."""
+        if self._lazy_class is None:
+            namespace: Dict[str, Any] = {
+                name: value
+                for name, value in vars(_LazilyRestored).items()
+                if callable(value)
+            }
+            namespace.update(
+                __module__=self.cls.__module__,
+                __qualname__=self.cls.__qualname__,
+                _serialization_plan=self,
+                _lazy_base=self.cls,
+            )
+            for f in fields(self.cls):
+                # Dataclass defaults are class attributes, which would shadow fields that are not restored yet.
+                if f.default is not MISSING:
+                    namespace[f.name] = _LazyFieldDefault(f.name, f.default)
+            # The class must only derive from the restored class, for objects to be able to change to it.
+            self._lazy_class = type(self.cls.__name__, (self.cls,), namespace)
+        return self._lazy_class
+
+
+class _LazilyRestored:
+    """Methods of the classes of lazily restored objects, which restore their fields when first accessed.
+
+    A lazy class derives from the class objects are restored as, see :meth:`_SerializationPlan.lazy_class`. An object
+    only is an instance of it while some of its fields are not restored yet, after which its class is set back to the
+    class it was restored as.
+    """
+
+    _lazy_base: type
+
+    if not typing.TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            return _restore_lazy_field(self, name)
+
+    def __setattr__(self, name: str, value: Any):
+        self._lazy_base.__setattr__(self, name, value)
+        # A field assigned before it is read is not restored from its CBOR anymore.
+        lazy_fields = self.__dict__.get("_lazy_fields")
+        if lazy_fields is not None and lazy_fields.pop(name, None) is not None:
+            _end_lazy_restoration(self)
+
+    def __eq__(self, other: object) -> bool:
+        _restore_all_lazy_fields(self)
+        return self == other
+
+    def __hash__(self) -> int:
+        _restore_all_lazy_fields(self)
+        return hash(self)
+
+    def __repr__(self) -> str:
+        _restore_all_lazy_fields(self)
+        return repr(self)
+
+    def __reduce_ex__(self, protocol):
+        _restore_all_lazy_fields(self)
+        return self.__reduce_ex__(protocol)
+
+
+class _LazyFieldDefault:
+    """The default value of a field as a class attribute of a lazy class, which restores the field first if it is not
+    restored yet."""
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, name: str, default: Any):
+        self.name = name
+        self.default = default
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is not None and self.name in obj.__dict__.get("_lazy_fields", ()):
+            return _restore_lazy_field(obj, self.name)
+        return self.default
+
+
+def _serialization_plan(cls: type) -> _SerializationPlan:
+    """Get the cached :class:`_SerializationPlan` of a class, creating it on first use.
+
+    The plan is looked up in the class's own ``__dict__`` so subclasses never reuse the plan of their parent.
+    """
+    plan = cls.__dict__.get("_serialization_plan")
+    if plan is None:
+        plan = _SerializationPlan(cls)
+        setattr(cls, "_serialization_plan", plan)
+    return plan
+
+
+@lru_cache(maxsize=None)
+def _accepts_type_args(from_primitive: Callable) -> bool:
+    return "type_args" in getfullargspec(from_primitive).args
+
+
+def _field_restorer(f: Field) -> Callable[[Primitive], Any]:
+    """Pre-resolve the function that restores the value of a dataclass field from a CBOR primitive.
 
     Args:
-        f (dataclass_field): A data class field.
-        v (:const:`Primitive`): A CBOR primitive.
+        f (dataclass_field): A data class field whose type is already resolved.
 
     Returns:
-        Union[:const:`Primitive`, CBORSerializable]: A CBOR primitive or a CBORSerializable.
+        Callable[[:const:`Primitive`], Any]: A function that restores a primitive to the type of the field.
     """
-
     if "object_hook" in f.metadata:
-        return f.metadata["object_hook"](v)
-    return _restore_typed_primitive(cast(Any, f.type), v)
+        return f.metadata["object_hook"]
+    t = cast(Any, f.type)
+    if t is Any:
+        return _identity
+    if isclass(t) and issubclass(t, CBORSerializable):
+        if _accepts_type_args(getattr(t.from_primitive, "__func__", t.from_primitive)):
+            return partial(t.from_primitive, type_args=())
+        return t.from_primitive
+    return partial(_restore_typed_primitive, t)
+
+
+def _restore_from_cbor(restorer: Callable[[Primitive], Any], payload: bytes) -> Any:
+    return restorer(cbor2.loads(payload))
+
+
+def _cbor_argument(payload: bytes, offset: int) -> Tuple[int, int, Optional[int], int]:
+    """Parse the head of the CBOR data item starting at offset.
+
+    Returns:
+        Tuple[int, int, Optional[int], int]: Major type, additional info, argument (None for indefinite length) and
+            the offset right after the head.
+    """
+    initial_byte = payload[offset]
+    major_type = initial_byte >> 5
+    info = initial_byte & 31
+    offset += 1
+    if info < 24:
+        return major_type, info, info, offset
+    elif info < 28:
+        size = 1 << (info - 24)
+        return (
+            major_type,
+            info,
+            int.from_bytes(payload[offset : offset + size], "big"),
+            offset + size,
+        )
+    elif info == 31 and major_type not in (0, 1, 6):
+        return major_type, info, None, offset
+    raise DeserializeException(
+        f"Invalid CBOR head {hex(initial_byte)} at offset {offset - 1}."
+    )
+
+
+def _cbor_item_end(payload: bytes, offset: int) -> int:
+    """Find where the CBOR data item starting at offset ends, without decoding it."""
+    major_type, _, argument, offset = _cbor_argument(payload, offset)
+    if major_type in (0, 1, 7):
+        return offset
+    elif major_type == 6:
+        return _cbor_item_end(payload, offset)
+    elif argument is None:
+        while payload[offset] != 0xFF:
+            offset = _cbor_item_end(payload, offset)
+        return offset + 1
+    elif major_type in (2, 3):
+        return offset + argument
+    for _ in range(argument if major_type == 4 else argument * 2):
+        offset = _cbor_item_end(payload, offset)
+    return offset
+
+
+def _cbor_container_items(payload: bytes, major_type: int) -> List[Tuple[int, int]]:
+    """Get the (start, end) offsets of each item of a CBOR array or map, without decoding the items.
+
+    For a map, keys and values are returned alternately.
+    """
+    actual_major_type, _, argument, offset = _cbor_argument(payload, 0)
+    if actual_major_type != major_type:
+        raise DeserializeException(
+            f"Expect CBOR major type {major_type}, got {actual_major_type} instead."
+        )
+    items = []
+    if argument is None:
+        while payload[offset] != 0xFF:
+            end = _cbor_item_end(payload, offset)
+            items.append((offset, end))
+            offset = end
+    else:
+        for _ in range(argument if major_type == 4 else argument * 2):
+            end = _cbor_item_end(payload, offset)
+            items.append((offset, end))
+            offset = end
+    return items
+
+
+def _lazy_from_cbor(cls: Type[CBORBase], payload: bytes) -> CBORBase:
+    """Restore an object without restoring its fields, which are restored from their CBOR when first accessed.
+
+    Only the offsets of the top-level items of the CBOR array or map are indexed.
+
+    Args:
+        cls (Type[CBORBase]): A class that supports lazy restoration.
+        payload (bytes): CBOR of the object.
+
+    Returns:
+        CBORBase: The restored object.
+    """
+    plan = _serialization_plan(cls)
+    plan.lazy_restorers
+    lazy_fields: Dict[str, bytes] = {}
+
+    unknown_fields: Dict[str, Any] = {}
+    if issubclass(cls, ArrayCBORSerializable):
+        items = _cbor_container_items(payload, 4)
+        for (_, name, _), (start, end) in zip(plan.decode_fields, items):
+            lazy_fields[name] = payload[start:end]
+        for i, (start, end) in enumerate(items[len(plan.decode_fields) :]):
+            unknown_fields[f"unknown_field{i}"] = cbor2.loads(payload[start:end])
+    else:
+        items = _cbor_container_items(payload, 5)
+        for (key_start, key_end), (start, end) in zip(items[::2], items[1::2]):
+            major_type, _, argument, _ = _cbor_argument(payload, key_start)
+            key = (
+                argument if major_type == 0 else cbor2.loads(payload[key_start:key_end])
+            )
+            if key not in plan.decode_keys:
+                raise DeserializeException(f"Unexpected map key {key} in CBOR.")
+            lazy_fields[plan.decode_keys[key][0]] = payload[start:end]
+
+    obj = cls.__new__(plan.lazy_class if lazy_fields else cls)
+    for f in fields(cls):  # type: ignore[arg-type]
+        if f.name in lazy_fields:
+            continue
+        if f.default is not MISSING:
+            object.__setattr__(obj, f.name, f.default)
+        elif f.default_factory is not MISSING:
+            object.__setattr__(obj, f.name, f.default_factory())
+        elif f.init:
+            raise DeserializeException(
+                f"Missing required field '{f.name}' to restore {cls.__name__}."
+            )
+    for name, value in unknown_fields.items():
+        object.__setattr__(obj, name, value)
+    if lazy_fields:
+        obj.__dict__["_lazy_fields"] = lazy_fields
+    return obj
+
+
+def _restore_lazy_field(obj: Any, name: str) -> Any:
+    """Restore a field of a lazily restored object, and store it on the object."""
+    lazy_fields = obj.__dict__.get("_lazy_fields")
+    if not lazy_fields or name not in lazy_fields:
+        raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{name}'")
+    value = _serialization_plan(type(obj)).lazy_restorers[name](lazy_fields[name])
+    object.__setattr__(obj, name, value)
+    del lazy_fields[name]
+    _end_lazy_restoration(obj)
+    return value
+
+
+def _end_lazy_restoration(obj: Any):
+    """Set the class of a lazily restored object back to the class it was restored as, once all fields are restored."""
+    if not obj.__dict__["_lazy_fields"]:
+        del obj.__dict__["_lazy_fields"]
+        object.__setattr__(obj, "__class__", type(obj)._lazy_base)
+
+
+def _restore_all_lazy_fields(obj: Any):
+    """Restore all fields that are not restored yet, if the object is lazily restored."""
+    for name in list(obj.__dict__.get("_lazy_fields", ())):
+        getattr(obj, name)
 
 
 def _restore_typed_primitive(
@@ -714,7 +1345,7 @@ def _restore_typed_primitive(
     if t is Any or (t in PRIMITIVE_TYPES and isinstance(v, t)):
         return v
     elif is_cbor_serializable:
-        if "type_args" in getfullargspec(t.from_primitive).args:
+        if _accepts_type_args(getattr(t.from_primitive, "__func__", t.from_primitive)):
             args = typing.get_args(t)
             return t.from_primitive(v, type_args=args)
         else:
@@ -842,9 +1473,9 @@ class ArrayCBORSerializable(CBORSerializable):
                 types.
         """
         primitives = []
-        for f in fields(self):
-            val = getattr(self, f.name)
-            if val is None and f.metadata.get("optional"):
+        for name, _, optional in _serialization_plan(self.__class__).encode_fields:
+            val = getattr(self, name)
+            if val is None and optional:
                 continue
             primitives.append(val)
         return primitives
@@ -866,18 +1497,16 @@ class ArrayCBORSerializable(CBORSerializable):
         Raises:
             DeserializeException: When the object could not be restored from primitives.
         """
-        all_fields = [f for f in fields(cls) if f.init]
-
-        restored_vals = []
-        type_hints = get_type_hints(cls)
-        for f, v in zip(all_fields, values):
-            if not isclass(f.type):
-                f.type = type_hints[f.name]
-            v = _restore_dataclass_field(f, v)
-            restored_vals.append(v)
+        all_fields = _serialization_plan(cls).decode_fields
+
+        restored_vals = [restorer(v) for (_, _, restorer), v in zip(all_fields, values)]
         obj = cls(*restored_vals)
         for i in range(len(all_fields), len(values)):
             setattr(obj, f"unknown_field{i - len(all_fields)}", values[i])
+        spans = _DECODE_SPANS.get()
+        if spans is not None:
+            for restored, v in zip(restored_vals, values):
+                _preserve_original_cbor(restored, v, spans)
         return obj
 
     def __repr__(self):
@@ -947,15 +1576,11 @@ class MapCBORSerializable(CBORSerializable):
 
     def to_shallow_primitive(self) -> Primitive:
         primitives = {}
-        for f in fields(self):
-            if "key" in f.metadata:
-                key = f.metadata["key"]
-            else:
-                key = f.name
+        for name, key, optional in _serialization_plan(self.__class__).encode_fields:
             if key in primitives:
                 raise SerializeException(f"Key: '{key}' already exists in the map.")
-            val = getattr(self, f.name)
-            if val is None and f.metadata.get("optional"):
+            val = getattr(self, name)
+            if val is None and optional:
                 continue
             primitives[key] = val
         return primitives
@@ -975,20 +1600,20 @@ class MapCBORSerializable(CBORSerializable):
         Raises:
             :class:`pycardano.exception.DeserializeException`: When the object could not be restored from primitives.
         """
-        all_fields = {f.metadata.get("key", f.name): f for f in fields(cls) if f.init}
+        all_fields = _serialization_plan(cls).decode_keys
 
         kwargs = {}
-        type_hints = get_type_hints(cls)
         for key in values:
             if key not in all_fields:
                 raise DeserializeException(f"Unexpected map key {key} in CBOR.")
-            f = all_fields[key]
-            v = values[key]
-            if not isclass(f.type):
-                f.type = type_hints[f.name]
-            v = _restore_dataclass_field(f, v)
-            kwargs[f.name] = v
-        return cls(**kwargs)
+            name, restorer = all_fields[key]
+            kwargs[name] = restorer(values[key])
+        obj = cls(**kwargs)
+        spans = _DECODE_SPANS.get()
+        if spans is not None:
+            for key in values:
+                _preserve_original_cbor(kwargs[all_fields[key][0]], values[key], spans)
+        return obj
 
     def __repr__(self):
         return super().__repr__()
@@ -1112,6 +1737,10 @@ class DictCBORSerializable(CBORSerializable):
                 else v
             )
             restored[k] = v
+        spans = _DECODE_SPANS.get()
+        if spans is not None:
+            for v, restored_v in zip(value.values(), restored.data.values()):
+                _preserve_original_cbor(restored_v, v, spans)
         return restored
 
     def copy(self) -> DictCBORSerializable:
@@ -1150,10 +1779,11 @@ class OrderedSet(Generic[T], CBORSerializable):
             self.extend(iterable)
 
     def append(self, item: T) -> None:
-        if item in self:
+        key = dumps(item, default=default_encoder)
+        if key in self._dict:
             return
         self._list.append(item)
-        self._dict[dumps(item, default=default_encoder)] = len(self._list) - 1
+        self._dict[key] = len(self._list) - 1
 
     def extend(self, items: Iterable[T]) -> None:
         self._is_indefinite_list = isinstance(items, IndefiniteList)
@@ -1219,9 +1849,10 @@ class OrderedSet(Generic[T], CBORSerializable):
         type_arg = type_args[0] if type_args else None
 
         if isinstance(value, CBORTag) and value.tag == 258:
+            items: List[Any] = value.value
             if isclass(type_arg) and issubclass(type_arg, CBORSerializable):
-                value.value = [type_arg.from_primitive(v) for v in value.value]
-            return cls(value.value, use_tag=True)
+                items = [type_arg.from_primitive(v) for v in items]
+            return cls(items, use_tag=True)
 
         use_tag = isinstance(value, set)
 
@@ -0,0 +1,445 @@
+"""Batch signing and signature verification of transactions."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from nacl.exceptions import CryptoError
+from nacl.signing import VerifyKey
+
+from pycardano.address import Address, AddressType
+from pycardano.certificate import (
+    Certificate,
+    PoolRegistration,
+    PoolRetirement,
+    RegDRepCert,
+    StakeAndVoteDelegation,
+    StakeCredential,
+    StakeDelegation,
+    StakeDeregistration,
+    StakeDeregistrationConway,
+    StakeRegistration,
+    StakeRegistrationAndDelegation,
+    StakeRegistrationAndDelegationAndVoteDelegation,
+    StakeRegistrationAndVoteDelegation,
+    StakeRegistrationConway,
+    VoteDelegation,
+)
+from pycardano.governance import Voter
+from pycardano.hash import VerificationKeyHash
+from pycardano.key import (
+    ExtendedSigningKey,
+    ExtendedVerificationKey,
+    SigningKey,
+    VerificationKey,
+)
+from pycardano.nativescript import (
+    InvalidBefore,
+    InvalidHereAfter,
+    NativeScript,
+    ScriptAll,
+    ScriptAny,
+    ScriptNofK,
+    ScriptPubkey,
+)
+from pycardano.serialization import NonEmptyOrderedSet
+from pycardano.transaction import Transaction, TransactionBody, UTxO
+from pycardano.witness import TransactionWitnessSet, VerificationKeyWitness
+
+__all__ = [
+    "BatchSigner",
+    "SignatureVerification",
+    "certificate_vkey_hashes",
+    "native_script_satisfied",
+    "native_script_vkey_hashes",
+    "required_vkey_hashes",
+    "utxo_vkey_hashes",
+    "verify_signatures",
+    "voter_vkey_hashes",
+    "withdrawal_vkey_hashes",
+]
+
+# A signing job: the hash of a transaction body, and the positions of the keys to sign it with.
+_Job = Tuple[bytes, Tuple[int, ...]]
+
+
+def _run_jobs(
+    keys: Sequence[Union[SigningKey, ExtendedSigningKey]], jobs: Sequence[_Job]
+) -> List[List[bytes]]:
+    return [[keys[i].sign(tx_hash) for i in indexes] for tx_hash, indexes in jobs]
+
+
+class BatchSigner:
+    """Sign many transaction bodies with a fixed set of signing keys.
+
+    Each transaction body is hashed exactly once, no matter how many keys sign it, and each key reuses its expanded
+    key material across signatures. Signing can optionally be spread over a thread or process pool.
+
+    Args:
+        signing_keys (Iterable[Union[SigningKey, ExtendedSigningKey]]): Keys to sign with. Duplicate keys are only
+            used once.
+        executor (Optional[Executor]): A :class:`concurrent.futures.ThreadPoolExecutor` or
+            :class:`concurrent.futures.ProcessPoolExecutor` to sign with. Signing happens in the calling thread when
+            not provided.
+        chunk_size (int): Number of transaction bodies handed to the executor at a time.
+    """
+
+    def __init__(
+        self,
+        signing_keys: Iterable[Union[SigningKey, ExtendedSigningKey]],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 64,
+    ):
+        keys: Dict[bytes, Union[SigningKey, ExtendedSigningKey]] = {}
+        for key in signing_keys:
+            keys.setdefault(key.payload, key)
+        self.signing_keys = list(keys.values())
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+        self._vkeys: List[Union[VerificationKey, ExtendedVerificationKey]] = [
+            key.to_verification_key() for key in self.signing_keys
+        ]
+        self._vkey_hashes = [vkey.hash() for vkey in self._vkeys]
+
+    @property
+    def verification_key_hashes(self) -> List[VerificationKeyHash]:
+        """List[VerificationKeyHash]: Hashes of the verification keys of the signing keys, in order."""
+        return list(self._vkey_hashes)
+
+    def witnesses(
+        self,
+        tx_hash: bytes,
+        key_hashes: Optional[Collection[VerificationKeyHash]] = None,
+    ) -> List[VerificationKeyWitness]:
+        """Sign a single transaction body hash.
+
+        Args:
+            tx_hash (bytes): Hash of the transaction body.
+            key_hashes (Optional[Collection[VerificationKeyHash]]): Only sign with the keys whose verification key
+                hash is in this collection. All keys sign when not provided.
+
+        Returns:
+            List[VerificationKeyWitness]: One witness per signing key used.
+        """
+        indexes = self._indexes(key_hashes)
+        signatures = _run_jobs(self.signing_keys, [(tx_hash, indexes)])[0]
+        return self._to_witnesses(indexes, signatures)
+
+    def sign(
+        self,
+        tx_bodies: Iterable[TransactionBody],
+        key_hashes: Optional[
+            Iterable[Optional[Collection[VerificationKeyHash]]]
+        ] = None,
+    ) -> List[TransactionWitnessSet]:
+        """Sign many transaction bodies.
+
+        Args:
+            tx_bodies (Iterable[TransactionBody]): Transaction bodies to sign.
+            key_hashes (Optional[Iterable[Optional[Collection[VerificationKeyHash]]]]): For each transaction body,
+                the verification key hashes of the keys that should sign it, or None to sign it with all keys. All
+                keys sign all bodies when not provided.
+
+        Returns:
+            List[TransactionWitnessSet]: A witness set per transaction body, in order. Witness sets of bodies that
+            no key signed have no verification key witnesses.
+        """
+        tx_bodies = list(tx_bodies)
+        selections = (
+            list(key_hashes) if key_hashes is not None else [None] * len(tx_bodies)
+        )
+        if len(selections) != len(tx_bodies):
+            raise ValueError(
+                f"Got {len(selections)} key hash selections for {len(tx_bodies)} transaction bodies."
+            )
+
+        jobs: List[_Job] = [
+            (body.hash(), self._indexes(selection))
+            for body, selection in zip(tx_bodies, selections)
+        ]
+
+        witness_sets = []
+        for (_, indexes), signatures in zip(jobs, self._run(jobs)):
+            witnesses = self._to_witnesses(indexes, signatures)
+            witness_sets.append(
+                TransactionWitnessSet(
+                    vkey_witnesses=NonEmptyOrderedSet(witnesses) if witnesses else None
+                )
+            )
+        return witness_sets
+
+    def _indexes(
+        self, key_hashes: Optional[Collection[VerificationKeyHash]]
+    ) -> Tuple[int, ...]:
+        if key_hashes is None:
+            return tuple(range(len(self.signing_keys)))
+        return tuple(
+            i
+            for i, vkey_hash in enumerate(self._vkey_hashes)
+            if vkey_hash in key_hashes
+        )
+
+    def _to_witnesses(
+        self, indexes: Sequence[int], signatures: Sequence[bytes]
+    ) -> List[VerificationKeyWitness]:
+        return [
+            VerificationKeyWitness(self._vkeys[i], signature)
+            for i, signature in zip(indexes, signatures)
+        ]
+
+    def _run(self, jobs: List[_Job]) -> List[List[bytes]]:
+        if self.executor is None or len(jobs) <= self.chunk_size:
+            return _run_jobs(self.signing_keys, jobs)
+
+        chunks = [
+            jobs[i : i + self.chunk_size] for i in range(0, len(jobs), self.chunk_size)
+        ]
+        futures = [
+            self.executor.submit(_run_jobs, self.signing_keys, chunk)
+            for chunk in chunks
+        ]
+        return [signatures for future in futures for signatures in future.result()]
+
+
+@dataclass
+class SignatureVerification:
+    """Outcome of verifying the verification key witnesses of a transaction."""
+
+    valid: List[bool] = field(default_factory=list)
+    """Whether each verification key witness holds a valid signature, in witness order"""
+
+    missing: Set[VerificationKeyHash] = field(default_factory=set)
+    """Required verification key hashes not covered by a valid witness"""
+
+    unsatisfied_scripts: List[NativeScript] = field(default_factory=list)
+    """Native scripts of the witness set not satisfied by the valid witnesses and the validity interval"""
+
+    @property
+    def ok(self) -> bool:
+        """bool: Whether all signatures are valid, all required keys signed and all native scripts are satisfied."""
+        return all(self.valid) and not self.missing and not self.unsatisfied_scripts
+
+
+def _verify(tx_hash: bytes, vkey: bytes, signature: bytes) -> bool:
+    try:
+        VerifyKey(vkey).verify(tx_hash, signature)
+    except (CryptoError, ValueError, TypeError):
+        return False
+    return True
+
+
+def _verify_chunk(tx_hash: bytes, pairs: Sequence[Tuple[bytes, bytes]]) -> List[bool]:
+    return [_verify(tx_hash, vkey, signature) for vkey, signature in pairs]
+
+
+def verify_signatures(
+    transaction: Transaction,
+    utxos: Iterable[UTxO] = (),
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+) -> SignatureVerification:
+    """Verify all verification key witnesses of a transaction against its body.
+
+    The body is hashed once. Signatures are checked in the calling thread, or in chunks on an executor when one is
+    given and there are more witnesses than `chunk_size`.
+
+    Args:
+        transaction (Transaction): The signed transaction.
+        utxos (Iterable[UTxO]): The UTxOs spent by the transaction (inputs and collateral). A transaction only
+            references them, so they are needed to tell which payment keys must sign it. See
+            :func:`required_vkey_hashes`.
+        executor (Optional[Executor]): A :class:`concurrent.futures.ThreadPoolExecutor` or
+            :class:`concurrent.futures.ProcessPoolExecutor` to verify with.
+        chunk_size (int): Number of witnesses handed to the executor at a time.
+
+    Returns:
+        SignatureVerification: Per-witness results and required keys that did not sign.
+    """
+    tx_hash = transaction.transaction_body.hash()
+    witnesses = list(transaction.transaction_witness_set.vkey_witnesses or [])
+    pairs = [(w.vkey.payload, w.signature) for w in witnesses]
+
+    if executor is None or len(pairs) <= chunk_size:
+        valid = _verify_chunk(tx_hash, pairs)
+    else:
+        futures = [
+            executor.submit(_verify_chunk, tx_hash, pairs[i : i + chunk_size])
+            for i in range(0, len(pairs), chunk_size)
+        ]
+        valid = [result for future in futures for result in future.result()]
+
+    signed = {w.vkey.hash() for w, ok in zip(witnesses, valid) if ok}
+    body = transaction.transaction_body
+    return SignatureVerification(
+        valid=valid,
+        missing=required_vkey_hashes(transaction, utxos) - signed,
+        unsatisfied_scripts=[
+            script
+            for script in transaction.transaction_witness_set.native_scripts or []
+            if not native_script_satisfied(
+                script, signed, body.validity_start, body.ttl
+            )
+        ],
+    )
+
+
+def required_vkey_hashes(
+    transaction: Transaction, utxos: Iterable[UTxO] = ()
+) -> Set[VerificationKeyHash]:
+    """Verification key hashes whose signatures a transaction needs.
+
+    Covers required signers, certificates, withdrawals and votes, as well as payment keys of the given spent UTxOs.
+    Native scripts don't require specific keys, only enough of them to be satisfied: see
+    :func:`native_script_satisfied`.
+
+    Args:
+        transaction (Transaction): The transaction.
+        utxos (Iterable[UTxO]): The UTxOs spent by the transaction (inputs and collateral).
+
+    Returns:
+        Set[VerificationKeyHash]: The required verification key hashes.
+    """
+    body = transaction.transaction_body
+    vkey_hashes = utxo_vkey_hashes(utxos)
+    vkey_hashes.update(body.required_signers or [])
+    vkey_hashes.update(certificate_vkey_hashes(body.certificates or []))
+    vkey_hashes.update(withdrawal_vkey_hashes(body.withdraws or {}))
+    vkey_hashes.update(voter_vkey_hashes(body.voting_procedures or {}))
+    return vkey_hashes
+
+
+def utxo_vkey_hashes(utxos: Iterable[UTxO]) -> Set[VerificationKeyHash]:
+    results = set()
+    for utxo in utxos:
+        if isinstance(utxo.output.address.payment_part, VerificationKeyHash):
+            results.add(utxo.output.address.payment_part)
+    return results
+
+
+def certificate_vkey_hashes(
+    certificates: Iterable[Certificate],
+) -> Set[VerificationKeyHash]:
+    results = set()
+
+    def _check_and_add_vkey(stake_credential: StakeCredential):
+        if isinstance(stake_credential.credential, VerificationKeyHash):
+            results.add(stake_credential.credential)
+
+    for cert in certificates:
+        if isinstance(
+            cert,
+            (
+                StakeRegistration,
+                StakeDeregistration,
+                StakeDelegation,
+                StakeRegistrationConway,
+                StakeDeregistrationConway,
+                VoteDelegation,
+                StakeAndVoteDelegation,
+                StakeRegistrationAndDelegation,
+                StakeRegistrationAndVoteDelegation,
+                StakeRegistrationAndDelegationAndVoteDelegation,
+            ),
+        ):
+            _check_and_add_vkey(cert.stake_credential)
+        elif isinstance(cert, RegDRepCert):
+            _check_and_add_vkey(cert.drep_credential)
+        elif isinstance(cert, PoolRegistration):
+            results.add(cert.pool_params.operator)
+        elif isinstance(cert, PoolRetirement):
+            results.add(cert.pool_keyhash)
+    return results
+
+
+def withdrawal_vkey_hashes(
+    withdrawals: Mapping[bytes, int],
+) -> Set[VerificationKeyHash]:
+    results = set()
+    for k in withdrawals:
+        address = Address.from_primitive(k)
+        if address.address_type == AddressType.NONE_KEY:
+            results.add(address.staking_part)
+    return results
+
+
+def native_script_vkey_hashes(
+    scripts: Iterable[NativeScript],
+) -> Set[VerificationKeyHash]:
+    """Verification key hashes that may sign for native scripts, e.g. to estimate the witnesses of a transaction.
+
+    Args:
+        scripts (Iterable[NativeScript]): The native scripts.
+
+    Returns:
+        Set[VerificationKeyHash]: Hashes of all the keys the scripts refer to.
+    """
+    results = set()
+
+    def _dfs(script: NativeScript):
+        if isinstance(script, ScriptPubkey):
+            results.add(script.key_hash)
+        elif isinstance(script, (ScriptAll, ScriptAny, ScriptNofK)):
+            for s in script.native_scripts:
+                _dfs(s)
+
+    for script in scripts:
+        _dfs(script)
+    return results
+
+
+def native_script_satisfied(
+    script: NativeScript,
+    vkey_hashes: Collection[VerificationKeyHash],
+    validity_start: Optional[int] = None,
+    ttl: Optional[int] = None,
+) -> bool:
+    """Whether a native script is satisfied by a transaction.
+
+    Args:
+        script (NativeScript): The native script.
+        vkey_hashes (Collection[VerificationKeyHash]): Hashes of the keys that signed the transaction.
+        validity_start (Optional[int]): First slot the transaction is valid in.
+        ttl (Optional[int]): Slot from which the transaction is no longer valid.
+
+    Returns:
+        bool: Whether the script is satisfied.
+    """
+
+    def _satisfied(script: NativeScript) -> bool:
+        if isinstance(script, ScriptPubkey):
+            return script.key_hash in vkey_hashes
+        elif isinstance(script, ScriptAll):
+            return all(_satisfied(s) for s in script.native_scripts)
+        elif isinstance(script, ScriptAny):
+            return any(_satisfied(s) for s in script.native_scripts)
+        elif isinstance(script, ScriptNofK):
+            return sum(_satisfied(s) for s in script.native_scripts) >= script.n
+        elif isinstance(script, InvalidBefore):
+            return validity_start is not None and validity_start >= script.before
+        elif isinstance(script, InvalidHereAfter):
+            return ttl is not None and ttl <= script.after
+        return False
+
+    return _satisfied(script)
+
+
+def voter_vkey_hashes(voters: Iterable[Voter]) -> Set[VerificationKeyHash]:
+    results = set()
+    for voter in voters:
+        if isinstance(voter.credential, VerificationKeyHash):
+            results.add(voter.credential)
+    return results
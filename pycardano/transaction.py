@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
+from array import array
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any, Callable, List, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from cbor2 import CBORTag
 from nacl.encoding import RawEncoder
@@ -14,9 +27,14 @@ from pprintpp import pformat
 from pycardano.address import Address
 from pycardano.cbor import cbor2
 from pycardano.certificate import Certificate
-from pycardano.exception import InvalidDataException
+from pycardano.exception import (
+    DeserializeException,
+    InvalidDataException,
+    InvalidOperationException,
+)
 from pycardano.governance import ProposalProcedure, VotingProcedures
 from pycardano.hash import (
+    SCRIPT_HASH_SIZE,
     TRANSACTION_HASH_SIZE,
     AuxiliaryDataHash,
     ConstrainedBytes,
@@ -43,7 +61,7 @@ from pycardano.serialization import (
     limit_primitive_type,
     list_hook,
 )
-from pycardano.types import typechecked
+from pycardano.types import check_type, typechecked
 from pycardano.witness import TransactionWitnessSet
 
 __all__ = [
@@ -51,6 +69,7 @@ __all__ = [
     "AssetName",
     "Asset",
     "MultiAsset",
+    "CompactMultiAsset",
     "Value",
     "TransactionOutput",
     "UTxO",
@@ -97,22 +116,32 @@ class Asset(DictCBORSerializable):
     def union(self, other: Asset) -> Asset:
         return self + other
 
+    def _combine(self, other: Optional[Asset], sign: int) -> Asset:
+        """Create a new normalized Asset with the amounts of other (multiplied by sign) added.
+
+        Asset names and amounts are immutable, so only the underlying dict is copied, and the type check of
+        each item is skipped as both operands are already valid Assets.
+        """
+        data = {n: v for n, v in self.data.items() if v != 0}
+        if other is not None:
+            _accumulate_amounts(data, other.data, sign)
+        new_asset = self.__class__()
+        new_asset.data = data
+        return new_asset
+
     def __add__(self, other: Asset) -> Asset:
-        new_asset = deepcopy(self)
-        for n in other:
-            new_asset[n] = new_asset.get(n, 0) + other[n]
-        return new_asset.normalize()
+        return self._combine(other, 1)
+
+    def __deepcopy__(self, memo):
+        # Asset names and amounts are immutable, so they can be shared by the copy.
+        return self.__class__(self.data)
 
     def __iadd__(self, other: Asset) -> Asset:
-        new_item = self + other
-        self.data = new_item.data  # type: ignore[has-type]
-        return self.normalize()
+        _accumulate_amounts(self.data, other.data, 1)
+        return self
 
     def __sub__(self, other: Asset) -> Asset:
-        new_asset = deepcopy(self)
-        for n in other:
-            new_asset[n] = new_asset.get(n, 0) - other[n]
-        return new_asset.normalize()
+        return self._combine(other, -1)
 
     def __eq__(self, other):
         if not isinstance(other, Asset):
@@ -154,10 +183,20 @@ class Asset(DictCBORSerializable):
         return res
 
     def to_shallow_primitive(self) -> dict:
-        x = deepcopy(self).normalize()
+        x = self._combine(None, 1)
         return super(self.__class__, x).to_shallow_primitive()
 
 
+def _accumulate_amounts(data: Dict[Any, int], other: Dict[Any, int], sign: int) -> None:
+    """Add the amounts of other (multiplied by sign) to data in place, removing the amounts that become zero."""
+    for n, v in list(other.items()) if other is data else other.items():
+        total = data.get(n, 0) + sign * v
+        if total != 0:
+            data[n] = total
+        else:
+            data.pop(n, None)
+
+
 @typechecked
 class MultiAsset(DictCBORSerializable):
     KEY_TYPE = ScriptHash
@@ -175,22 +214,53 @@ class MultiAsset(DictCBORSerializable):
                 self.pop(k)
         return self
 
+    def _combine(self, other: Optional[MultiAsset], sign: int) -> MultiAsset:
+        """Create a new normalized MultiAsset with the assets of other (multiplied by sign) added.
+
+        Each Asset is copied once, and is never shared with the operands, so the result can be changed in place.
+        """
+        data = {}
+        other_data = other.data if other is not None else {}
+        for p, asset in self.data.items():
+            new_asset = asset._combine(other_data.get(p), sign)
+            if new_asset:
+                data[p] = new_asset
+        for p, asset in other_data.items():
+            if p not in self.data:
+                new_asset = Asset()._combine(asset, sign)
+                if new_asset:
+                    data[p] = new_asset
+        new_multi_asset = self.__class__()
+        new_multi_asset.data = data
+        return new_multi_asset
+
+    def _accumulate(self, other: MultiAsset, sign: int) -> MultiAsset:
+        # Assets that change are replaced rather than changed in place, as they could be shared with other objects.
+        for p, asset in list(other.data.items()):
+            current = self.data.get(p)
+            new_asset = (
+                current._combine(asset, sign)
+                if current is not None
+                else Asset()._combine(asset, sign)
+            )
+            if new_asset:
+                self.data[p] = new_asset
+            else:
+                self.data.pop(p, None)
+        return self
+
     def __add__(self, other):
-        new_multi_asset = deepcopy(self)
-        for p in other:
-            new_multi_asset[p] = new_multi_asset.get(p, Asset()) + other[p]
-        return new_multi_asset.normalize()
+        return self._combine(other, 1)
+
+    def __deepcopy__(self, memo):
+        # Policy ids are immutable, so only the assets are copied.
+        return self.__class__({p: deepcopy(a, memo) for p, a in self.data.items()})
 
     def __iadd__(self, other):
-        new_item = self + other
-        self.data = new_item.data
-        return self.normalize()
+        return self._accumulate(other, 1)
 
     def __sub__(self, other: MultiAsset) -> MultiAsset:
-        new_multi_asset = deepcopy(self)
-        for p in other:
-            new_multi_asset[p] = new_multi_asset.get(p, Asset()) - other[p]
-        return new_multi_asset.normalize()
+        return self._combine(other, -1)
 
     def __eq__(self, other):
         if not isinstance(other, MultiAsset):
@@ -239,12 +309,12 @@ class MultiAsset(DictCBORSerializable):
         """
         new_multi_asset = MultiAsset()
 
-        for p in self:
-            for n in self[p]:
-                if criteria(p, n, self[p][n]):
-                    if p not in new_multi_asset:
-                        new_multi_asset[p] = Asset()
-                    new_multi_asset[p][n] = self[p][n]
+        for p, asset in self.data.items():
+            kept = {n: v for n, v in asset.data.items() if criteria(p, n, v)}
+            if kept:
+                new_asset = Asset()
+                new_asset.data = kept
+                new_multi_asset.data[p] = new_asset
 
         return new_multi_asset
 
@@ -277,9 +347,385 @@ class MultiAsset(DictCBORSerializable):
         return res
 
     def to_shallow_primitive(self) -> dict:
-        x = deepcopy(self).normalize()
+        x = self._combine(None, 1)
         return super(self.__class__, x).to_shallow_primitive()
 
+    def compact(self) -> CompactMultiAsset:
+        """Create a :class:`CompactMultiAsset` with the same assets."""
+        return CompactMultiAsset(self)
+
+
+_PolicyAssets = Tuple[bytes, List[bytes], Sequence[int]]
+"""Policy id, and the names and amounts of the assets under the policy, in canonical order."""
+
+
+def _canonical_name_key(name: bytes) -> Tuple[int, bytes]:
+    # Canonical CBOR order of byte string keys: shorter keys first, then bytewise.
+    return len(name), name
+
+
+def _sorted_policy_assets(
+    policy_id: bytes, amounts: Dict[bytes, int]
+) -> Optional[_PolicyAssets]:
+    """Sort the assets of a policy in canonical order, and drop zero amounts."""
+    names = sorted((n for n, a in amounts.items() if a != 0), key=_canonical_name_key)
+    if not names:
+        return None
+    return policy_id, names, [amounts[n] for n in names]
+
+
+def _combine_policy_assets(
+    policy_id: bytes,
+    a: Optional[_PolicyAssets],
+    b: Optional[_PolicyAssets],
+    sign: int,
+) -> Optional[_PolicyAssets]:
+    """Add the assets of a policy in b (multiplied by sign) to the ones in a."""
+    if b is None:
+        return a
+    if a is None:
+        return policy_id, b[1], [sign * v for v in b[2]]
+    if a[1] == b[1]:
+        # Same assets on both sides, amounts can be added element-wise.
+        amounts = [x + sign * y for x, y in zip(a[2], b[2])]
+        if all(amounts):
+            return policy_id, a[1], amounts
+        kept = [(n, v) for n, v in zip(a[1], amounts) if v != 0]
+        if not kept:
+            return None
+        return policy_id, [n for n, _ in kept], [v for _, v in kept]
+    merged = dict(zip(a[1], a[2]))
+    for n, v in zip(b[1], b[2]):
+        merged[n] = merged.get(n, 0) + sign * v
+    return _sorted_policy_assets(policy_id, merged)
+
+
+def _merge_policies(
+    a: List[_PolicyAssets], b: List[_PolicyAssets]
+) -> Iterator[Tuple[bytes, Optional[_PolicyAssets], Optional[_PolicyAssets]]]:
+    """Merge two lists of policies sorted by policy id.
+
+    Yields:
+        Policy id, and the assets of the policy in a and b (None if the policy is absent).
+    """
+    i, j = 0, 0
+    while i < len(a) or j < len(b):
+        if j == len(b) or (i < len(a) and a[i][0] < b[j][0]):
+            yield a[i][0], a[i], None
+            i += 1
+        elif i == len(a) or b[j][0] < a[i][0]:
+            yield b[j][0], None, b[j]
+            j += 1
+        else:
+            yield a[i][0], a[i], b[j]
+            i += 1
+            j += 1
+
+
+def _policy_assets_le(a: Optional[_PolicyAssets], b: Optional[_PolicyAssets]) -> bool:
+    """Whether all assets in a are also in b, with greater or equal amounts in b."""
+    if a is None:
+        return True
+    if b is None:
+        return False
+    if a[1] == b[1]:
+        return all(x <= y for x, y in zip(a[2], b[2]))
+    b_amounts = dict(zip(b[1], b[2]))
+    return all(n in b_amounts and x <= b_amounts[n] for n, x in zip(a[1], a[2]))
+
+
+def _read_policy_assets(multi_asset: CompactMultiAsset, index: int) -> _PolicyAssets:
+    """Read the assets of the policy at index from the buffers of a :class:`CompactMultiAsset`."""
+    start, end = (
+        multi_asset._policy_bounds[index],
+        multi_asset._policy_bounds[index + 1],
+    )
+    names, name_bounds = multi_asset._names, multi_asset._name_bounds
+    return (
+        multi_asset._policy_ids[
+            index * SCRIPT_HASH_SIZE : (index + 1) * SCRIPT_HASH_SIZE
+        ],
+        [names[name_bounds[i] : name_bounds[i + 1]] for i in range(start, end)],
+        multi_asset._amounts[start:end],
+    )
+
+
+@typechecked
+class CompactMultiAsset(MultiAsset):
+    """An immutable :class:`MultiAsset` that stores its assets in contiguous buffers.
+
+    Policy ids are stored in one bytes buffer, asset names in another, and amounts in an int64 array (or in a list
+    when some amount does not fit in an int64). Assets are kept sorted in the canonical CBOR order of their keys, so
+    they can be serialized without sorting, and operations between two compact multi-assets merge policies in order
+    and add or compare the amounts of a policy element-wise when both sides hold the same assets. Compared to a
+    :class:`MultiAsset`, which holds a :class:`ScriptHash` and an :class:`Asset` per policy, and an
+    :class:`AssetName` per asset, it takes a fraction of the memory for wallets holding thousands of tokens.
+
+    It supports the same read operations as :class:`MultiAsset`. Since it is immutable, ``+=`` creates a new object,
+    indexing by policy id returns a copy of the assets under the policy, and item assignment raises
+    :class:`InvalidOperationException`. Assets with zero amount are never stored.
+
+    Examples:
+        >>> multi_asset = CompactMultiAsset.from_primitive({b"1" * 28: {b"Token1": 1, b"Token2": 0}})
+        >>> multi_asset
+        {ScriptHash(hex='31313131313131313131313131313131313131313131313131313131'): {AssetName(b'Token1'): 1}}
+        >>> multi_asset + MultiAsset.from_primitive({b"1" * 28: {b"Token1": 2}}) == MultiAsset.from_primitive(
+        ...     {b"1" * 28: {b"Token1": 3}})
+        True
+    """
+
+    def __init__(self, *args, **kwargs):
+        policies = []
+        for policy_id, asset in dict(*args, **kwargs).items():
+            check_type(policy_id, self.KEY_TYPE)
+            check_type(asset, self.VALUE_TYPE)
+            policy = _sorted_policy_assets(
+                policy_id.payload, {n.payload: v for n, v in asset.items()}
+            )
+            if policy is not None:
+                policies.append(policy)
+        policies.sort(key=lambda x: x[0])
+        self._set_policies(policies)
+
+    def _set_policies(self, policies: List[_PolicyAssets]):
+        """Store the assets of each policy. Policies must be sorted, and have no zero amounts."""
+        policy_bounds = array("I", [0])
+        name_bounds = array("I", [0])
+        names: List[bytes] = []
+        amounts: List[int] = []
+        names_size = 0
+        for _, policy_names, policy_amounts in policies:
+            for n in policy_names:
+                names_size += len(n)
+                name_bounds.append(names_size)
+            names.extend(policy_names)
+            amounts.extend(policy_amounts)
+            policy_bounds.append(len(amounts))
+
+        self._policy_ids = b"".join(p[0] for p in policies)
+        self._policy_bounds = policy_bounds
+        self._names = b"".join(names)
+        self._name_bounds = name_bounds
+        try:
+            self._amounts: Union[array, List[int]] = array("q", amounts)
+        except OverflowError:
+            self._amounts = amounts
+
+    @classmethod
+    def _from_policies(cls, policies: List[_PolicyAssets]) -> CompactMultiAsset:
+        multi_asset = cls.__new__(cls)
+        multi_asset._set_policies(policies)
+        return multi_asset
+
+    def _policy_id(self, index: int) -> bytes:
+        return self._policy_ids[
+            index * SCRIPT_HASH_SIZE : (index + 1) * SCRIPT_HASH_SIZE
+        ]
+
+    def _policy(self, index: int) -> _PolicyAssets:
+        return _read_policy_assets(self, index)
+
+    def _policies(self) -> List[_PolicyAssets]:
+        return [_read_policy_assets(self, p) for p in range(len(self))]
+
+    def _find_policy(self, policy_id: Any) -> Optional[int]:
+        """Binary search the index of a policy id."""
+        if not isinstance(policy_id, ScriptHash):
+            return None
+        payload = policy_id.payload
+        low, high = 0, len(self)
+        while low < high:
+            mid = (low + high) // 2
+            if self._policy_id(mid) < payload:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(self) and self._policy_id(low) == payload:
+            return low
+        return None
+
+    def _policy_asset(self, index: int) -> Asset:
+        _, names, amounts = self._policy(index)
+        asset = Asset()
+        asset.data = {AssetName(n): v for n, v in zip(names, amounts)}
+        return asset
+
+    @staticmethod
+    def _policies_of(other: MultiAsset) -> List[_PolicyAssets]:
+        if not isinstance(other, CompactMultiAsset):
+            other = CompactMultiAsset(other)
+        return other._policies()
+
+    @property
+    def data(self) -> Dict[ScriptHash, Asset]:  # type: ignore[override]
+        """A new dict of all assets by policy id."""
+        return {
+            ScriptHash(self._policy_id(p)): self._policy_asset(p)
+            for p in range(len(self))
+        }
+
+    def __len__(self):
+        return len(self._policy_bounds) - 1
+
+    def __iter__(self):
+        return (ScriptHash(self._policy_id(p)) for p in range(len(self)))
+
+    def __contains__(self, policy_id: Any) -> bool:
+        return self._find_policy(policy_id) is not None
+
+    def __getitem__(self, policy_id: ScriptHash) -> Asset:
+        index = self._find_policy(policy_id)
+        if index is None:
+            raise KeyError(policy_id)
+        return self._policy_asset(index)
+
+    def get(self, policy_id: ScriptHash, default: Any = None) -> Any:
+        index = self._find_policy(policy_id)
+        return default if index is None else self._policy_asset(index)
+
+    def keys(self) -> List[ScriptHash]:
+        return list(self)
+
+    def values(self) -> List[Asset]:
+        return [self._policy_asset(p) for p in range(len(self))]
+
+    def items(self) -> List[Tuple[ScriptHash, Asset]]:
+        return list(self.data.items())
+
+    def __setitem__(self, key: Any, value: Any):
+        raise InvalidOperationException(f"{self.__class__.__name__} is immutable.")
+
+    def __delitem__(self, key: Any):
+        raise InvalidOperationException(f"{self.__class__.__name__} is immutable.")
+
+    def pop(self, key: Any, *args):
+        raise InvalidOperationException(f"{self.__class__.__name__} is immutable.")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def copy(self) -> CompactMultiAsset:
+        return self
+
+    def __reduce__(self):
+        return self.__class__.from_primitive, (self.to_shallow_primitive(),)
+
+    def __eq__(self, other):
+        if isinstance(other, CompactMultiAsset):
+            return (
+                self._policy_ids == other._policy_ids
+                and self._policy_bounds == other._policy_bounds
+                and self._names == other._names
+                and self._name_bounds == other._name_bounds
+                and list(self._amounts) == list(other._amounts)
+            )
+        elif isinstance(other, MultiAsset):
+            return self == CompactMultiAsset(other)
+        return False
+
+    def __le__(self, other: MultiAsset) -> bool:
+        return all(
+            _policy_assets_le(a, b)
+            for _, a, b in _merge_policies(self._policies(), self._policies_of(other))
+        )
+
+    def __ge__(self, other: MultiAsset) -> bool:
+        return all(
+            _policy_assets_le(b, a)
+            for _, a, b in _merge_policies(self._policies(), self._policies_of(other))
+        )
+
+    def normalize(self) -> CompactMultiAsset:
+        return self
+
+    def _combine(self, other: Optional[MultiAsset], sign: int) -> CompactMultiAsset:
+        if other is None:
+            return self
+        policies: List[_PolicyAssets] = []
+        for policy_id, a, b in _merge_policies(
+            self._policies(), self._policies_of(other)
+        ):
+            policy = _combine_policy_assets(policy_id, a, b, sign)
+            if policy is not None:
+                policies.append(policy)
+        return self._from_policies(policies)
+
+    def _accumulate(self, other: MultiAsset, sign: int) -> CompactMultiAsset:
+        return self._combine(other, sign)
+
+    def _filter_policies(self, criteria: Callable) -> List[_PolicyAssets]:
+        policies: List[_PolicyAssets] = []
+        for policy_id, names, amounts in self._policies():
+            script_hash = ScriptHash(policy_id)
+            kept = [
+                (n, v)
+                for n, v in zip(names, amounts)
+                if criteria(script_hash, AssetName(n), v)
+            ]
+            if kept:
+                policies.append((policy_id, [n for n, _ in kept], [v for _, v in kept]))
+        return policies
+
+    def filter(
+        self, criteria=Callable[[ScriptHash, AssetName, int], bool]
+    ) -> CompactMultiAsset:
+        """Filter items by criteria.
+
+        Args:
+            criteria: A function that takes in three input arguments (policy_id, asset_name, amount) and returns a
+                bool. If returned value is True, then the asset will be kept, otherwise discarded.
+
+        Returns:
+            A new filtered CompactMultiAsset object.
+        """
+        return self._from_policies(self._filter_policies(criteria))
+
+    def count(self, criteria=Callable[[ScriptHash, AssetName, int], bool]) -> int:
+        """Count number of distinct assets that satisfy a certain criteria.
+
+        Args:
+            criteria: A function that takes in three input arguments (policy_id, asset_name, amount) and returns a
+                bool.
+
+        Returns:
+            int: Total number of distinct assets that satisfy the criteria.
+        """
+        return sum(len(p[1]) for p in self._filter_policies(criteria))
+
+    def to_multi_asset(self) -> MultiAsset:
+        """Create a (mutable) :class:`MultiAsset` with the same assets."""
+        return MultiAsset(self.data)
+
+    def to_shallow_primitive(self) -> dict:
+        # Assets are already sorted in canonical order.
+        return {
+            policy_id: dict(zip(names, amounts))
+            for policy_id, names, amounts in self._policies()
+        }
+
+    @classmethod
+    @limit_primitive_type(dict)
+    def from_primitive(cls: Type[DictBase], value: dict) -> DictBase:
+        policies = []
+        for policy_id, asset in value.items():
+            if not isinstance(policy_id, bytes) or len(policy_id) != SCRIPT_HASH_SIZE:
+                raise DeserializeException(f"Invalid policy id: {policy_id}")
+            if not isinstance(asset, dict) or not all(
+                isinstance(n, bytes)
+                and len(n) <= AssetName.MAX_SIZE
+                and isinstance(v, int)
+                for n, v in asset.items()
+            ):
+                raise DeserializeException(f"Invalid assets: {asset}")
+            policy = _sorted_policy_assets(policy_id, asset)
+            if policy is not None:
+                policies.append(policy)
+        policies.sort(key=lambda x: x[0])
+        return cls._from_policies(policies)  # type: ignore[attr-defined]
+
 
 @typechecked
 @dataclass(repr=False)
@@ -299,11 +745,44 @@ class Value(ArrayCBORSerializable):
         return Value(self.coin + other.coin, self.multi_asset + other.multi_asset)
 
     def __iadd__(self, other: Union[Value, int]):
-        new_item = self + other
-        self.coin = new_item.coin
-        self.multi_asset = new_item.multi_asset
+        if isinstance(other, int):
+            self.coin += other
+        else:
+            self.coin += other.coin
+            if other.multi_asset:
+                self.multi_asset = self.multi_asset + other.multi_asset
         return self
 
+    @classmethod
+    def sum(cls, values: Iterable[Union[Value, int]]) -> Value:
+        """Add up values, in time linear to the total number of assets in the values.
+
+        Amounts are added up in plain dicts, and the resulting assets are only created once, whereas adding values
+        one at a time copies the assets added up so far on each addition.
+
+        Args:
+            values (Iterable[Union[Value, int]]): Values (or amounts of lovelace) to add up.
+
+        Returns:
+            Value: The sum of all values.
+        """
+        coin = 0
+        amounts: Dict[ScriptHash, Dict[AssetName, int]] = {}
+        for value in values:
+            if isinstance(value, int):
+                coin += value
+                continue
+            coin += value.coin
+            for p, asset in value.multi_asset.data.items():
+                _accumulate_amounts(amounts.setdefault(p, {}), asset.data, 1)
+        multi_asset = MultiAsset()
+        for p, data in amounts.items():
+            if data:
+                asset = Asset()
+                asset.data = data
+                multi_asset.data[p] = asset
+        return cls(coin, multi_asset)
+
     def __sub__(self, other: Union[Value, int]) -> Value:
         if isinstance(other, int):
             other = Value(other)
@@ -484,7 +963,9 @@ class TransactionOutput(CBORSerializable):
     def lovelace(self) -> int:
         return self.amount.coin
 
-    def to_primitive(self) -> Primitive:
+    def to_shallow_primitive(
+        self,
+    ) -> Union[_TransactionOutputPostAlonzo, _TransactionOutputLegacy]:
         if self.datum or self.script or self.post_alonzo:
             datum = (
                 _DatumOption(self.datum_hash or self.datum)
@@ -496,11 +977,9 @@ class TransactionOutput(CBORSerializable):
             )
             return _TransactionOutputPostAlonzo(
                 self.address, self.amount, datum, script_ref
-            ).to_primitive()
+            )
         else:
-            return _TransactionOutputLegacy(
-                self.address, self.amount, self.datum_hash
-            ).to_primitive()
+            return _TransactionOutputLegacy(self.address, self.amount, self.datum_hash)
 
     @classmethod
     def from_primitive(
@@ -1,28 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+from concurrent.futures import Executor
 from copy import deepcopy
 from dataclasses import dataclass, field, fields
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
+
+from cbor2 import dumps
 
 from pycardano import RedeemerMap
-from pycardano.address import Address, AddressType
-from pycardano.backend.base import ChainContext
+from pycardano.address import Address
+from pycardano.backend.base import (
+    AsyncChainContext,
+    ChainContext,
+    GenesisParameters,
+    ProtocolParameters,
+)
 from pycardano.certificate import (
     Certificate,
     PoolRegistration,
-    PoolRetirement,
     RegDRepCert,
-    StakeAndVoteDelegation,
-    StakeCredential,
-    StakeDelegation,
-    StakeDeregistration,
-    StakeDeregistrationConway,
     StakeRegistration,
     StakeRegistrationAndDelegation,
     StakeRegistrationAndDelegationAndVoteDelegation,
     StakeRegistrationAndVoteDelegation,
     StakeRegistrationConway,
-    VoteDelegation,
 )
 from pycardano.coinselection import (
     LargestFirstSelector,
@@ -51,7 +55,8 @@ from pycardano.hash import DatumHash, ScriptDataHash, ScriptHash, VerificationKe
 from pycardano.key import ExtendedSigningKey, SigningKey, VerificationKey
 from pycardano.logging import log_state, logger
 from pycardano.metadata import AuxiliaryData
-from pycardano.nativescript import NativeScript, ScriptAll, ScriptAny, ScriptPubkey
+from pycardano.nativescript import NativeScript
+from pycardano.network import Network
 from pycardano.plutus import (
     CostModels,
     Datum,
@@ -69,7 +74,20 @@ from pycardano.plutus import (
     datum_hash,
     script_hash,
 )
-from pycardano.serialization import NonEmptyOrderedSet, OrderedSet
+from pycardano.serialization import (
+    DictCBORSerializable,
+    NonEmptyOrderedSet,
+    OrderedSet,
+    default_encoder,
+)
+from pycardano.signing import (
+    BatchSigner,
+    certificate_vkey_hashes,
+    native_script_vkey_hashes,
+    utxo_vkey_hashes,
+    voter_vkey_hashes,
+    withdrawal_vkey_hashes,
+)
 from pycardano.transaction import (
     Asset,
     AssetName,
@@ -98,6 +116,278 @@ FAKE_TX_SIGNATURE = bytes.fromhex(
 )
 
 
+def _cbor_head_size(argument: int) -> int:
+    """Size of the head of a CBOR data item, given its argument (an unsigned int, or the length of a container)."""
+    if argument < 24:
+        return 1
+    elif argument < 2**8:
+        return 2
+    elif argument < 2**16:
+        return 3
+    elif argument < 2**32:
+        return 5
+    return 9
+
+
+def _cbor_size(value: Any) -> int:
+    return len(dumps(value, default=default_encoder))
+
+
+@lru_cache(maxsize=None)
+def _fake_vkey_witness(index: int) -> VerificationKeyWitness:
+    # Convert index to 32 bytes and use AND operation to create unique keys
+    i_bytes = index.to_bytes(32, "big")
+    unique_vkey = VerificationKey.from_primitive(
+        bytes(x & y for x, y in zip(FAKE_VKEY.payload, i_bytes))
+    )
+    unique_sig = bytes(
+        x & y
+        for x, y in zip(FAKE_TX_SIGNATURE, i_bytes + i_bytes)  # 64 bytes for signature
+    )
+    return VerificationKeyWitness(unique_vkey, unique_sig)
+
+
+@lru_cache(maxsize=None)
+def _fake_vkey_witnesses_size(count: int) -> int:
+    return _cbor_size(NonEmptyOrderedSet([_fake_vkey_witness(i) for i in range(count)]))
+
+
+class _TransactionSizeModel:
+    """Estimates the encoded size of a transaction from the encoded sizes of its components.
+
+    The sizes of transaction outputs, witness set fields and auxiliary data are remembered, so a transaction can be
+    re-measured after its fee, change outputs, selected inputs or execution units change without encoding the parts
+    that did not change. Sizes are remembered by object identity, and are only valid while these objects are not
+    modified in place, which is why the model is reset at the start of each :meth:`TransactionBuilder.build`. The
+    execution units of redeemers, which are set in place once evaluated, are compared by value. The size of the fee is
+    calculated, and the sizes of inputs are taken from the encoded items the input set already holds.
+    """
+
+    def __init__(self):
+        self._output_sizes: Dict[int, Tuple[Tuple[Any, ...], int]] = {}
+        self._witness_sizes: Dict[int, Tuple[Tuple[Any, ...], int]] = {}
+        self._auxiliary_data_size: Optional[Tuple[Tuple[Any, ...], int]] = None
+
+    @staticmethod
+    def _same_state(state: Tuple[Any, ...], cached: Tuple[Any, ...]) -> bool:
+        return len(state) == len(cached) and all(
+            a is b or (type(a) is int and a == b) for a, b in zip(state, cached)
+        )
+
+    def output_size(self, output: TransactionOutput) -> int:
+        amount = output.amount
+        state = (
+            output,
+            output.address,
+            amount,
+            amount.coin if isinstance(amount, Value) else None,
+            amount.multi_asset if isinstance(amount, Value) else None,
+            output.datum_hash,
+            output.datum,
+            output.script,
+            output.post_alonzo,
+        )
+        cached = self._output_sizes.get(id(output))
+        if cached is None or not self._same_state(state, cached[0]):
+            cached = (state, _cbor_size(output))
+            self._output_sizes[id(output)] = cached
+        return cached[1]
+
+    def witness_field_size(self, key: int, value: Any) -> int:
+        if not isinstance(value, (list, OrderedSet, dict, DictCBORSerializable)):
+            return _cbor_size(value)
+        # Witness sets are rebuilt for each estimate, but hold the same scripts, datums and redeemers.
+        state: List[Any] = [
+            type(value),
+            getattr(value, "_use_tag", None),
+            getattr(value, "_is_indefinite_list", None),
+        ]
+        items = (
+            value.items()
+            if isinstance(value, (dict, DictCBORSerializable))
+            else ((None, item) for item in value)
+        )
+        for redeemer_key, item in items:
+            if isinstance(redeemer_key, RedeemerKey):
+                state += [redeemer_key.tag, redeemer_key.index]
+            if isinstance(item, Redeemer):
+                state += [item.tag, item.index]
+            if isinstance(item, (Redeemer, RedeemerValue)):
+                ex_units = item.ex_units
+                state += [
+                    item.data,
+                    ex_units,
+                    ex_units.mem if ex_units is not None else None,
+                    ex_units.steps if ex_units is not None else None,
+                ]
+            else:
+                state.append(item)
+        cached = self._witness_sizes.get(key)
+        if cached is None or not self._same_state(tuple(state), cached[0]):
+            cached = (tuple(state), _cbor_size(value))
+            self._witness_sizes[key] = cached
+        return cached[1]
+
+    def auxiliary_data_size(self, auxiliary_data: Optional[AuxiliaryData]) -> int:
+        state = (
+            auxiliary_data,
+            auxiliary_data.data if auxiliary_data is not None else None,
+        )
+        cached = self._auxiliary_data_size
+        if cached is None or not self._same_state(state, cached[0]):
+            cached = (state, _cbor_size(auxiliary_data))
+            self._auxiliary_data_size = cached
+        return cached[1]
+
+    def field_size(self, key: int, value: Any) -> int:
+        if key == 0 and type(value) is OrderedSet and not value._is_indefinite_list:
+            # Transaction inputs, with the optional set tag (258) which takes 3 bytes
+            return (
+                (3 if value._use_tag else 0)
+                + _cbor_head_size(len(value))
+                + sum(len(i) for i in value._dict)
+            )
+        elif key == 1 and type(value) is list:
+            return _cbor_head_size(len(value)) + sum(self.output_size(o) for o in value)
+        elif key == 2 and isinstance(value, int):
+            return _cbor_head_size(value)
+        return _cbor_size(value)
+
+    def transaction_size(
+        self,
+        tx_body: TransactionBody,
+        witness_set: TransactionWitnessSet,
+        vkey_witness_count: int,
+        auxiliary_data: Optional[AuxiliaryData],
+    ) -> int:
+        """Estimate the size of a valid transaction.
+
+        Args:
+            tx_body (TransactionBody): Transaction body.
+            witness_set (TransactionWitnessSet): Witness set, without verification key witnesses.
+            vkey_witness_count (int): Number of (fake) verification key witnesses to include in the witness set.
+            auxiliary_data (Optional[AuxiliaryData]): Auxiliary data.
+
+        Returns:
+            int: Size of the transaction in bytes.
+        """
+        body = cast(Dict[int, Any], tx_body.to_shallow_primitive())
+        body_size = _cbor_head_size(len(body)) + sum(
+            _cbor_head_size(k) + self.field_size(k, v) for k, v in body.items()
+        )
+
+        witnesses = cast(Dict[int, Any], witness_set.to_shallow_primitive())
+        if vkey_witness_count > 0:
+            witnesses.pop(0, None)
+        witness_set_size = _cbor_head_size(
+            len(witnesses) + (vkey_witness_count > 0)
+        ) + sum(
+            _cbor_head_size(k) + self.witness_field_size(k, v)
+            for k, v in witnesses.items()
+        )
+        if vkey_witness_count > 0:
+            witness_set_size += _cbor_head_size(0) + _fake_vkey_witnesses_size(
+                vkey_witness_count
+            )
+
+        # A transaction is an array of 4 items: body, witness set, validity flag and auxiliary data (or null)
+        return (
+            1
+            + body_size
+            + witness_set_size
+            + 1
+            + self.auxiliary_data_size(auxiliary_data)
+        )
+
+
+class _PrefetchedChainContext(ChainContext):
+    """A :class:`ChainContext` serving query results prefetched from an :class:`AsyncChainContext`.
+
+    Used by :meth:`TransactionBuilder.build_async` to run the blocking build off the event loop. Queries that were not
+    prefetched, such as transaction evaluation, are sent to the async context on the event loop, and wait for it.
+    """
+
+    def __init__(self, context: AsyncChainContext, loop: asyncio.AbstractEventLoop):
+        self._context = context
+        self._loop = loop
+        self._values: Dict[str, Any] = {}
+        self._utxos_by_address: Dict[str, List[UTxO]] = {}
+        self._utxos_by_addresses: Dict[Tuple[str, ...], List[UTxO]] = {}
+
+    async def prefetch(
+        self,
+        queries: List[str],
+        addresses: List[str],
+        utxo_addresses: Optional[List[str]] = None,
+    ):
+        """Run queries concurrently, and keep their results.
+
+        Args:
+            queries (List[str]): Names of parameterless queries, e.g. "protocol_param".
+            addresses (List[str]): Addresses whose UTxOs are looked up one by one.
+            utxo_addresses (Optional[List[str]]): Distinct addresses whose UTxOs are looked up together.
+        """
+        awaitables = [getattr(self._context, query)() for query in queries]
+        awaitables += [self._context.utxos(address) for address in addresses]
+        if utxo_addresses:
+            awaitables.append(self._context.utxos_many(utxo_addresses))
+        results = await asyncio.gather(*awaitables)
+
+        self._values.update(zip(queries, results))
+        self._utxos_by_address.update(zip(addresses, results[len(queries) :]))
+        if utxo_addresses is not None:
+            self._utxos_by_addresses[tuple(utxo_addresses)] = (
+                results[-1] if utxo_addresses else []
+            )
+
+    def _call(self, awaitable) -> Any:
+        return asyncio.run_coroutine_threadsafe(awaitable, self._loop).result()
+
+    def _get(self, query: str) -> Any:
+        if query not in self._values:
+            self._values[query] = self._call(getattr(self._context, query)())
+        return self._values[query]
+
+    @property
+    def protocol_param(self) -> ProtocolParameters:
+        return self._get("protocol_param")
+
+    @property
+    def genesis_param(self) -> GenesisParameters:
+        return self._get("genesis_param")
+
+    @property
+    def network(self) -> Network:
+        return self._context.network
+
+    @property
+    def epoch(self) -> int:
+        return self._get("epoch")
+
+    @property
+    def last_block_slot(self) -> int:
+        return self._get("last_block_slot")
+
+    def _utxos(self, address: str) -> List[UTxO]:
+        if address not in self._utxos_by_address:
+            self._utxos_by_address[address] = self._call(self._context.utxos(address))
+        return self._utxos_by_address[address]
+
+    def _utxos_many(self, addresses: List[str]) -> List[UTxO]:
+        key = tuple(addresses)
+        if key not in self._utxos_by_addresses:
+            self._utxos_by_addresses[key] = self._call(
+                self._context.utxos_many(addresses)
+            )
+        return self._utxos_by_addresses[key]
+
+    def submit_tx_cbor(self, cbor: Union[bytes, str]):
+        return self._call(self._context.submit_tx_cbor(cbor))
+
+    def evaluate_tx_cbor(self, cbor: Union[bytes, str]) -> Dict[str, ExecutionUnits]:
+        return self._call(self._context.evaluate_tx_cbor(cbor))
+
+
 @dataclass
 class TransactionBuilder:
     """A class builder that makes it easy to build a transaction."""
@@ -208,6 +498,10 @@ class TransactionBuilder:
 
     _should_estimate_execution_units: Optional[bool] = field(init=False, default=None)
 
+    _size_model: _TransactionSizeModel = field(
+        init=False, default_factory=_TransactionSizeModel
+    )
+
     def add_input(self, utxo: UTxO) -> TransactionBuilder:
         """Add a specific UTxO to transaction's inputs.
 
@@ -628,13 +922,9 @@ class TransactionBuilder:
     def _calc_change(
         self, fees, inputs, outputs, address, precise_fee=False, respect_min_utxo=True
     ) -> List[TransactionOutput]:
-        requested = Value(fees)
-        for o in outputs:
-            requested += o.amount
+        requested = Value.sum([fees] + [o.amount for o in outputs])
 
-        provided = Value()
-        for i in inputs:
-            provided += i.output.amount
+        provided = Value.sum(i.output.amount for i in inputs)
 
         if self.mint:
             provided.multi_asset += self.mint
@@ -881,53 +1171,13 @@ class TransactionBuilder:
         return set(self.required_signers) if self.required_signers else set()
 
     def _input_vkey_hashes(self) -> Set[VerificationKeyHash]:
-        results = set()
-        for i in self.inputs + list(self.collaterals):
-            if isinstance(i.output.address.payment_part, VerificationKeyHash):
-                results.add(i.output.address.payment_part)
-        return results
+        return utxo_vkey_hashes(self.inputs + list(self.collaterals))
 
     def _certificate_vkey_hashes(self) -> Set[VerificationKeyHash]:
-        results = set()
-
-        def _check_and_add_vkey(stake_credential: StakeCredential):
-            if isinstance(stake_credential.credential, VerificationKeyHash):
-                results.add(stake_credential.credential)
-
-        if self.certificates:
-            for cert in self.certificates:
-                if isinstance(
-                    cert,
-                    (
-                        StakeRegistration,
-                        StakeDeregistration,
-                        StakeDelegation,
-                        StakeRegistrationConway,
-                        StakeDeregistrationConway,
-                        VoteDelegation,
-                        StakeAndVoteDelegation,
-                        StakeRegistrationAndDelegation,
-                        StakeRegistrationAndVoteDelegation,
-                        StakeRegistrationAndDelegationAndVoteDelegation,
-                    ),
-                ):
-                    _check_and_add_vkey(cert.stake_credential)
-                elif isinstance(cert, RegDRepCert):
-                    _check_and_add_vkey(cert.drep_credential)
-                elif isinstance(cert, PoolRegistration):
-                    results.add(cert.pool_params.operator)
-                elif isinstance(cert, PoolRetirement):
-                    results.add(cert.pool_keyhash)
-        return results
+        return certificate_vkey_hashes(self.certificates or [])
 
     def _vote_vkey_hashes(self) -> Set[VerificationKeyHash]:
-        results = set()
-
-        if self.voting_procedures:
-            for voter in self.voting_procedures:
-                if isinstance(voter.credential, VerificationKeyHash):
-                    results.add(voter.credential)
-        return results
+        return voter_vkey_hashes(self.voting_procedures or {})
 
     def _get_total_key_deposit(self):
         stake_registration_certs = set()
@@ -973,33 +1223,10 @@ class TransactionBuilder:
         return proposal_deposit
 
     def _withdrawal_vkey_hashes(self) -> Set[VerificationKeyHash]:
-        results = set()
-
-        if self.withdrawals:
-            for k in self.withdrawals:
-                address = Address.from_primitive(k)
-                if address.address_type == AddressType.NONE_KEY:
-                    results.add(address.staking_part)
-
-        return results
+        return withdrawal_vkey_hashes(self.withdrawals or {})
 
     def _native_scripts_vkey_hashes(self) -> Set[VerificationKeyHash]:
-        results = set()
-
-        def _dfs(script: NativeScript):
-            tmp = set()
-            if isinstance(script, ScriptPubkey):
-                tmp.add(script.key_hash)
-            elif isinstance(script, (ScriptAll, ScriptAny)):
-                for s in script.native_scripts:
-                    tmp.update(_dfs(s))
-            return tmp
-
-        if self.native_scripts:
-            for script in self.native_scripts:
-                results.update(_dfs(script))
-
-        return results
+        return native_script_vkey_hashes(self.native_scripts or [])
 
     def _set_redeemer_index(self):
         # Set redeemers' index according to section 4.1 in
@@ -1101,33 +1328,9 @@ class TransactionBuilder:
         return self.witness_override or len(self._build_required_vkeys())
 
     def _build_fake_vkey_witnesses(self) -> NonEmptyOrderedSet[VerificationKeyWitness]:
-        witnesses = []
-        for i in range(self._witness_count()):
-            # Convert index to 32 bytes and use AND operation to create unique keys
-            i_bytes = i.to_bytes(32, "big")
-            unique_vkey = VerificationKey.from_primitive(
-                bytes(
-                    x & y
-                    for x, y in zip(
-                        bytes.fromhex(
-                            "5797dc2cc919dfec0bb849551ebdf30d96e5cbe0f33f734a87fe826db30f7ef9"
-                        ),
-                        i_bytes,
-                    )
-                )
-            )
-            unique_sig = bytes(
-                x & y
-                for x, y in zip(
-                    bytes.fromhex(
-                        "577ccb5b487b64e396b0976c6f71558e52e44ad254db7d06dfb79843e5441a5d"
-                        "763dd42adcf5e8805d70373722ebbce62a58e3f30dd4560b9a898b8ceeab6a03"
-                    ),
-                    i_bytes + i_bytes,  # 64 bytes for signature
-                )
-            )
-            witnesses.append(VerificationKeyWitness(unique_vkey, unique_sig))
-        return NonEmptyOrderedSet(witnesses)
+        return NonEmptyOrderedSet(
+            [_fake_vkey_witness(i) for i in range(self._witness_count())]
+        )
 
     def _build_fake_witness_set(self) -> TransactionWitnessSet:
         witness_set = self.build_witness_set()
@@ -1234,6 +1437,31 @@ class TransactionBuilder:
                 ref_script_size += len(s)
         return ref_script_size
 
+    def _estimate_tx_size(self) -> int:
+        """Estimate the size of the transaction with fake witnesses, the same as the size of
+        :meth:`_build_full_fake_tx`, but without encoding the components whose size is already known.
+        """
+        tx_body = self._build_tx_body()
+
+        if tx_body.fee == 0:
+            # When fee is not specified, we will use max possible fee to fill in the fee field.
+            # This will make sure the size of fee field itself is taken into account during fee estimation.
+            tx_body.fee = max_tx_fee(self.context)
+
+        size = self._size_model.transaction_size(
+            tx_body,
+            self.build_witness_set(),
+            self._witness_count(),
+            self.auxiliary_data,
+        )
+        if size > self.context.protocol_param.max_tx_size:
+            raise InvalidTransactionException(
+                f"Transaction size ({size}) exceeds the max limit "
+                f"({self.context.protocol_param.max_tx_size}). Please try reducing the "
+                f"number of inputs or outputs."
+            )
+        return size
+
     def _estimate_fee(self):
         plutus_execution_units = ExecutionUnits(0, 0)
         for redeemer in self._redeemer_list:
@@ -1241,7 +1469,7 @@ class TransactionBuilder:
 
         estimated_fee = fee(
             self.context,
-            len(self._build_full_fake_tx().to_cbor()),
+            self._estimate_tx_size(),
             plutus_execution_units.steps,
             plutus_execution_units.mem,
             self._ref_script_size(),
@@ -1283,6 +1511,7 @@ class TransactionBuilder:
             TransactionBody: A transaction body.
         """
         self._ensure_no_input_exclusion_conflict()
+        self._size_model = _TransactionSizeModel()
 
         # only automatically set the validity interval and required signers if scripts are involved
         is_smart = bool(self.all_scripts)
@@ -1304,11 +1533,8 @@ class TransactionBuilder:
                 auto_ttl_offset = 10_000
             self.ttl = max(0, last_slot + auto_ttl_offset)
 
-        selected_utxos = []
-        selected_amount = Value()
-        for i in self.inputs:
-            selected_utxos.append(i)
-            selected_amount += i.output.amount
+        selected_utxos = list(self.inputs)
+        selected_amount = Value.sum(i.output.amount for i in selected_utxos)
 
         if self.mint:
             # Add positive minted amounts to the selected amount (=source)
@@ -1333,9 +1559,7 @@ class TransactionBuilder:
         selected_amount.coin -= self._get_total_key_deposit()
         selected_amount.coin -= self._get_total_proposal_deposit()
 
-        requested_amount = Value()
-        for o in self.outputs:
-            requested_amount += o.amount
+        requested_amount = Value.sum(o.amount for o in self.outputs)
 
         if self.mint:
             # Add negative minted amounts to the requested amount (=sink)
@@ -1403,16 +1627,15 @@ class TransactionBuilder:
                 seen_utxos.add(utxo)
                 additional_utxo_pool.append(utxo)
 
-            for address in self.input_addresses:
-                for utxo in self.context.utxos(address):
-                    if (
-                        utxo not in seen_utxos
-                        and utxo not in self.excluded_inputs
-                        and utxo.output.script is None
-                    ):
-                        additional_utxo_pool.append(utxo)
-                        additional_amount += utxo.output.amount
-                        seen_utxos.add(utxo)
+            for utxo in self.context.utxos_many(self.input_addresses):
+                if (
+                    utxo not in seen_utxos
+                    and utxo not in self.excluded_inputs
+                    and utxo.output.script is None
+                ):
+                    additional_utxo_pool.append(utxo)
+                    additional_amount += utxo.output.amount
+                    seen_utxos.add(utxo)
 
             for index, selector in enumerate(self.utxo_selectors):
                 try:
@@ -1490,6 +1713,78 @@ class TransactionBuilder:
 
         return tx_body
 
+    async def build_async(
+        self,
+        change_address: Optional[Address] = None,
+        merge_change: Optional[bool] = False,
+        collateral_change_address: Optional[Address] = None,
+        auto_validity_start_offset: Optional[int] = None,
+        auto_ttl_offset: Optional[int] = None,
+        auto_required_signers: Optional[bool] = None,
+        context: Optional[AsyncChainContext] = None,
+        executor: Optional[Executor] = None,
+    ) -> TransactionBody:
+        """Build a transaction body without blocking the event loop, see :meth:`build`.
+
+        When given an :class:`AsyncChainContext`, the chain data the build may need (protocol parameters, the last
+        block slot, UTxOs of input addresses and of the collateral return address) is queried concurrently before
+        the build starts, instead of one query after another during the build. The build itself, which only sends
+        the transaction evaluation to the chain, then runs on an executor. Without an async context, the whole
+        build, queries to the builder's context included, runs on the executor.
+
+        Args:
+            change_address (Optional[Address]): See :meth:`build`.
+            merge_change (Optional[bool]): See :meth:`build`.
+            collateral_change_address (Optional[Address]): See :meth:`build`.
+            auto_validity_start_offset (Optional[int]): See :meth:`build`.
+            auto_ttl_offset (Optional[int]): See :meth:`build`.
+            auto_required_signers (Optional[bool]): See :meth:`build`.
+            context (Optional[AsyncChainContext]): Context to query the chain with. Defaults to the builder's
+                context if it is an :class:`AsyncChainContext`.
+            executor (Optional[Executor]): Executor the build runs on. Defaults to the event loop's default executor.
+
+        Returns:
+            TransactionBody: A transaction body.
+        """
+        if context is None and isinstance(self.context, AsyncChainContext):
+            context = self.context
+
+        build = functools.partial(
+            self.build,
+            change_address=change_address,
+            merge_change=merge_change,
+            collateral_change_address=collateral_change_address,
+            auto_validity_start_offset=auto_validity_start_offset,
+            auto_ttl_offset=auto_ttl_offset,
+            auto_required_signers=auto_required_signers,
+        )
+        loop = asyncio.get_running_loop()
+        if context is None:
+            return await loop.run_in_executor(executor, build)
+
+        has_scripts = bool(self.all_scripts or self._reference_scripts)
+        queries = ["protocol_param"]
+        if (
+            (has_scripts or auto_validity_start_offset is not None)
+            and self.validity_start is None
+        ) or ((has_scripts or auto_ttl_offset is not None) and self.ttl is None):
+            queries.append("last_block_slot")
+        collateral_return_address = collateral_change_address or change_address
+        addresses = []
+        if has_scripts and not self.collaterals and collateral_return_address:
+            addresses.append(str(collateral_return_address))
+        utxo_addresses = list(dict.fromkeys(str(a) for a in self.input_addresses))
+
+        prefetched = _PrefetchedChainContext(context, loop)
+        await prefetched.prefetch(queries, addresses, utxo_addresses)
+
+        original_context = self.context
+        self.context = prefetched
+        try:
+            return await loop.run_in_executor(executor, build)
+        finally:
+            self.context = original_context
+
     def _should_add_collateral_return(self, collateral_return: Value) -> bool:
         """Check if it is necessary to add a collateral return output.
 
@@ -1652,7 +1947,7 @@ class TransactionBuilder:
         # Create a deep copy of current builder, so we won't mess up current builder's internal states
         tmp_builder = TransactionBuilder(self.context)
         for f in fields(self):
-            if f.name not in ("context",):
+            if f.name not in ("context", "_size_model"):
                 setattr(tmp_builder, f.name, deepcopy(getattr(self, f.name)))
         tmp_builder._should_estimate_execution_units = False
         self._should_estimate_execution_units = False
@@ -1705,13 +2000,13 @@ class TransactionBuilder:
         Returns:
             Transaction: A signed transaction.
         """
+        signer = BatchSigner(signing_keys)
+
         # The given signers should be required signers if they weren't added yet
         if auto_required_signers and self.scripts and not self.required_signers:
             # Collect all signatories from explicitly defined
             # transaction inputs and collateral inputs, and input addresses
-            self.required_signers = [
-                s.to_verification_key().hash() for s in signing_keys
-            ]
+            self.required_signers = signer.verification_key_hashes
 
         tx_body = self.build(
             change_address=change_address,
@@ -1726,17 +2021,17 @@ class TransactionBuilder:
 
         required_vkeys = self._build_required_vkeys()
 
-        for signing_key in set(signing_keys):
-            vkey_hash = signing_key.to_verification_key().hash()
+        key_hashes = []
+        for vkey_hash in signer.verification_key_hashes:
             if not force_skeys and vkey_hash not in required_vkeys:
                 logger.warning(
                     f"Verification key hash {vkey_hash} is not required for this tx."
                 )
                 continue
-            signature = signing_key.sign(tx_body.hash())
-            witness_set.vkey_witnesses.append(
-                VerificationKeyWitness(signing_key.to_verification_key(), signature)
-            )
+            key_hashes.append(vkey_hash)
+
+        for witness in signer.witnesses(tx_body.hash(), key_hashes):
+            witness_set.vkey_witnesses.append(witness)
 
         if len(witness_set.vkey_witnesses) == 0:
             witness_set.vkey_witnesses = None
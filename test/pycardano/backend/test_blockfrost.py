@@ -1,3 +1,4 @@
+import asyncio
 from fractions import Fraction
 from unittest.mock import MagicMock, patch
 
@@ -6,7 +7,10 @@ from blockfrost.utils import convert_json_to_object
 from requests import Response
 
 from pycardano import ALONZO_COINS_PER_UTXO_WORD, GenesisParameters, ProtocolParameters
-from pycardano.backend.blockfrost import BlockFrostChainContext
+from pycardano.backend.blockfrost import (
+    AsyncBlockFrostChainContext,
+    BlockFrostChainContext,
+)
 from pycardano.network import Network
 
 
@@ -319,6 +323,105 @@ def test_utxos():
         assert len(utxos) == 3
 
 
+def test_utxos_many():
+    utxos_by_address = {
+        address: [
+            {
+                "address": address,
+                "tx_hash": tx_hash,
+                "output_index": 0,
+                "amount": [{"unit": "lovelace", "quantity": "42000000"}],
+                "block": "7eb8e27d18686c7db9a18f8bbcfe34e3fed6e047afaa2d969904d15e934847e6",
+                "data_hash": None,
+                "inline_datum": None,
+                "reference_script_hash": None,
+            }
+        ]
+        for address, tx_hash in [
+            (
+                "addr1qxqs59lphg8g6qndelq8xwqn60ag3aeyfcp33c2kdp46a09re5df3pzwwmyq946axfcejy5n4x0y99wqpgtp2gd0k09qsgy6pz",
+                "39a7a284c2a0948189dc45dec670211cd4d72f7b66c5726c08d9b3df11e44d58",
+            ),
+            (
+                "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x",
+                "4c4e67bafa15e742c13c592b65c8f74c769cd7d9af04c848099672d1ba391b49",
+            ),
+        ]
+    }
+
+    with (
+        patch(
+            "blockfrost.api.BlockFrostApi.epoch_latest",
+            return_value=convert_json_to_object(
+                {
+                    "epoch": 225,
+                }
+            ),
+        ),
+        patch(
+            "blockfrost.api.BlockFrostApi.address_utxos",
+            side_effect=lambda address, **kwargs: convert_json_to_object(
+                utxos_by_address[address]
+            ),
+        ) as mock_address_utxos,
+    ):
+        chain_context = BlockFrostChainContext(
+            "project_id", base_url=ApiUrls.preprod.value
+        )
+
+        addresses = list(utxos_by_address)
+        utxos = chain_context.utxos_many(addresses + addresses[:1])
+        assert [str(utxo.output.address) for utxo in utxos] == addresses
+        assert mock_address_utxos.call_count == 2
+
+
+def test_async_utxos_many():
+    addresses = [
+        "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x",
+        "addr_test1qraen6hr9zs5yae8cxnhlkh7rk2nfl7rnpg0xvmel3a0xf70v3kz6ee7mtq86x6gmrnw8j7kuf485902akkr7tlcx24qemz34a",
+    ]
+
+    def address_utxos(address, **kwargs):
+        return convert_json_to_object(
+            [
+                {
+                    "address": address,
+                    "tx_hash": "4c4e67bafa15e742c13c592b65c8f74c769cd7d9af04c848099672d1ba391b49",
+                    "output_index": 0,
+                    "amount": [{"unit": "lovelace", "quantity": "42000000"}],
+                    "block": "7eb8e27d18686c7db9a18f8bbcfe34e3fed6e047afaa2d969904d15e934847e6",
+                    "data_hash": None,
+                    "inline_datum": None,
+                    "reference_script_hash": None,
+                }
+            ]
+        )
+
+    async def main():
+        async with AsyncBlockFrostChainContext(
+            "project_id", base_url=ApiUrls.preprod.value, max_concurrent_requests=1
+        ) as chain_context:
+            assert chain_context.network == Network.TESTNET
+            assert chain_context._context is None
+            assert await chain_context.epoch() == 225
+            return await chain_context.utxos_many(addresses + addresses[:1])
+
+    with (
+        patch(
+            "blockfrost.api.BlockFrostApi.epoch_latest",
+            return_value=convert_json_to_object({"epoch": 225}),
+        ),
+        patch(
+            "blockfrost.api.BlockFrostApi.address_utxos",
+            side_effect=address_utxos,
+        ) as mock_address_utxos,
+    ):
+        utxos = asyncio.run(main())
+
+    assert [str(utxo.output.address) for utxo in utxos] == addresses
+    assert mock_address_utxos.call_count == 2
+
+
 def test_submit_tx_cbor():
     response = Response()
     response.status_code = 200
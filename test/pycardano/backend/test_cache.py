@@ -0,0 +1,152 @@
+import os
+from test.pycardano.util import FixedChainContext
+
+from pycardano.backend.cache import (
+    CachedChainContext,
+    DiskCacheStore,
+    DiskContentStore,
+    MemoryCacheStore,
+)
+from pycardano.hash import VerificationKeyHash
+from pycardano.nativescript import ScriptPubkey
+from pycardano.plutus import PlutusV2Script, datum_hash, script_hash
+from pycardano.serialization import RawCBOR
+
+ADDRESSES = [
+    "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x",
+    "addr_test1qraen6hr9zs5yae8cxnhlkh7rk2nfl7rnpg0xvmel3a0xf70v3kz6ee7mtq86x6gmrnw8j7kuf485902akkr7tlcx24qemz34a",
+]
+
+
+class CountingChainContext(FixedChainContext):
+    def __init__(self):
+        self.slot = 2000
+        self.queries = []
+
+    @property
+    def protocol_param(self):
+        self.queries.append("protocol_param")
+        return super().protocol_param
+
+    @property
+    def last_block_slot(self):
+        self.queries.append("last_block_slot")
+        return self.slot
+
+    def _utxos(self, address):
+        self.queries.append(address)
+        return super()._utxos(address)
+
+
+def test_utxos_cached_until_tip_moves():
+    backend = CountingChainContext()
+    context = CachedChainContext(backend, tip_ttl=0)
+
+    utxos = context.utxos_many(ADDRESSES)
+    assert [str(utxo.output.address) for utxo in utxos] == [
+        ADDRESSES[0],
+        ADDRESSES[0],
+        ADDRESSES[1],
+        ADDRESSES[1],
+    ]
+    assert context.utxos(ADDRESSES[1]) == utxos[2:]
+    assert backend.queries.count(ADDRESSES[1]) == 1
+
+    backend.slot += 1
+    assert context.utxos(ADDRESSES[1]) == utxos[2:]
+    assert backend.queries.count(ADDRESSES[1]) == 2
+    assert context.stats["utxos"].hits == 1
+    assert context.stats["utxos"].misses == 3
+
+
+def test_parameters_cached():
+    backend = CountingChainContext()
+    context = CachedChainContext(backend)
+
+    assert context.protocol_param == backend.protocol_param
+    assert context.protocol_param == backend.protocol_param
+    assert context.last_block_slot == context.last_block_slot == 2000
+    assert backend.queries.count("protocol_param") == 3
+    assert backend.queries.count("last_block_slot") == 1
+    assert context.stats["protocol_param"].hit_rate == 0.5
+
+
+def test_memory_store_eviction():
+    store = MemoryCacheStore(maxsize=2)
+    for i in range(3):
+        store.set(("key", i), i)
+    assert len(store) == 2
+    assert store.get(("key", 0)) is None
+    assert store.get(("key", 2)) == 2
+    assert (store.stats.hits, store.stats.misses) == (1, 1)
+
+
+def test_disk_store_shared(tmp_path):
+    backend = CountingChainContext()
+    CachedChainContext(backend, store=DiskCacheStore(tmp_path)).genesis_param
+
+    # Another context, e.g. in another process, reads what the first one stored.
+    context = CachedChainContext(CountingChainContext(), store=DiskCacheStore(tmp_path))
+    assert context.genesis_param == backend.genesis_param
+    assert context.stats["genesis_param"].hits == 1
+
+    store = DiskCacheStore(tmp_path, ttl=-1)
+    store.set(("key",), "value")
+    assert store.get(("key",)) is None
+    store.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disk_content_store(tmp_path):
+    plutus_script = PlutusV2Script(b"dummy test script")
+    native_script = ScriptPubkey(VerificationKeyHash(b"1" * 28))
+    datum = RawCBOR(bytes.fromhex("d87980"))
+    entries = {
+        ("script", str(script_hash(plutus_script))): plutus_script,
+        ("script", str(script_hash(native_script))): native_script,
+        ("datum", str(datum_hash(datum))): datum,
+    }
+
+    store = DiskContentStore(tmp_path)
+    for key, value in entries.items():
+        store.set(key, value)
+
+    # Another store, e.g. in a process started later, reads them from disk.
+    store = DiskContentStore(tmp_path)
+    for key, value in entries.items():
+        assert store.get(key) == value
+        assert type(store.get(key)) is type(value)
+    assert store.stats.hits == 6
+
+    # Content that doesn't match its hash is dropped.
+    key = ("datum", str(datum_hash(datum)))
+    (tmp_path / "datums" / key[1]).write_bytes(bytes.fromhex("d87a80"))
+    assert DiskContentStore(tmp_path).get(key) is None
+    assert os.listdir(tmp_path / "datums") == []
+
+
+def test_utxos_of_past_tips_expire(tmp_path):
+    backend = CountingChainContext()
+    store = DiskCacheStore(tmp_path, prune_interval=0)
+    context = CachedChainContext(backend, store=store, tip_ttl=0, utxo_ttl=-1)
+
+    for _ in range(3):
+        context.utxos(ADDRESSES[0])
+        backend.slot += 1
+    # Each write prunes the UTxOs of the previous tips, which already expired.
+    assert len(os.listdir(tmp_path)) == 1
+
+    context.genesis_param
+    assert len(os.listdir(tmp_path)) == 1
+    store.prune()
+    assert len(os.listdir(tmp_path)) == 1
+    assert context.genesis_param == backend.genesis_param
+    assert context.stats["genesis_param"].hits == 1
+
+
+def test_memory_store_ttl():
+    store = MemoryCacheStore()
+    store.set(("key", 0), 0, ttl=-1)
+    store.set(("key", 1), 1, ttl=60)
+    assert store.get(("key", 0)) is None
+    assert store.get(("key", 1)) == 1
@@ -1,7 +1,10 @@
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -20,7 +23,7 @@ from pycardano import (
     TransactionFailedException,
     TransactionInput,
 )
-from pycardano.backend.cardano_cli import network_magic
+from pycardano.backend.cardano_cli import DockerConfig, network_magic
 
 QUERY_TIP_RESULT = {
     "block": 1460093,
@@ -842,6 +845,38 @@ class TestCardanoCliChainContext:
             "55fe36f482e21ff6ae2caf2e33c3565572b568852dccd3f317ddecb91463d780"
         )
 
+    def test_utxos_many(self, chain_context):
+        commands = []
+        run_command = chain_context._run_command
+
+        def record_command(cmd: List[str]):
+            commands.append(cmd)
+            return run_command(cmd)
+
+        chain_context._run_command = record_command
+        addresses = [
+            "addr1v9p0rc57dzkz7gg97dmsns8hngsuxl956xe6myjldaug7hse4elc6",
+            "addr1x8nz307k3sr60gu0e47cmajssy4fmld7u493a4xztjrll0aj764lvrxdayh2ux30fl0ktuh27csgmpevdu89jlxppvrswgxsta",
+        ]
+        results = chain_context.utxos_many(addresses)
+
+        assert [str(utxo.output.address) for utxo in results] == addresses
+        utxo_queries = [cmd for cmd in commands if "utxo" in cmd]
+        assert len(utxo_queries) == 1
+        assert utxo_queries[0].count("--address") == 2
+
+        # Both addresses are now cached
+        assert chain_context.utxos(addresses[0]) == results[:1]
+        assert len([cmd for cmd in commands if "utxo" in cmd]) == 1
+
+    def test_utxos_many_non_canonical_address(self, chain_context):
+        addresses = [
+            "addr1v9p0rc57dzkz7gg97dmsns8hngsuxl956xe6myjldaug7hse4elc6",
+            "addr1x8nz307k3sr60gu0e47cmajssy4fmld7u493a4xztjrll0aj764lvrxdayh2ux30fl0ktuh27csgmpevdu89jlxppvrswgxsta",
+        ]
+        results = chain_context.utxos_many([addresses[0].upper(), addresses[1]])
+        assert [str(utxo.output.address) for utxo in results] == addresses
+
     def test_submit_tx_bytes(self, chain_context):
         results = chain_context.submit_tx("testcborhexfromtransaction".encode("utf-8"))
 
@@ -878,3 +913,71 @@ class TestCardanoCliChainContext:
 
     def test_epoch(self, chain_context):
         assert chain_context.epoch == 98
+
+
+@pytest.fixture
+def docker_container():
+    """
+    Mock the Docker container running cardano-cli, answering tip queries and transaction submissions
+    """
+    container = MagicMock()
+    # Transaction submission and id computation can only both pass this barrier if they run in parallel.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def exec_run(cmd, **kwargs):
+        if "submit" in cmd:
+            barrier.wait()
+            return MagicMock(exit_code=0, output=b"")
+        if "txid" in cmd:
+            barrier.wait()
+            return MagicMock(
+                exit_code=0,
+                output=b"270be16fa17cdb3ef683bf2c28259c978d4b7088792074f177c8efda247e23f7",
+            )
+        time.sleep(0.05)
+        return MagicMock(exit_code=0, output=json.dumps(QUERY_TIP_RESULT).encode())
+
+    container.exec_run.side_effect = exec_run
+    with patch("pycardano.backend.cardano_cli.docker.from_env") as from_env:
+        from_env.return_value.containers.get.return_value = container
+        yield from_env, container
+
+
+def worker_mode_chain_context(config_file) -> CardanoCliChainContext:
+    return CardanoCliChainContext(
+        binary=Path("cardano-cli"),
+        socket=Path("node.socket"),
+        config_file=config_file,
+        network=CardanoCliNetwork.PREPROD,
+        refetch_chain_tip_interval=1000,
+        docker_config=DockerConfig("cardano-node"),
+        worker_mode=True,
+    )
+
+
+def test_worker_mode_coalesces_queries(docker_container, config_file):
+    from_env, container = docker_container
+    context = worker_mode_chain_context(config_file)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        tips = list(executor.map(lambda _: context._query_chain_tip(), range(5)))
+    assert tips == [QUERY_TIP_RESULT] * 5
+    assert container.exec_run.call_count == 1
+
+    assert context.epoch == 98
+    assert container.exec_run.call_count == 2
+    # The Docker client and container are looked up once
+    assert from_env.call_count == 1
+
+    context.close()
+    from_env.return_value.close.assert_called_once()
+
+
+def test_worker_mode_submit_in_parallel(docker_container, config_file):
+    context = worker_mode_chain_context(config_file)
+
+    assert (
+        context.submit_tx("testcborhexfromtransaction")
+        == "270be16fa17cdb3ef683bf2c28259c978d4b7088792074f177c8efda247e23f7"
+    )
+    context.close()
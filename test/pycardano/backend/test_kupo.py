@@ -0,0 +1,136 @@
+import threading
+import time
+from test.pycardano.util import FixedChainContext
+from unittest.mock import MagicMock
+
+from pycardano.address import Address
+from pycardano.backend.base import ChainContext
+from pycardano.backend.cache import DiskContentStore, MemoryCacheStore
+from pycardano.backend.kupo import KupoChainContextExtension
+from pycardano.hash import VerificationKeyHash
+from pycardano.network import Network
+from pycardano.plutus import PlutusV2Script, datum_hash, script_hash
+from pycardano.serialization import RawCBOR
+
+ADDRESS = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+KUPO_URL = "http://localhost:1442"
+
+
+def test_utxos_kupo_fetches_each_datum_and_script_once(tmp_path):
+    script = PlutusV2Script(b"dummy test script")
+    scripts = {str(script_hash(script)): script.hex()}
+    datums = {
+        str(datum_hash(RawCBOR(bytes.fromhex(cbor_hex)))): cbor_hex
+        for cbor_hex in ["d87980", "d87a80"]
+    }
+    matches = [
+        {
+            "transaction_id": "3a" * 32,
+            "output_index": i,
+            "spent_at": None,
+            "value": {"coins": 1000000, "assets": {}},
+            "script_hash": str(script_hash(script)),
+            "datum_hash": list(datums)[i % 2],
+            "datum_type": "inline",
+        }
+        for i in range(10)
+    ]
+
+    def get(url):
+        response = MagicMock()
+        path = url[len(KUPO_URL) :]
+        if path.startswith("/matches/"):
+            response.json.return_value = matches
+        elif path.startswith("/scripts/"):
+            response.json.return_value = {
+                "language": "plutus:v2",
+                "script": scripts[path[len("/scripts/") :]],
+            }
+        else:
+            response.json.return_value = {"datum": datums[path[len("/datums/") :]]}
+        return response
+
+    context = KupoChainContextExtension(ChainContext(), KUPO_URL, max_fetch_workers=4)
+    context._session.get = MagicMock(side_effect=get)
+
+    utxos = context._utxos_kupo(ADDRESS)
+
+    assert [utxo.input.index for utxo in utxos] == list(range(10))
+    assert all(utxo.output.script == script for utxo in utxos)
+    assert [utxo.output.datum for utxo in utxos[:2]] == [
+        RawCBOR(bytes.fromhex("d87980")),
+        RawCBOR(bytes.fromhex("d87a80")),
+    ]
+    # One lookup, one script and two datums.
+    assert context._session.get.call_count == 4
+
+    # Datums and scripts are cached across lookups.
+    context._utxos_kupo(ADDRESS)
+    assert context._session.get.call_count == 5
+
+    # Datums and scripts written to a content store on disk are not fetched again by later contexts.
+    context = KupoChainContextExtension(
+        ChainContext(), KUPO_URL, content_store=DiskContentStore(tmp_path)
+    )
+    context._session.get = MagicMock(side_effect=get)
+    context._utxos_kupo(ADDRESS)
+    context = KupoChainContextExtension(
+        ChainContext(), KUPO_URL, content_store=DiskContentStore(tmp_path)
+    )
+    context._session.get = MagicMock(side_effect=get)
+    assert context._utxos_kupo(ADDRESS) == utxos
+    assert context._session.get.call_count == 1
+
+
+def test_fetches_share_workers_across_lookups():
+    addresses = [
+        ADDRESS,
+        "addr_test1qraen6hr9zs5yae8cxnhlkh7rk2nfl7rnpg0xvmel3a0xf70v3kz6ee7mtq86x6gmrnw8j7kuf485902akkr7tlcx24qemz34a",
+        str(Address(VerificationKeyHash(b"3" * 28), network=Network.TESTNET)),
+    ]
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def get(url):
+        response = MagicMock()
+        path = url[len(KUPO_URL) :]
+        if path.startswith("/matches/"):
+            address = path[len("/matches/") : -len("?unspent")]
+            response.json.return_value = [
+                {
+                    "transaction_id": f"{addresses.index(address):064x}",
+                    "output_index": i,
+                    "spent_at": None,
+                    "value": {"coins": 1000000, "assets": {}},
+                    "datum_hash": f"{addresses.index(address) * 10 + i:064x}",
+                    "datum_type": "inline",
+                }
+                for i in range(4)
+            ]
+            return response
+        with lock:
+            in_flight.append(path)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(path)
+        response.json.return_value = {"datum": "d87980"}
+        return response
+
+    context = KupoChainContextExtension(
+        FixedChainContext(), KUPO_URL, max_fetch_workers=2
+    )
+    context._session.get = MagicMock(side_effect=get)
+
+    utxos = context._utxos_many(addresses)
+    assert len(utxos) == 12
+    assert len(max_in_flight) == 12
+    assert max(max_in_flight) <= 2
+
+
+def test_shared_memory_content_store():
+    store = MemoryCacheStore()
+    context = KupoChainContextExtension(ChainContext(), KUPO_URL, content_store=store)
+    assert context._datum_cache is store
+    assert context._script_cache is store
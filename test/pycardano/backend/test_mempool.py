@@ -0,0 +1,180 @@
+from test.pycardano.util import FixedChainContext
+
+from nacl.encoding import RawEncoder
+from nacl.hash import blake2b
+
+from pycardano.backend.mempool import MempoolChainContext
+from pycardano.hash import TransactionId
+from pycardano.transaction import (
+    Transaction,
+    TransactionBody,
+    TransactionInput,
+    TransactionOutput,
+    UTxO,
+)
+from pycardano.witness import TransactionWitnessSet
+
+ADDRESS = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+OTHER_ADDRESS = "addr_test1qraen6hr9zs5yae8cxnhlkh7rk2nfl7rnpg0xvmel3a0xf70v3kz6ee7mtq86x6gmrnw8j7kuf485902akkr7tlcx24qemz34a"
+
+
+class LedgerChainContext(FixedChainContext):
+    def __init__(self):
+        self.slot = 100
+        self.ledger = {
+            ADDRESS: [
+                UTxO(
+                    TransactionInput.from_primitive([b"1" * 32, 0]),
+                    TransactionOutput.from_primitive([ADDRESS, 50000000]),
+                )
+            ],
+            OTHER_ADDRESS: [],
+        }
+        self.submitted = []
+
+    @property
+    def last_block_slot(self):
+        return self.slot
+
+    def _utxos(self, address):
+        return list(self.ledger[address])
+
+    def submit_tx_cbor(self, cbor):
+        self.submitted.append(cbor)
+
+    def add_block(self, *txs):
+        self.slot += 20
+        for tx in txs:
+            body = tx.transaction_body
+            for utxos in self.ledger.values():
+                utxos[:] = [utxo for utxo in utxos if utxo.input not in body.inputs]
+            for index, output in enumerate(body.outputs):
+                self.ledger[str(output.address)].append(
+                    UTxO(TransactionInput(body.id, index), output)
+                )
+
+
+def make_tx(inputs, outputs, ttl=None):
+    body = TransactionBody(
+        inputs=[utxo.input for utxo in inputs],
+        outputs=[TransactionOutput.from_primitive(output) for output in outputs],
+        fee=200000,
+        ttl=ttl,
+    )
+    return Transaction(body, TransactionWitnessSet())
+
+
+def test_chained_transactions():
+    ledger = LedgerChainContext()
+    context = MempoolChainContext(ledger)
+
+    [utxo] = context.utxos(ADDRESS)
+    tx1 = make_tx([utxo], [[ADDRESS, 30000000], [OTHER_ADDRESS, 19800000]])
+    context.submit_tx(tx1)
+
+    [change] = context.utxos(ADDRESS)
+    assert change.input == TransactionInput(tx1.id, 0)
+
+    tx2 = make_tx([change], [[ADDRESS, 29800000]])
+    context.submit_tx(tx2.to_cbor())
+    assert len(ledger.submitted) == 2
+    assert context.pending_transactions == [tx1.id, tx2.id]
+
+    assert [utxo.input for utxo in context.utxos_many([ADDRESS, OTHER_ADDRESS])] == [
+        TransactionInput(tx2.id, 0),
+        TransactionInput(tx1.id, 1),
+    ]
+
+    # Once the last transaction is on chain, the ones it depends on are too.
+    ledger.add_block(tx1, tx2)
+    assert [utxo.input for utxo in context.utxos(ADDRESS)] == [
+        TransactionInput(tx2.id, 0)
+    ]
+    assert context.pending_transactions == []
+
+
+def test_spent_input_ends_pending():
+    ledger = LedgerChainContext()
+    context = MempoolChainContext(ledger)
+
+    [utxo] = context.utxos(ADDRESS)
+    tx = make_tx([utxo], [[OTHER_ADDRESS, 49800000]])
+    context.submit_tx(tx)
+    assert context.utxos(ADDRESS) == []
+
+    ledger.add_block(tx)
+    ledger.ledger[OTHER_ADDRESS].clear()
+    assert context.utxos(ADDRESS) == []
+    assert context.pending_transactions == []
+    assert context.utxos(OTHER_ADDRESS) == []
+
+
+def test_expired_transaction():
+    ledger = LedgerChainContext()
+    context = MempoolChainContext(ledger)
+
+    [utxo] = context.utxos(ADDRESS)
+    context.submit_tx(make_tx([utxo], [[ADDRESS, 49800000]], ttl=110))
+    assert context.utxos(ADDRESS)[0].input != utxo.input
+
+    ledger.slot = 110
+    assert context.utxos(ADDRESS) == [utxo]
+    assert context.pending_transactions == []
+
+
+def test_submit_non_canonical_cbor():
+    # A body with fee encoded in 8 bytes instead of 4
+    body_cbor = bytes.fromhex(
+        "a50081825820732bfd67e66be8e8288349fcaaa2294973ef6271cc189a239bb431275401b8e"
+        "500018282581d60f6532850e1bccee9c72a9113ad98bcc5dbb30d2ac960262444f6e5f41b00"
+        "0000174876e80082581d60f6532850e1bccee9c72a9113ad98bcc5dbb30d2ac960262444f6e"
+        "5f41b000000ba43b4b7f7021b00000000000288090d800e80"
+    )
+    tx_id = TransactionId(blake2b(body_cbor, 32, encoder=RawEncoder))
+    context = MempoolChainContext(LedgerChainContext())
+
+    context.submit_tx(b"\x84" + body_cbor + b"\xa0\xf5\xf6")
+    assert context.pending_transactions == [tx_id]
+    assert [utxo.input for utxo in context.utxos(ADDRESS)][-2:] == [
+        TransactionInput(tx_id, 0),
+        TransactionInput(tx_id, 1),
+    ]
+
+
+def test_discarded_transaction_discards_descendants():
+    ledger = LedgerChainContext()
+    context = MempoolChainContext(ledger)
+
+    [utxo] = context.utxos(ADDRESS)
+    tx1 = make_tx([utxo], [[ADDRESS, 49800000]], ttl=110)
+    context.submit_tx(tx1)
+    [change] = context.utxos(ADDRESS)
+    tx2 = make_tx([change], [[OTHER_ADDRESS, 49600000]], ttl=200)
+    context.submit_tx(tx2)
+    assert context.utxos(OTHER_ADDRESS)[0].input == TransactionInput(tx2.id, 0)
+
+    ledger.slot = 110
+    assert context.utxos(OTHER_ADDRESS) == []
+    assert context.pending_transactions == []
+    assert context.utxos(ADDRESS) == [utxo]
+
+
+def test_parent_on_chain_keeps_pending_children():
+    ledger = LedgerChainContext()
+    context = MempoolChainContext(ledger)
+
+    [utxo] = context.utxos(ADDRESS)
+    tx1 = make_tx([utxo], [[OTHER_ADDRESS, 49800000]])
+    context.submit_tx(tx1)
+    assert context.utxos(ADDRESS) == []
+    [output] = context.utxos(OTHER_ADDRESS)
+    tx2 = make_tx([output], [[OTHER_ADDRESS, 49600000]])
+    context.submit_tx(tx2)
+
+    # Only the first transaction is in the block: its input vanishes, and its output is spent by the second.
+    ledger.add_block(tx1)
+    assert context.utxos(ADDRESS) == []
+    assert context.pending_transactions == [tx2.id]
+    assert [utxo.input for utxo in context.utxos(OTHER_ADDRESS)] == [
+        TransactionInput(tx2.id, 0)
+    ]
@@ -0,0 +1,301 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, PropertyMock, call, patch
+
+import pytest
+from ogmios.datatypes import Era as OgmiosEra
+from ogmios.datatypes import Utxo as OgmiosUtxo
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosedError
+
+from pycardano.backend.ogmios_v6 import (
+    AsyncOgmiosV6ChainContext,
+    OgmiosV6ChainContext,
+)
+
+
+class FakeOgmiosClient:
+    def __init__(self, *args, **kwargs):
+        self.connection = MagicMock()
+        self.query_epoch = MagicMock()
+        self.query_epoch.execute.return_value = (500, None)
+        self.query_epoch.receive.return_value = (500, None)
+        self.query_network_tip = MagicMock()
+        self.query_network_tip.receive.return_value = (MagicMock(slot=1234), None)
+        self.query_utxo = MagicMock()
+        self.query_genesis_configuration = MagicMock()
+        self.submit_transaction = MagicMock()
+
+
+@pytest.fixture
+def ogmios_client():
+    with patch(
+        "pycardano.backend.ogmios_v6.OgmiosClient", side_effect=FakeOgmiosClient
+    ) as mock_client:
+        yield mock_client
+
+
+def test_connection_per_query_by_default(ogmios_client):
+    context = OgmiosV6ChainContext()
+    assert context.epoch == 500
+    assert context.epoch == 500
+    assert ogmios_client.call_count == 2
+
+
+def test_persistent_connection_reused(ogmios_client):
+    context = OgmiosV6ChainContext(persistent_connections=True)
+    assert context.epoch == 500
+    assert context.epoch == 500
+    assert ogmios_client.call_count == 1
+
+    client = context._idle_clients[0]
+    context.close()
+    assert not context._idle_clients
+    client.connection.close.assert_called_once()
+
+
+def test_reconnect_on_failure(ogmios_client):
+    context = OgmiosV6ChainContext(persistent_connections=True)
+    assert context.epoch == 500
+    broken = context._idle_clients[0]
+    broken.query_epoch.execute.side_effect = ConnectionClosedError(None, None)
+
+    assert context.epoch == 500
+    assert ogmios_client.call_count == 2
+    broken.connection.close.assert_called_once()
+    assert broken not in context._idle_clients
+
+
+def test_submit_not_retried(ogmios_client):
+    context = OgmiosV6ChainContext(persistent_connections=True)
+    assert context.epoch == 500
+    broken = context._idle_clients[0]
+    broken.submit_transaction.execute.side_effect = ConnectionClosedError(None, None)
+
+    with pytest.raises(ConnectionClosedError):
+        context.submit_tx_cbor(b"\x80")
+    assert ogmios_client.call_count == 1
+
+
+def test_no_retry_without_persistent_connections(ogmios_client):
+    ogmios_client.side_effect = None
+    client = ogmios_client.return_value = FakeOgmiosClient()
+    client.query_epoch.execute.side_effect = ConnectionClosedError(None, None)
+
+    context = OgmiosV6ChainContext(max_retries=3)
+    with pytest.raises(ConnectionClosedError):
+        context.epoch
+    assert ogmios_client.call_count == 1
+    client.query_epoch.execute.assert_called_once_with()
+
+
+def test_pipeline(ogmios_client):
+    context = OgmiosV6ChainContext(persistent_connections=True)
+    epoch, tip = context._pipeline([("query_epoch", ()), ("query_network_tip", ())])
+    assert epoch == 500
+    assert tip.slot == 1234
+
+    client = context._idle_clients[0]
+    client.query_epoch.send.assert_called_once_with()
+    client.query_network_tip.send.assert_called_once_with()
+    assert ogmios_client.call_count == 1
+
+
+def test_genesis_configurations_pipelined(ogmios_client):
+    context = OgmiosV6ChainContext()
+    client = FakeOgmiosClient()
+    client.query_genesis_configuration.receive.side_effect = [
+        (SimpleNamespace(system_start="byron", epoch_length=21600), None),
+        (SimpleNamespace(epoch_length=432000, slot_length=1), None),
+        (SimpleNamespace(collateral_percentage=150), None),
+    ]
+
+    with patch(
+        "pycardano.backend.ogmios_v6.get_current_era", return_value=OgmiosEra.babbage
+    ):
+        genesis_param = context._query_genesis_param(client)
+
+    assert client.query_genesis_configuration.mock_calls == [
+        call.send("byron"),
+        call.send("shelley"),
+        call.send("alonzo"),
+        call.receive(),
+        call.receive(),
+        call.receive(),
+    ]
+    assert genesis_param.era == "alonzo"
+    assert genesis_param.system_start == "byron"
+    assert genesis_param.epoch_length == 432000
+    assert genesis_param.slot_length == 1
+    assert genesis_param.collateral_percentage == 150
+
+
+def test_utxos_many(ogmios_client):
+    addresses = [
+        "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x",
+        "addr_test1qraen6hr9zs5yae8cxnhlkh7rk2nfl7rnpg0xvmel3a0xf70v3kz6ee7mtq86x6gmrnw8j7kuf485902akkr7tlcx24qemz34a",
+    ]
+    results = [
+        OgmiosUtxo(
+            tx_id="3a42f652bd8dee788577e8c39b6217db3df659c33b10a2814c20fb66089ca167",
+            index=i,
+            address=address,
+            value={"ada": {"lovelace": 1000000 * (i + 1)}},
+        )
+        for i, address in enumerate(reversed(addresses))
+    ]
+    context = OgmiosV6ChainContext(persistent_connections=True)
+    assert context.epoch == 500
+    client = context._idle_clients[0]
+    client.query_utxo.execute.return_value = (results, None)
+
+    with patch.object(
+        OgmiosV6ChainContext, "last_block_slot", new_callable=PropertyMock
+    ) as last_block_slot:
+        last_block_slot.return_value = 1234
+        utxos = context.utxos_many(addresses)
+
+    assert [str(utxo.output.address) for utxo in utxos] == addresses
+    query = client.query_utxo.execute
+    query.assert_called_once()
+    assert [a.address for a in query.call_args[0][0]] == addresses
+
+    # Results are matched to addresses given in another form than the one Ogmios returns.
+    with patch.object(
+        OgmiosV6ChainContext, "last_block_slot", new_callable=PropertyMock
+    ) as last_block_slot:
+        last_block_slot.return_value = 1235
+        utxos = context.utxos_many([addresses[0].upper(), addresses[1]])
+    assert [str(utxo.output.address) for utxo in utxos] == addresses
+    assert query.call_count == 2
+
+    # Results of two forms of the same address can't be told apart: they are looked up alone.
+    query.side_effect = lambda addresses: (
+        [
+            result
+            for result in results
+            if result.address == addresses[0].address.lower()
+        ],
+        None,
+    )
+    with patch.object(
+        OgmiosV6ChainContext, "last_block_slot", new_callable=PropertyMock
+    ) as last_block_slot:
+        last_block_slot.return_value = 1236
+        utxos = context.utxos_many([addresses[0].upper(), addresses[0]])
+    assert [str(utxo.output.address) for utxo in utxos] == [addresses[0]] * 2
+    assert query.call_count == 5
+
+
+ASYNC_ADDRESSES = [
+    "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x",
+    "addr_test1qraen6hr9zs5yae8cxnhlkh7rk2nfl7rnpg0xvmel3a0xf70v3kz6ee7mtq86x6gmrnw8j7kuf485902akkr7tlcx24qemz34a",
+]
+
+
+class FakeOgmiosServer:
+    """Answers Ogmios requests in reverse order of arrival, to check that responses are matched by id."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = []
+
+    def result(self, request):
+        method = request["method"]
+        if method == "queryLedgerState/epoch":
+            return 500
+        if method == "queryNetwork/tip":
+            return {"slot": 1234, "id": "00" * 32}
+        if method == "queryLedgerState/utxo":
+            addresses = request["params"]["addresses"]
+            return [
+                {
+                    "transaction": {"id": "3a" * 32},
+                    "index": i,
+                    "address": address.lower(),
+                    "value": {"ada": {"lovelace": 1000000 * (i + 1)}},
+                }
+                for i, address in enumerate(reversed(addresses))
+            ]
+        raise ValueError(method)
+
+    async def handler(self, websocket):
+        self.connections += 1
+        async for message in websocket:
+            request = json.loads(message)
+            self.requests.append(request)
+            await asyncio.sleep(0.01 / len(self.requests))
+            await websocket.send(
+                json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": request["method"],
+                        "result": self.result(request),
+                        "id": request["id"],
+                    }
+                )
+            )
+
+
+def run_with_ogmios_server(test):
+    async def main():
+        fake = FakeOgmiosServer()
+        async with serve(fake.handler, "localhost", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            context = AsyncOgmiosV6ChainContext(port=port)
+            try:
+                await test(context, fake)
+            finally:
+                await context.close()
+
+    asyncio.run(main())
+
+
+def test_async_concurrent_requests_share_connection():
+    async def test(context, fake):
+        epochs = await asyncio.gather(*(context.epoch() for _ in range(20)))
+        assert epochs == [500] * 20
+        assert fake.connections == 1
+        assert len({r["id"] for r in fake.requests}) == 20
+
+    run_with_ogmios_server(test)
+
+
+def test_async_chain_tip_coalesced():
+    async def test(context, fake):
+        slots = await asyncio.gather(*(context.last_block_slot() for _ in range(10)))
+        assert slots == [1234] * 10
+        assert len(fake.requests) == 1
+
+    run_with_ogmios_server(test)
+
+
+def test_async_utxos_many():
+    async def test(context, fake):
+        utxos = await context.utxos_many(ASYNC_ADDRESSES)
+        assert [str(utxo.output.address) for utxo in utxos] == ASYNC_ADDRESSES
+        assert await context.utxos(ASYNC_ADDRESSES[0]) == utxos[:1]
+        assert [r["method"] for r in fake.requests].count("queryLedgerState/utxo") == 1
+
+    run_with_ogmios_server(test)
+
+
+def test_async_reconnect_on_failure():
+    async def test(context, fake):
+        assert await context.epoch() == 500
+        await context._connection.websocket.close()
+        assert await context.epoch() == 500
+        assert fake.connections == 2
+
+    run_with_ogmios_server(test)
+
+
+def test_async_utxos_many_non_canonical_address():
+    async def test(context, fake):
+        utxos = await context.utxos_many(
+            [ASYNC_ADDRESSES[0].upper(), ASYNC_ADDRESSES[1]]
+        )
+        assert [str(utxo.output.address) for utxo in utxos] == ASYNC_ADDRESSES
+
+    run_with_ogmios_server(test)
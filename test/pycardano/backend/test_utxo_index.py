@@ -0,0 +1,267 @@
+import json
+from test.pycardano.util import FixedChainContext
+
+from pycardano.address import Address
+from pycardano.backend.utxo_index import RecordedBlockSource, UTxOIndexChainContext
+from pycardano.hash import VerificationKeyHash
+from pycardano.network import Network
+from pycardano.transaction import TransactionInput
+
+ADDRESS = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+OTHER_ADDRESS = "addr_test1qraen6hr9zs5yae8cxnhlkh7rk2nfl7rnpg0xvmel3a0xf70v3kz6ee7mtq86x6gmrnw8j7kuf485902akkr7tlcx24qemz34a"
+CREDENTIAL = VerificationKeyHash(b"3" * 28)
+CREDENTIAL_ADDRESS = str(Address(CREDENTIAL, network=Network.TESTNET))
+
+BOOTSTRAP_TX_ID = (b"1" * 32).hex()
+
+
+class CountingChainContext(FixedChainContext):
+    def __init__(self):
+        self.queries = []
+
+    def _utxos(self, address):
+        self.queries.append(address)
+        return super()._utxos(address)[:1]
+
+
+def tx_id(n):
+    return f"{n:064x}"
+
+
+def point(slot):
+    return {"slot": slot, "id": f"{slot:064x}"}
+
+
+def tip(slot):
+    return {"slot": slot, "id": f"{slot:064x}", "height": slot}
+
+
+def output(address, lovelace):
+    return {"address": address, "value": {"ada": {"lovelace": lovelace}}}
+
+
+def spend(tx, index):
+    return {"transaction": {"id": tx}, "index": index}
+
+
+def forward(slot, transactions, tip_slot=10):
+    block = {
+        "type": "praos",
+        "era": "babbage",
+        "id": f"{slot:064x}",
+        "ancestor": f"{slot - 1:064x}",
+        "height": slot,
+        "slot": slot,
+        "size": {"bytes": 1024},
+        "protocol": {"version": {"major": 8, "minor": 0}},
+        "issuer": {
+            "verificationKey": "00" * 32,
+            "vrfVerificationKey": "00" * 32,
+            "operationalCertificate": {
+                "count": 0,
+                "kes": {"period": 0, "verificationKey": "00" * 32},
+            },
+            "leaderValue": {},
+        },
+        "transactions": transactions,
+    }
+    return {
+        "jsonrpc": "2.0",
+        "method": "nextBlock",
+        "result": {"direction": "forward", "tip": tip(tip_slot), "block": block},
+    }
+
+
+def backward(slot, tip_slot=10):
+    return {
+        "jsonrpc": "2.0",
+        "method": "nextBlock",
+        "result": {"direction": "backward", "tip": tip(tip_slot), "point": point(slot)},
+    }
+
+
+def make_context(responses, **kwargs):
+    context = CountingChainContext()
+    index = UTxOIndexChainContext(
+        context,
+        RecordedBlockSource(responses),
+        addresses=[ADDRESS],
+        **kwargs,
+    )
+    return context, index
+
+
+def refs(utxos):
+    return [(str(utxo.input.transaction_id), utxo.input.index) for utxo in utxos]
+
+
+def test_bootstrap_and_roll_forward():
+    responses = [
+        backward(1),
+        forward(
+            2,
+            [
+                {
+                    "id": tx_id(2),
+                    "inputs": [spend(BOOTSTRAP_TX_ID, 0)],
+                    "outputs": [output(OTHER_ADDRESS, 1), output(ADDRESS, 2000000)],
+                }
+            ],
+        ),
+        forward(
+            3,
+            [
+                {
+                    "id": tx_id(3),
+                    "inputs": [spend(tx_id(99), 0)],
+                    "outputs": [output(ADDRESS, 3000000)],
+                }
+            ],
+        ),
+    ]
+    context, index = make_context(responses)
+
+    index.bootstrap()
+    assert refs(index.utxos(ADDRESS)) == [(BOOTSTRAP_TX_ID, 0)]
+    assert index.last_block_slot == 0
+
+    index.follow()
+    utxos = index.utxos(ADDRESS)
+    assert refs(utxos) == [(tx_id(2), 1), (tx_id(3), 0)]
+    assert utxos[0].output.amount.coin == 2000000
+    assert index.last_block_slot == 3
+    assert not index.synced
+
+    # Only the bootstrap queried the wrapped context for the watched address.
+    assert context.queries == [ADDRESS]
+    index.utxos(OTHER_ADDRESS)
+    assert context.queries == [ADDRESS, OTHER_ADDRESS]
+
+
+def test_rollback():
+    responses = [
+        forward(
+            2,
+            [
+                {
+                    "id": tx_id(2),
+                    "inputs": [spend(BOOTSTRAP_TX_ID, 0)],
+                    "outputs": [output(ADDRESS, 2000000)],
+                }
+            ],
+        ),
+        forward(
+            3,
+            [
+                {
+                    "id": tx_id(3),
+                    "inputs": [spend(tx_id(2), 0)],
+                    "outputs": [output(ADDRESS, 1000000)],
+                }
+            ],
+        ),
+        backward(2),
+    ]
+    context, index = make_context(responses)
+    index.follow()
+
+    assert refs(index.utxos(ADDRESS)) == [(tx_id(2), 0)]
+    assert index.last_block_slot == 2
+
+    index.follow()
+    assert len(context.queries) == 1
+
+
+def test_rollback_deeper_than_history_bootstraps_again():
+    responses = [
+        forward(
+            2,
+            [{"id": tx_id(2), "inputs": [], "outputs": [output(ADDRESS, 1)]}],
+        ),
+        forward(
+            3,
+            [{"id": tx_id(3), "inputs": [], "outputs": [output(ADDRESS, 1)]}],
+        ),
+        backward(1),
+    ]
+    context, index = make_context(responses, max_rollback=1)
+    index.follow()
+
+    assert refs(index.utxos(ADDRESS)) == [(BOOTSTRAP_TX_ID, 0)]
+    assert context.queries == [ADDRESS, ADDRESS]
+
+
+def test_failed_transaction_spends_collaterals():
+    responses = [
+        forward(
+            2,
+            [
+                {
+                    "id": tx_id(2),
+                    "spends": "collaterals",
+                    "inputs": [spend(tx_id(99), 0)],
+                    "collaterals": [spend(BOOTSTRAP_TX_ID, 0)],
+                    "outputs": [output(ADDRESS, 5000000)],
+                    "collateralReturn": output(ADDRESS, 4000000),
+                }
+            ],
+        ),
+    ]
+    _, index = make_context(responses)
+    index.follow()
+
+    utxos = index.utxos(ADDRESS)
+    assert refs(utxos) == [(tx_id(2), 1)]
+    assert utxos[0].output.amount.coin == 4000000
+
+
+def test_watched_credential():
+    responses = [
+        forward(
+            2,
+            [
+                {
+                    "id": tx_id(2),
+                    "inputs": [],
+                    "outputs": [
+                        output(OTHER_ADDRESS, 1000000),
+                        output(CREDENTIAL_ADDRESS, 2000000),
+                    ],
+                }
+            ],
+        ),
+        forward(
+            3,
+            [{"id": tx_id(3), "inputs": [spend(tx_id(2), 1)], "outputs": []}],
+        ),
+        backward(2),
+    ]
+    context, index = make_context(responses, credentials=[CREDENTIAL])
+    index.step()
+    assert refs(index.utxos(CREDENTIAL_ADDRESS)) == [(tx_id(2), 1)]
+
+    index.step()
+    assert index.utxos(CREDENTIAL_ADDRESS) == []
+
+    index.step()
+    assert refs(index.utxos(CREDENTIAL_ADDRESS)) == [(tx_id(2), 1)]
+    assert CREDENTIAL_ADDRESS not in context.queries
+
+
+def test_recorded_block_source_from_file(tmp_path):
+    responses = [
+        forward(2, [{"id": tx_id(2), "inputs": [], "outputs": [output(ADDRESS, 1)]}], 2)
+    ]
+    path = tmp_path / "blocks.jsonl"
+    path.write_text("\n".join(json.dumps(response) for response in responses))
+
+    index = UTxOIndexChainContext(
+        CountingChainContext(),
+        RecordedBlockSource.from_file(path),
+        addresses=[ADDRESS],
+    )
+    index.follow()
+    assert index.synced
+    assert TransactionInput.from_primitive([tx_id(2), 0]) in [
+        utxo.input for utxo in index.utxos(ADDRESS)
+    ]
@@ -1,3 +1,6 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from pycardano.address import Address, PointerAddress
@@ -435,3 +438,150 @@ def test_non_harden_private_derivation_without_privkey():
     hdwallet = HDWallet(chain_code=chain_code, public_key=public_key)
     with pytest.raises(ValueError):
         hdwallet.derive(0, private=True, hardened=False)
+
+
+def test_derive_range_public():
+    public_key = bytes.fromhex(
+        "601c86a2310f438079fff07454f4df4ce416bd181d972cd4c4615f15a733ba15"
+    )
+    chain_code = bytes.fromhex(
+        "8a34b66a32c9d2d61d1d7a0e8fcf167efae3fb556af74808cd1ba8a22251c031"
+    )
+    hdwallet = HDWallet(chain_code=chain_code, public_key=public_key)
+    keys = hdwallet.derive(0, private=False, hardened=False).derive_range("m", 0, 3)
+
+    assert len(keys) == 3
+    assert keys.xprivate_key(0) is None
+    assert [keys.public_key(i).hex() for i in range(3)] == [
+        "b3f354cbdc2837f823c5e0585995d3bd2d6edf1dc9fc8a1a90d01840c519408d",
+        "363aa29a3c93085859310ccddb182abcca18db6f6897a4f936ae82ba0a15af90",
+        "db58a4102f555ccb64a0db45259799cbd42fac14f7f6fd1059557fef3961e2c0",
+    ]
+    with pytest.raises(IndexError):
+        keys.public_key(3)
+    with pytest.raises(ValueError):
+        hdwallet.derive_range("m", 0, 3, private=True)
+    with pytest.raises(ValueError):
+        hdwallet.derive_range("m", 0, 3, hardened=True)
+
+
+def test_derive_range_matches_derive_from_path():
+    hdwallet = HDWallet.from_mnemonic(MNEMONIC_12)
+    account = "m/1852'/1815'/0'"
+
+    keys = hdwallet.derive_range(account + "/0", 0, 5, private=True)
+    for i, child in enumerate(keys):
+        expected = hdwallet.derive_from_path(f"{account}/0/{i}")
+        assert child.xprivate_key == expected.xprivate_key
+        assert child.public_key == expected.public_key
+        assert child.chain_code == expected.chain_code
+        assert child._path == expected._path
+
+    accounts = hdwallet.derive_range("m/1852'/1815'", 0, 3, private=True, hardened=True)
+    assert (
+        accounts.hdwallet(2).public_key
+        == hdwallet.derive_from_path("m/1852'/1815'/2'").public_key
+    )
+
+    spend_vk_hash = keys.verification_key_hashes()[0]
+    stake_vk_hash = hdwallet.derive_range(
+        account + "/2", 0, 1
+    ).verification_key_hashes()[0]
+    assert (
+        Address(spend_vk_hash, stake_vk_hash, network=Network.TESTNET).encode()
+        == "addr_test1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3jcu5d8ps7zex2k2xt3uqxgjqnnj83ws8lhrn648jjxtwq2ytjqp"
+    )
+
+
+def test_derive_range_executor():
+    hdwallet = HDWallet.from_mnemonic(MNEMONIC_12)
+    path = "m/1852'/1815'/0'/0"
+    expected = hdwallet.derive_range(path, 10, 25, private=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        keys = hdwallet.derive_range(
+            path, 10, 25, private=True, executor=executor, chunk_size=4
+        )
+
+    assert keys.public_keys == expected.public_keys
+    assert keys.chain_codes == expected.chain_codes
+    assert keys.xprivate_keys == expected.xprivate_keys
+    assert keys.hdwallet(0)._path == hdwallet.derive_from_path(path + "/10")._path
+
+
+def test_derive_from_path_node_cache(monkeypatch):
+    hdwallet = HDWallet.from_mnemonic(MNEMONIC_12)
+    uncached = HDWallet.from_mnemonic(MNEMONIC_12)
+    uncached.node_cache_size = 0
+
+    derivations = []
+    derive_private = HDWallet._derive_private_child_key_by_index
+
+    def counting_derive(self, private_pnode, index):
+        derivations.append(index)
+        return derive_private(self, private_pnode, index)
+
+    monkeypatch.setattr(HDWallet, "_derive_private_child_key_by_index", counting_derive)
+
+    for i in range(5):
+        path = f"m/1852'/1815'/0'/0/{i}"
+        child = hdwallet.derive_from_path(path)
+        expected = uncached.derive_from_path(path)
+        assert child.xprivate_key == expected.xprivate_key
+        assert child.public_key == expected.public_key
+        assert child._path == expected._path
+
+    # 5 + 5 * 5 derivations without the cache, the shared prefix once with it
+    assert len(derivations) == 4 + 5 + 5 * 5
+
+    derivations.clear()
+    account = hdwallet.derive_from_path("m/1852'/1815'/0'")
+    assert derivations == []
+    assert isinstance(account.xprivate_key, bytes)
+
+    # Public and private derivation are cached separately.
+    expected = uncached.derive_from_path("m/1852'/1815'/0'/0/1").public_key
+    derivations.clear()
+    for private in (True, False, True, False):
+        child = account.derive_from_path("m/0/1", private=private)
+        assert child.public_key == expected
+    # Only the leaf is derived again, the "m/0" node is cached once per mode.
+    assert derivations == [0, 1, 1]
+    assert len(account._node_cache) == 2
+
+
+def test_node_cache_eviction_wipes_private_keys():
+    hdwallet = HDWallet.from_mnemonic(MNEMONIC_12)
+    hdwallet.node_cache_size = 2
+
+    hdwallet.derive_from_path("m/1852'/1815'/0'/0/0")
+    assert len(hdwallet._node_cache) == 2
+    evicted = next(iter(hdwallet._node_cache.values()))
+    evicted_key = evicted._xprivate_key
+    assert any(evicted_key)
+
+    hdwallet.node_cache_size = 1
+    assert len(hdwallet._node_cache) == 1
+    assert evicted._xprivate_key is None
+    assert evicted_key == bytes(64)
+
+    remaining = next(iter(hdwallet._node_cache.values()))
+    remaining_key = remaining._xprivate_key
+    hdwallet.clear_node_cache()
+    assert not hdwallet._node_cache
+    assert remaining_key == bytes(64)
+
+    with pytest.raises(ValueError):
+        hdwallet.node_cache_size = -1
+
+
+def test_hdwallet_pickle_drops_node_cache():
+    hdwallet = HDWallet.from_mnemonic(MNEMONIC_12)
+    hdwallet.derive_from_path("m/1852'/1815'/0'/0/0")
+
+    restored = pickle.loads(pickle.dumps(hdwallet))
+    assert not restored._node_cache
+    assert (
+        restored.derive_from_path("m/1852'/1815'/0'/0/0").public_key.hex()
+        == "73fea80d424276ad0978d4fe5310e8bc2d485f5f6bb3bf87612989f112ad5a7d"
+    )
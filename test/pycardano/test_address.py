@@ -4,6 +4,7 @@ import tempfile
 import pytest
 
 from pycardano.address import Address, AddressType, PointerAddress
+from pycardano.crypto import bech32
 from pycardano.exception import (
     DecodingException,
     DeserializeException,
@@ -17,6 +18,7 @@ from pycardano.hash import (
 )
 from pycardano.key import PaymentVerificationKey
 from pycardano.network import Network
+from pycardano.transaction import TransactionOutput
 
 
 def test_payment_addr():
@@ -229,3 +231,120 @@ def test_save_load_address():
         assert address == loaded_address
     finally:
         os.unlink(tmp_path)
+
+
+def test_encode_decode_many():
+    strings = [
+        "addr_test1vr2p8st5t5cxqglyjky7vk98k7jtfhdpvhl4e97cezuhn0cqcexl7",
+        "addr1v8xrqjtlfluk9axpmjj5enh0uw0cduwhz7txsqyl36m3ukgqdsn8w",
+        "addr_test1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3jcu5d8ps7zex2k2xt3uqxgjqnnj83ws8lhrn648jjxtwq2ytjqp",
+        "stake1uyehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gh6ffgw",
+        "DdzFFzCqrhsxrgB6w6VhgfAqUZ69Va583murc21S4QFTJ6WUHAh4Gk8t1QHofpza5MZxG4dNVQWe8q78h4Utp9MGBQHBLD54rz6CTLsm",
+    ]
+    addresses = Address.decode_many(strings)
+    assert addresses == [Address.decode(s) for s in strings]
+    assert Address.encode_many(addresses) == strings
+    assert Address.decode_many([]) == []
+
+    with pytest.raises(DecodingException):
+        Address.decode_many([strings[0], strings[1][:-1] + "q"])
+
+
+def test_bech32_fast_paths_match_reference():
+    # Bit-by-bit reference conversion, as in BIP-173
+    def reference_convertbits(data, frombits, tobits, pad):
+        acc, bits, ret = 0, 0, []
+        maxv = (1 << tobits) - 1
+        for value in data:
+            acc = (acc << frombits) | value
+            bits += frombits
+            while bits >= tobits:
+                bits -= tobits
+                ret.append((acc >> bits) & maxv)
+        if pad and bits:
+            ret.append((acc << (tobits - bits)) & maxv)
+        elif not pad and (bits >= frombits or (acc << (tobits - bits)) & maxv):
+            return None
+        return ret
+
+    for n in range(40):
+        data = os.urandom(n)
+        five_bit = bech32.convertbits(data, 8, 5)
+        assert five_bit == reference_convertbits(data, 8, 5, True)
+        assert bech32.convertbits(five_bit, 5, 8, False) == list(data)
+        encoded = bech32.encode("addr_test", data)
+        if n >= 2:
+            assert bech32.decode(encoded) == list(data)
+            assert bech32.decode_many([encoded]) == [list(data)]
+        # A non-zero padding bit is rejected
+        if reference_convertbits(five_bit[:-1] + [31], 5, 8, False) is None:
+            assert bech32.convertbits(five_bit[:-1] + [31], 5, 8, False) is None
+
+    assert bech32.decode("addr_test1" + "q" * 10) is None
+    assert bech32.decode_many(["not an address"]) == [None]
+
+
+def test_address_interning():
+    string = "addr_test1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3jcu5d8ps7zex2k2xt3uqxgjqnnj83ws8lhrn648jjxtwq2ytjqp"
+    Address.clear_intern_cache()
+    address = Address.from_primitive(string)
+
+    assert Address.decode(string) is address
+    assert Address.from_primitive(bytes(address)) is address
+    assert Address.from_cbor(address.to_cbor()) is address
+    assert address.encode() is address.encode()
+    assert bytes(address) is bytes(address)
+
+    constructed = Address(address.payment_part, address.staking_part, address.network)
+    assert constructed is not address
+    assert constructed == address
+    assert hash(constructed) == hash(address)
+    assert len({address, constructed, Address.decode(string)}) == 1
+
+    try:
+        Address.set_intern_cache_size(0)
+        assert Address.decode(string) is not address
+        assert Address.decode(string) == address
+        Address.set_intern_cache_size(2)
+        Address.decode(string)
+        Address.decode("addr1v8xrqjtlfluk9axpmjj5enh0uw0cduwhz7txsqyl36m3ukgqdsn8w")
+        assert len(Address._intern_cache) == 2
+        with pytest.raises(ValueError):
+            Address.set_intern_cache_size(-1)
+    finally:
+        Address.set_intern_cache_size(Address.INTERN_CACHE_SIZE)
+        Address.clear_intern_cache()
+
+
+def test_interned_address_keeps_preserved_cbor():
+    address_bytes = bytes.fromhex(
+        "60f6532850e1bccee9c72a9113ad98bcc5dbb30d2ac960262444f6e5f4"
+    )
+    # An output whose amount is not minimally encoded
+    output_cbor = bytes.fromhex("82581d" + address_bytes.hex() + "1b00000000004c4b40")
+    Address.clear_intern_cache()
+    try:
+        output = TransactionOutput.from_cbor(output_cbor, preserve_cbor=True)
+
+        # Encodings cached on the shared instance by unrelated code
+        other = Address.from_primitive(address_bytes)
+        assert other is output.address
+        Address.encode_many([other])
+        bytes(other)
+        assert output.to_cbor() == output_cbor
+
+        # Encodings cached before the output is decoded
+        assert (
+            TransactionOutput.from_cbor(output_cbor, preserve_cbor=True).to_cbor()
+            == output_cbor
+        )
+    finally:
+        Address.clear_intern_cache()
+
+
+def test_byron_address_hashable():
+    string = "DdzFFzCqrhsxrgB6w6VhgfAqUZ69Va583murc21S4QFTJ6WUHAh4Gk8t1QHofpza5MZxG4dNVQWe8q78h4Utp9MGBQHBLD54rz6CTLsm"
+    address = Address.decode(string)
+    assert address.encode() == string
+    assert Address.from_primitive(bytes(address)) is address
+    assert {address: 1}[Address._decode_primitive(string)] == 1
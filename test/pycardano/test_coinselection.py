@@ -4,13 +4,24 @@ from typing import List
 
 import pytest
 
-from pycardano.coinselection import LargestFirstSelector, RandomImproveMultiAsset
+from pycardano.coinselection import (
+    LargestFirstSelector,
+    RandomImproveMultiAsset,
+    UTxOPool,
+)
 from pycardano.exception import (
     InputUTxODepletedException,
     InsufficientUTxOBalanceException,
     MaxInputCountExceededException,
 )
-from pycardano.transaction import TransactionInput, TransactionOutput, UTxO, Value
+from pycardano.hash import ScriptHash
+from pycardano.transaction import (
+    AssetName,
+    TransactionInput,
+    TransactionOutput,
+    UTxO,
+    Value,
+)
 
 address = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
 
@@ -227,3 +238,113 @@ class TestRandomImproveMultiAsset:
             UTXOS[0],
         ]
         assert_request_fulfilled(request, selected)
+
+
+class TestUTxOPool:
+    def test_positional_access(self):
+        pool = UTxOPool(UTXOS)
+        assert len(pool) == TOTAL_UTXOS
+        assert list(pool) == UTXOS
+        assert pool[0] == UTXOS[0]
+        assert pool[-1] == UTXOS[-1]
+
+        assert pool.pop(2) == UTXOS[2]
+        assert pool[2] == UTXOS[3]
+        assert pool.pop() == UTXOS[-1]
+        assert list(pool) == UTXOS[:2] + UTXOS[3:-1]
+
+        with pytest.raises(IndexError):
+            pool[len(pool)]
+
+    def test_incremental_updates(self):
+        pool = UTxOPool(UTXOS[:5])
+        pool.add(UTXOS[5])
+        pool.add(UTXOS[5])
+        assert len(pool) == 6
+        assert UTXOS[5] in pool
+
+        pool.remove(UTXOS[0])
+        assert UTXOS[0] not in pool
+        with pytest.raises(KeyError):
+            pool.remove(UTXOS[0])
+        pool.discard(UTXOS[0])
+
+        assert list(pool) == UTXOS[1:6]
+        assert pool.total == reduce(
+            lambda x, y: x + y, [u.output.amount for u in UTXOS[1:6]], Value()
+        )
+
+    def test_pop_largest(self):
+        pool = UTxOPool(UTXOS)
+        assert [pool.pop_largest() for _ in range(3)] == [
+            UTXOS[9],
+            UTXOS[8],
+            UTXOS[7],
+        ]
+        pool.add(UTXOS[9])
+        assert pool.pop_largest() == UTXOS[9]
+
+    def test_utxos_with_asset(self):
+        pool = UTxOPool(UTXOS)
+        policy_id = ScriptHash(b"1" * 28)
+        assert pool.utxos_with_asset(policy_id, AssetName(b"token3")) == [UTXOS[3]]
+        pool.remove(UTXOS[3])
+        assert pool.utxos_with_asset(policy_id, AssetName(b"token3")) == []
+
+    def test_compaction(self):
+        utxos = [
+            UTxO(
+                TransactionInput.from_primitive([b"2" * 32, i]),
+                TransactionOutput.from_primitive([address, 1000000 + i]),
+            )
+            for i in range(100)
+        ]
+        pool = UTxOPool(utxos)
+        for utxo in utxos[:80]:
+            pool.remove(utxo)
+        assert list(pool) == utxos[80:]
+        assert pool.pop(0) == utxos[80]
+        assert pool.pop_largest() == utxos[-1]
+
+    @pytest.mark.parametrize(
+        "selector",
+        [
+            LargestFirstSelector(),
+            RandomImproveMultiAsset(random_generator=reversed(range(TOTAL_UTXOS))),
+        ],
+    )
+    def test_select_leaves_pool_unchanged(self, selector, chain_context):
+        pool = UTxOPool(UTXOS)
+        request = [TransactionOutput.from_primitive([address, [15000000]])]
+        selected, _ = selector.select(pool, request, chain_context)
+
+        assert_request_fulfilled(request, selected)
+        assert list(pool) == UTXOS
+
+        for utxo in selected:
+            pool.remove(utxo)
+        assert len(pool) == TOTAL_UTXOS - len(selected)
+
+    def test_repeated_selects_keep_heap_bounded(self, chain_context):
+        pool = UTxOPool(UTXOS)
+        request = [TransactionOutput.from_primitive([address, [15000000]])]
+        for _ in range(50):
+            LargestFirstSelector().select(pool, request, chain_context)
+            RandomImproveMultiAsset().select(pool, request, chain_context)
+        assert list(pool) == UTXOS
+        assert len(pool._largest) <= TOTAL_UTXOS
+        assert pool.pop_largest() == UTXOS[9]
+
+    def test_select_from_pool_matches_list(self, chain_context):
+        request = [TransactionOutput.from_primitive([address, [15000000]])]
+        selector = LargestFirstSelector()
+        assert selector.select(UTxOPool(UTXOS), request, chain_context) == (
+            selector.select(UTXOS, request, chain_context)
+        )
+
+    def test_insufficient_balance(self, chain_context):
+        pool = UTxOPool(UTXOS)
+        request = [TransactionOutput.from_primitive([address, [1000000000]])]
+        with pytest.raises(InsufficientUTxOBalanceException):
+            LargestFirstSelector().select(pool, request, chain_context)
+        assert list(pool) == UTXOS
@@ -7,6 +7,7 @@ import pytest
 from mnemonic import Mnemonic
 
 from pycardano import HDWallet, StakeKeyPair, StakeSigningKey, StakeVerificationKey
+from pycardano.address import Address
 from pycardano.exception import InvalidKeyTypeException
 from pycardano.key import (
     ExtendedSigningKey,
@@ -21,6 +22,16 @@ from pycardano.key import (
     StakePoolSigningKey,
     StakePoolVerificationKey,
 )
+from pycardano.serialization import _get_original_cbor
+from pycardano.signing import verify_signatures
+from pycardano.transaction import (
+    Transaction,
+    TransactionBody,
+    TransactionInput,
+    TransactionOutput,
+    UTxO,
+)
+from pycardano.witness import TransactionWitnessSet, VerificationKeyWitness
 
 SK = PaymentSigningKey.from_json("""{
         "type": "GenesisUTxOSigningKey_ed25519",
@@ -162,6 +173,42 @@ def test_extended_payment_key_sign():
     )
 
 
+def test_signing_key_material_cached():
+    sk = PaymentSigningKey(SK.payload)
+    message = b"message"
+    assert sk.sign(message) == SK.sign(message)
+    assert sk.sign(message) == sk.sign(message)
+    assert sk.to_verification_key() is sk.to_verification_key()
+    assert sk.to_verification_key().payload == VK.payload
+    assert sk.to_verification_key().hash() is sk.to_verification_key().hash()
+
+    extended_sk = ExtendedSigningKey(EXTENDED_SK.payload)
+    assert extended_sk.sign(message) == EXTENDED_SK.sign(message)
+    assert extended_sk.to_verification_key() is extended_sk.to_verification_key()
+    assert extended_sk.to_verification_key().hash() == EXTENDED_VK.hash()
+
+
+def test_cached_key_material_keeps_preserved_cbor():
+    tx_in = TransactionInput.from_primitive([b"1" * 32, 0])
+    body = TransactionBody(
+        inputs=[tx_in],
+        outputs=[TransactionOutput(Address(VK.hash()), 1000000)],
+        fee=200000,
+    )
+    witness = VerificationKeyWitness(
+        PaymentVerificationKey(VK.payload), SK.sign(body.hash())
+    )
+    tx_cbor = Transaction(
+        body, TransactionWitnessSet(vkey_witnesses=[witness])
+    ).to_cbor()
+
+    tx = Transaction.from_cbor(tx_cbor, preserve_cbor=True)
+    assert verify_signatures(tx, [UTxO(tx_in, body.outputs[0])]).ok
+    assert tx.transaction_witness_set.vkey_witnesses[0].vkey.hash() == VK.hash()
+    PaymentSigningKey(SK.payload).sign(tx.transaction_body.hash())
+    assert bytes(_get_original_cbor(tx)) == tx_cbor
+
+
 def test_key_pair():
     PaymentSigningKey.generate()
 
@@ -1176,3 +1176,75 @@ def test_liqwid_tx():
         cbor_hex = json.load(f).get("cborHex")
     tx = Transaction.load("test/resources/cbors/liqwid.json")
     assert tx.to_cbor().hex() == cbor_hex
+
+
+def test_serialization_plan_reflects_once(monkeypatch):
+    import pycardano.serialization as serialization
+
+    @dataclass
+    class Inner(MapCBORSerializable):
+        x: int = field(default=0, metadata={"key": 0})
+        y: Optional[str] = field(default=None, metadata={"key": 1, "optional": True})
+
+    @dataclass
+    class Outer(ArrayCBORSerializable):
+        a: str
+        inner: Inner
+
+    calls = []
+    original = serialization.get_type_hints
+
+    def counting_get_type_hints(cls, *args, **kwargs):
+        calls.append(cls)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(serialization, "get_type_hints", counting_get_type_hints)
+
+    t = Outer("a", Inner(1, "y"))
+    for _ in range(3):
+        check_two_way_cbor(t)
+
+    assert calls.count(Outer) == 1
+    assert calls.count(Inner) == 1
+    assert "_serialization_plan" in Outer.__dict__
+    assert Outer.__dict__["_serialization_plan"] is not Inner.__dict__.get(
+        "_serialization_plan"
+    )
+
+
+def test_streaming_encoder_matches_primitive_tree():
+    @dataclass
+    class Inner(ArrayCBORSerializable):
+        a: int
+        b: Optional[bytes] = field(default=None, metadata={"optional": True})
+
+    @dataclass
+    class Outer(MapCBORSerializable):
+        inners: List[Inner] = field(default_factory=list, metadata={"key": 0})
+        indefinite: IndefiniteList = field(
+            default_factory=lambda: IndefiniteList([]), metadata={"key": 1}
+        )
+        tagged: Any = field(default=None, metadata={"key": 2})
+        ordered: Optional[OrderedSet[Inner]] = field(
+            default=None, metadata={"key": 3, "optional": True}
+        )
+        raw: Any = field(default=None, metadata={"key": 4})
+
+    t = Outer(
+        inners=[Inner(1), Inner(2, b"2")],
+        indefinite=IndefiniteList([Inner(3), {Inner(4, b"4").to_cbor(): Inner(5)}]),
+        tagged=CBORTag(24, (Inner(6), frozenset({7}))),
+        ordered=OrderedSet([Inner(8), Inner(9)]),
+        raw=[RawCBOR(b"\x01"), ByteString(b"x" * 100)],
+    )
+
+    assert t.to_cbor() == cbor2.dumps(
+        t.to_validated_primitive(), default=default_encoder
+    )
+
+
+def test_streaming_encoder_transaction():
+    tx = Transaction.load("test/resources/cbors/liqwid.json")
+    assert tx.to_cbor() == cbor2.dumps(
+        tx.to_validated_primitive(), default=default_encoder
+    )
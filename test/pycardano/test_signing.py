@@ -0,0 +1,174 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from pycardano.address import Address
+from pycardano.crypto.bip32 import HDWallet
+from pycardano.key import ExtendedSigningKey, PaymentSigningKey
+from pycardano.nativescript import (
+    InvalidBefore,
+    InvalidHereAfter,
+    ScriptAll,
+    ScriptAny,
+    ScriptNofK,
+    ScriptPubkey,
+)
+from pycardano.signing import (
+    BatchSigner,
+    native_script_vkey_hashes,
+    verify_signatures,
+)
+from pycardano.transaction import (
+    Transaction,
+    TransactionBody,
+    TransactionInput,
+    TransactionOutput,
+    UTxO,
+)
+from pycardano.witness import VerificationKeyWitness
+
+SK = PaymentSigningKey.generate()
+EXTENDED_SK = ExtendedSigningKey.from_hdwallet(
+    HDWallet.from_seed(
+        "c8285b4ecc69ba2b1a03e94ae5a3b1e6c8ec2bd2dbf35a8a0d7d5e85dc02e9e6"
+        "e3e8d2e5b8e8dd20d0bca83e3e3ed7e3a48c0bd1b6e8c6b1c0a1ef27f18e4cd1"
+    )
+)
+
+TX_BODIES = [
+    TransactionBody(
+        inputs=[TransactionInput.from_primitive([b"1" * 32, i])], outputs=[], fee=i
+    )
+    for i in range(10)
+]
+
+
+def expected_witnesses(tx_body, keys):
+    return [
+        VerificationKeyWitness(key.to_verification_key(), key.sign(tx_body.hash()))
+        for key in keys
+    ]
+
+
+def test_witnesses():
+    signer = BatchSigner([SK, EXTENDED_SK, SK])
+    assert signer.signing_keys == [SK, EXTENDED_SK]
+    assert signer.verification_key_hashes == [
+        SK.to_verification_key().hash(),
+        EXTENDED_SK.to_verification_key().hash(),
+    ]
+
+    tx_hash = TX_BODIES[0].hash()
+    assert signer.witnesses(tx_hash) == expected_witnesses(
+        TX_BODIES[0], [SK, EXTENDED_SK]
+    )
+    assert signer.witnesses(
+        tx_hash, [EXTENDED_SK.to_verification_key().hash()]
+    ) == expected_witnesses(TX_BODIES[0], [EXTENDED_SK])
+
+
+def test_sign_many():
+    signer = BatchSigner([SK, EXTENDED_SK])
+    key_hashes = [None, [], [SK.to_verification_key().hash()]] + [None] * 7
+    witness_sets = signer.sign(TX_BODIES, key_hashes)
+
+    assert len(witness_sets) == len(TX_BODIES)
+    assert list(witness_sets[0].vkey_witnesses) == expected_witnesses(
+        TX_BODIES[0], [SK, EXTENDED_SK]
+    )
+    assert witness_sets[1].vkey_witnesses is None
+    assert list(witness_sets[2].vkey_witnesses) == expected_witnesses(
+        TX_BODIES[2], [SK]
+    )
+
+    with pytest.raises(ValueError):
+        signer.sign(TX_BODIES, key_hashes[:1])
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_sign_with_executor(executor_class):
+    with executor_class(max_workers=2) as executor:
+        signer = BatchSigner([SK, EXTENDED_SK], executor=executor, chunk_size=3)
+        witness_sets = signer.sign(TX_BODIES)
+
+    for tx_body, witness_set in zip(TX_BODIES, witness_sets):
+        assert list(witness_set.vkey_witnesses) == expected_witnesses(
+            tx_body, [SK, EXTENDED_SK]
+        )
+
+
+def signed_transaction(tx_body, keys):
+    witness_set = BatchSigner(keys).sign([tx_body])[0]
+    return Transaction(tx_body, witness_set)
+
+
+def test_verify_signatures():
+    tx_body = TransactionBody(
+        inputs=[TransactionInput.from_primitive([b"1" * 32, 0])],
+        outputs=[],
+        fee=0,
+        required_signers=[SK.to_verification_key().hash()],
+    )
+    result = verify_signatures(signed_transaction(tx_body, [SK, EXTENDED_SK]))
+    assert result.valid == [True, True]
+    assert not result.missing
+    assert result.ok
+
+    utxo = UTxO(
+        tx_body.inputs[0],
+        TransactionOutput(Address(EXTENDED_SK.to_verification_key().hash()), 1000000),
+    )
+    result = verify_signatures(signed_transaction(tx_body, [SK]), [utxo])
+    assert result.valid == [True]
+    assert result.missing == {EXTENDED_SK.to_verification_key().hash()}
+    assert not result.ok
+
+    tx = signed_transaction(tx_body, [SK])
+    forged = tx.transaction_witness_set.vkey_witnesses[0]
+    forged.signature = bytes(64)
+    result = verify_signatures(tx)
+    assert result.valid == [False]
+    assert result.missing == {SK.to_verification_key().hash()}
+
+
+def test_verify_signatures_native_scripts():
+    keys = [PaymentSigningKey.generate() for _ in range(3)]
+    hashes = [key.to_verification_key().hash() for key in keys]
+    pubkeys = [ScriptPubkey(h) for h in hashes]
+    tx_body = TransactionBody(
+        inputs=[TransactionInput.from_primitive([b"1" * 32, 0])],
+        outputs=[],
+        fee=0,
+        ttl=1000,
+    )
+
+    def verify(script, signers):
+        tx = signed_transaction(tx_body, signers)
+        tx.transaction_witness_set.native_scripts = [script]
+        return verify_signatures(tx)
+
+    result = verify(ScriptAny(pubkeys), keys[:1])
+    assert not result.missing
+    assert result.ok
+
+    script = ScriptNofK(2, pubkeys)
+    assert verify(script, keys[:2]).ok
+    result = verify(script, keys[2:])
+    assert result.unsatisfied_scripts == [script]
+    assert not result.ok
+
+    assert verify(ScriptAll([pubkeys[0], InvalidHereAfter(1000)]), keys[:1]).ok
+    assert not verify(ScriptAll([pubkeys[0], InvalidHereAfter(999)]), keys[:1]).ok
+    assert not verify(InvalidBefore(10), []).ok
+
+    assert native_script_vkey_hashes([ScriptAny([script])]) == set(hashes)
+
+
+def test_verify_signatures_with_executor():
+    keys = [PaymentSigningKey.generate() for _ in range(5)]
+    tx = signed_transaction(TX_BODIES[0], keys)
+    tx.transaction_witness_set.vkey_witnesses[3].signature = bytes(64)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = verify_signatures(tx, executor=executor, chunk_size=2)
+    assert result.valid == [True, True, True, False, True]
@@ -1,3 +1,4 @@
+import copy
 import os
 import tempfile
 from dataclasses import dataclass
@@ -5,6 +6,8 @@ from fractions import Fraction
 from test.pycardano.util import check_two_way_cbor
 
 import pytest
+from nacl.encoding import RawEncoder
+from nacl.hash import blake2b
 from typeguard import TypeCheckError
 
 from pycardano import ParameterChangeAction
@@ -14,9 +17,11 @@ from pycardano.hash import SCRIPT_HASH_SIZE, ScriptHash, TransactionId
 from pycardano.key import PaymentKeyPair, PaymentSigningKey, VerificationKey
 from pycardano.nativescript import ScriptPubkey
 from pycardano.plutus import PlutusData, PlutusV1Script, PlutusV2Script, datum_hash
+from pycardano.serialization import MapCBORSerializable, _get_original_cbor
 from pycardano.transaction import (
     Asset,
     AssetName,
+    CompactMultiAsset,
     MultiAsset,
     Transaction,
     TransactionBody,
@@ -337,6 +342,93 @@ def test_multi_asset_addition():
     )
 
 
+def test_multi_asset_in_place_addition():
+    a = MultiAsset.from_primitive(
+        {b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1, b"Token2": 2}}
+    )
+    b = MultiAsset.from_primitive(
+        {
+            b"1" * SCRIPT_HASH_SIZE: {b"Token1": -1, b"Token2": 20},
+            b"2" * SCRIPT_HASH_SIZE: {b"Token1": 1},
+        }
+    )
+    a_asset = a[ScriptHash(b"1" * SCRIPT_HASH_SIZE)]
+
+    a += b
+    assert a == MultiAsset.from_primitive(
+        {
+            b"1" * SCRIPT_HASH_SIZE: {b"Token2": 22},
+            b"2" * SCRIPT_HASH_SIZE: {b"Token1": 1},
+        }
+    )
+
+    # Assets are never shared, so changing the sum does not change the operands
+    assert a_asset == Asset.from_primitive({b"Token1": 1, b"Token2": 2})
+    a[ScriptHash(b"2" * SCRIPT_HASH_SIZE)][AssetName(b"Token1")] = 5
+    assert b[ScriptHash(b"2" * SCRIPT_HASH_SIZE)][AssetName(b"Token1")] == 1
+
+
+def test_compact_multi_asset():
+    a = MultiAsset.from_primitive(
+        {
+            b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1, b"Token2": 2, b"T": 3},
+            b"2" * SCRIPT_HASH_SIZE: {b"Token1": 1},
+        }
+    )
+    b = MultiAsset.from_primitive(
+        {
+            b"1" * SCRIPT_HASH_SIZE: {b"Token1": 10, b"Token3": 30},
+            b"0" * SCRIPT_HASH_SIZE: {b"Token1": 1},
+        }
+    )
+    compact = a.compact()
+
+    assert isinstance(compact, MultiAsset)
+    assert compact == a and a == compact
+    assert compact.to_cbor() == a.to_cbor()
+    assert CompactMultiAsset.from_cbor(a.to_cbor()) == compact
+    assert compact.to_multi_asset() == a
+
+    assert compact + b == a + b
+    assert isinstance(compact + b, CompactMultiAsset)
+    assert compact - b == a - b
+    assert compact + compact.compact() == a + a
+    assert not (compact - a)
+
+    assert compact <= a + b and a + b >= compact
+    assert compact < a + b and a + b > compact
+    assert not compact <= b and not compact >= b
+
+    def criteria(p, n, v):
+        return v > 1
+
+    assert compact.filter(criteria) == a.filter(criteria)
+    assert compact.count(criteria) == a.count(criteria) == 2
+
+    assert (
+        compact[ScriptHash(b"1" * SCRIPT_HASH_SIZE)]
+        == a[ScriptHash(b"1" * SCRIPT_HASH_SIZE)]
+    )
+    assert ScriptHash(b"0" * SCRIPT_HASH_SIZE) not in compact
+    assert list(compact) == sorted(a, key=lambda p: p.payload)
+
+    value = Value(10, compact)
+    value += Value(1, b)
+    assert value == Value(11, a + b)
+    assert Value.from_cbor(value.to_cbor()) == value
+
+    with pytest.raises(InvalidOperationException):
+        compact[ScriptHash(b"0" * SCRIPT_HASH_SIZE)] = Asset()
+
+    # Amounts that do not fit in an int64
+    large = CompactMultiAsset.from_primitive(
+        {b"1" * SCRIPT_HASH_SIZE: {b"Token1": 2**64 - 1}}
+    )
+    assert (large + large).to_primitive() == {
+        b"1" * SCRIPT_HASH_SIZE: {b"Token1": 2**65 - 2}
+    }
+
+
 def test_multi_asset_subtraction():
     a = MultiAsset.from_primitive(
         {b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1, b"Token2": 2}}
@@ -584,6 +676,40 @@ def test_inline_datum_serdes():
     assert cbor == TransactionOutput.from_cbor(cbor).to_cbor_hex()
 
 
+def test_value_sum():
+    values = [
+        Value.from_primitive(
+            [1, {b"1" * SCRIPT_HASH_SIZE: {b"Token1": 1, b"Token2": 2}}]
+        ),
+        Value.from_primitive(
+            [10, {b"1" * SCRIPT_HASH_SIZE: {b"Token1": -1, b"Token3": 3}}]
+        ),
+        100,
+        Value.from_primitive([1000, {b"2" * SCRIPT_HASH_SIZE: {b"Token1": 1}}]),
+    ]
+
+    total = Value.sum(values)
+    expected = Value()
+    for v in values:
+        expected += v
+    assert total == expected
+    assert total == Value.from_primitive(
+        [
+            1111,
+            {
+                b"1" * SCRIPT_HASH_SIZE: {b"Token2": 2, b"Token3": 3},
+                b"2" * SCRIPT_HASH_SIZE: {b"Token1": 1},
+            },
+        ]
+    )
+    assert Value.sum([]) == Value()
+
+    total.multi_asset[ScriptHash(b"2" * SCRIPT_HASH_SIZE)][AssetName(b"Token1")] = 5
+    assert values[3].multi_asset == MultiAsset.from_primitive(
+        {b"2" * SCRIPT_HASH_SIZE: {b"Token1": 1}}
+    )
+
+
 def test_out_of_bound_asset():
     a = Asset({AssetName(b"abc"): 1 << 64})
 
@@ -708,3 +834,148 @@ def test_decode_byron_transaction():
     assert tx.id == TransactionId.from_primitive(
         "52e274237caceb4e0916587d2b4ba19d89fb40e8e85338f9bb4f75fcec1256a2"
     )
+
+
+def test_transaction_body_preserve_cbor():
+    # Same body as in test_transaction_body, but with fee encoded in 8 bytes instead of 4
+    body_cbor = bytes.fromhex(
+        "a50081825820732bfd67e66be8e8288349fcaaa2294973ef6271cc189a239bb431275401b8e"
+        "500018282581d60f6532850e1bccee9c72a9113ad98bcc5dbb30d2ac960262444f6e5f41b00"
+        "0000174876e80082581d60f6532850e1bccee9c72a9113ad98bcc5dbb30d2ac960262444f6e"
+        "5f41b000000ba43b4b7f7021b00000000000288090d800e80"
+    )
+    expected_id = TransactionId(blake2b(body_cbor, 32, encoder=RawEncoder))
+
+    tx_body = TransactionBody.from_cbor(body_cbor)
+    assert tx_body.to_cbor() != body_cbor
+    assert tx_body.id != expected_id
+
+    tx_body = TransactionBody.from_cbor(body_cbor, preserve_cbor=True)
+    assert tx_body.to_cbor() == body_cbor
+    assert tx_body.id == expected_id
+
+    tx_body.fee = tx_body.fee
+    assert tx_body.to_cbor() == body_cbor
+
+    tx_body.fee += 1
+    expected_body = make_transaction_body()
+    expected_body.fee = tx_body.fee
+    assert tx_body.to_cbor() == expected_body.to_cbor()
+
+
+def test_transaction_preserve_cbor_nested_changes():
+    tx_body = make_transaction_body()
+    tx = Transaction(tx_body, TransactionWitnessSet())
+    tx_cbor = tx.to_cbor()
+
+    restored = Transaction.from_cbor(tx_cbor, preserve_cbor=True)
+    assert restored.to_cbor() == tx_cbor
+    assert restored.transaction_body.to_cbor() == tx_body.to_cbor()
+
+    restored.transaction_body.outputs[0].amount.coin += 1
+    assert restored.transaction_body.to_cbor() != tx_body.to_cbor()
+    assert restored.to_cbor() != tx_cbor
+
+    restored.transaction_body.outputs[0].amount.coin -= 1
+    assert restored.to_cbor() == tx_cbor
+
+    restored.transaction_body.outputs.append(restored.transaction_body.outputs[0])
+    assert restored.transaction_body.to_cbor() != tx_body.to_cbor()
+    assert Transaction.from_cbor(restored.to_cbor()) == restored
+
+
+def test_transaction_preserve_cbor_after_reads():
+    # Same body as in test_transaction_body_preserve_cbor, with fee encoded in 8 bytes
+    body_cbor = bytes.fromhex(
+        "a50081825820732bfd67e66be8e8288349fcaaa2294973ef6271cc189a239bb431275401b8e"
+        "500018282581d60f6532850e1bccee9c72a9113ad98bcc5dbb30d2ac960262444f6e5f41b00"
+        "0000174876e80082581d60f6532850e1bccee9c72a9113ad98bcc5dbb30d2ac960262444f6e"
+        "5f41b000000ba43b4b7f7021b00000000000288090d800e80"
+    )
+    expected_id = TransactionId(blake2b(body_cbor, 32, encoder=RawEncoder))
+
+    tx_body = TransactionBody.from_cbor(body_cbor, preserve_cbor=True)
+    address = tx_body.outputs[0].address
+    str(address)
+    bytes(address)
+    assert tx_body.id == expected_id
+    assert tx_body.to_cbor() == body_cbor
+
+    sk = PaymentSigningKey.generate()
+    vk = sk.to_verification_key()
+    witness = VerificationKeyWitness(vk, sk.sign(tx_body.hash()))
+    tx = Transaction(tx_body, TransactionWitnessSet(vkey_witnesses=[witness]))
+    tx_cbor = tx.to_cbor()
+
+    restored = Transaction.from_cbor(tx_cbor, preserve_cbor=True)
+    restored_witness = restored.transaction_witness_set.vkey_witnesses[0]
+    assert restored_witness.vkey.hash() == vk.hash()
+    assert restored.id == expected_id
+    assert _get_original_cbor(restored_witness) is not None
+    assert _get_original_cbor(restored) is not None
+    assert restored.to_cbor() == tx_cbor
+
+
+def test_transaction_lazy_decode():
+    tx = Transaction.load("test/resources/cbors/liqwid.json")
+    tx_cbor = tx.to_cbor()
+
+    restored = Transaction.from_cbor(tx_cbor, lazy=True)
+    assert "transaction_body" not in vars(restored)
+
+    restored_body = restored.transaction_body
+    assert restored_body.fee == tx.transaction_body.fee
+    assert "fee" in vars(restored_body)
+    assert "outputs" not in vars(restored_body)
+    assert "transaction_witness_set" not in vars(restored)
+
+    assert restored == tx
+    assert restored.to_cbor() == tx_cbor
+    assert Transaction.from_cbor(tx_cbor, lazy=True).id == tx.id
+    assert repr(Transaction.from_cbor(tx_cbor, lazy=True)) == repr(tx)
+
+
+def test_transaction_body_lazy_decode_defaults():
+    tx_body = make_transaction_body()
+    restored = TransactionBody.from_cbor(tx_body.to_cbor(), lazy=True)
+    assert restored.ttl is None
+    assert restored.certificates is None
+    assert restored.fee == tx_body.fee
+    assert restored == tx_body
+    assert TransactionBody.fee == 0
+
+    with pytest.raises(ValueError):
+        TransactionBody.from_cbor(tx_body.to_cbor(), lazy=True, preserve_cbor=True)
+
+
+def test_transaction_body_lazy_decode_assign_before_read():
+    tx_body = make_transaction_body()
+    restored = TransactionBody.from_cbor(tx_body.to_cbor(), lazy=True)
+    assert type(restored) is not TransactionBody
+    assert isinstance(restored, TransactionBody)
+
+    restored.fee = 1
+    restored.ttl = 1000
+    assert restored.fee == 1
+    assert restored.ttl == 1000
+    assert restored.outputs == tx_body.outputs
+
+    restored_again = TransactionBody.from_cbor(restored.to_cbor())
+    assert (restored_again.fee, restored_again.ttl) == (1, 1000)
+    assert restored_again.inputs == tx_body.inputs
+    assert type(restored) is TransactionBody
+    assert "_lazy_fields" not in vars(restored)
+
+    # Objects that are not lazily restored, and their classes, are left alone.
+    assert vars(TransactionBody)["ttl"] is None
+    assert "__getattr__" not in vars(MapCBORSerializable)
+    with pytest.raises(AttributeError):
+        tx_body.unknown
+
+
+def test_transaction_body_lazy_decode_copy():
+    tx_body = make_transaction_body()
+    restored = TransactionBody.from_cbor(tx_body.to_cbor(), lazy=True)
+    copied = copy.deepcopy(restored)
+    assert type(copied) is type(restored) is TransactionBody
+    assert copied == tx_body
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import logging
 from dataclasses import replace
@@ -18,6 +19,7 @@ from pycardano import (
     min_lovelace_post_alonzo,
 )
 from pycardano.address import Address
+from pycardano.backend.base import AsyncChainContext
 from pycardano.certificate import (
     PoolRegistration,
     StakeCredential,
@@ -40,7 +42,7 @@ from pycardano.hash import (
     VerificationKeyHash,
 )
 from pycardano.key import VerificationKey
-from pycardano.metadata import AuxiliaryData
+from pycardano.metadata import AuxiliaryData, Metadata
 from pycardano.nativescript import (
     InvalidBefore,
     InvalidHereAfter,
@@ -226,6 +228,75 @@ def test_tx_builder_multi_asset(chain_context):
     assert expected == tx_body.to_primitive()
 
 
+def test_tx_builder_estimate_tx_size(chain_context):
+    tx_builder = TransactionBuilder(chain_context)
+    sender = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+    sender_address = Address.from_primitive(sender)
+
+    tx_builder.add_input_address(sender).add_output(
+        TransactionOutput.from_primitive(
+            [sender, [2000000, {b"1" * 28: {b"Token1": 1}}]]
+        )
+    )
+    tx_builder.auxiliary_data = AuxiliaryData(Metadata({1: "message"}))
+    tx_builder.build(change_address=sender_address)
+
+    assert tx_builder._estimate_tx_size() == len(
+        tx_builder._build_full_fake_tx().to_cbor()
+    )
+
+    # Change the fee, outputs and inputs after the sizes of outputs are known
+    tx_builder.fee = 10
+    tx_builder.outputs[0].amount = Value(3000000)
+    tx_builder.add_output(TransactionOutput.from_primitive([sender, 10**10]))
+    tx_builder.add_input(
+        UTxO(
+            TransactionInput.from_primitive([b"3" * 32, 300]),
+            TransactionOutput.from_primitive([sender, 5000000]),
+        )
+    )
+    assert tx_builder._estimate_tx_size() == len(
+        tx_builder._build_full_fake_tx().to_cbor()
+    )
+
+
+def test_tx_builder_estimate_tx_size_with_scripts(chain_context):
+    tx_builder = TransactionBuilder(chain_context)
+    plutus_script = PlutusV1Script(b"dummy test script")
+    script_address = Address(plutus_script_hash(plutus_script))
+    datum = PlutusData()
+    utxo = UTxO(
+        TransactionInput.from_primitive([b"1" * 32, 0]),
+        TransactionOutput(script_address, 10000000, datum_hash=datum.hash()),
+    )
+    redeemer = Redeemer(PlutusData(), ExecutionUnits(1000, 1000))
+    tx_builder.add_script_input(utxo, plutus_script, datum, redeemer)
+    receiver = Address.from_primitive(
+        "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+    )
+    tx_builder.add_output(TransactionOutput(receiver, 5000000))
+    tx_builder.auxiliary_data = AuxiliaryData(Metadata({1: "message"}))
+    tx_builder.build(change_address=receiver)
+
+    for use_redeemer_map in (True, False):
+        tx_builder.use_redeemer_map = use_redeemer_map
+        assert tx_builder._estimate_tx_size() == len(
+            tx_builder._build_full_fake_tx().to_cbor()
+        )
+
+        # Execution units are set in place once evaluated, and change the size of the redeemers
+        redeemer.ex_units.mem *= 1000
+        redeemer.ex_units.steps *= 1000
+        assert tx_builder._estimate_tx_size() == len(
+            tx_builder._build_full_fake_tx().to_cbor()
+        )
+
+    tx_builder.auxiliary_data = AuxiliaryData(Metadata({1: "a longer message"}))
+    assert tx_builder._estimate_tx_size() == len(
+        tx_builder._build_full_fake_tx().to_cbor()
+    )
+
+
 def test_tx_builder_raises_utxo_selection(chain_context):
     tx_builder = TransactionBuilder(chain_context)
     sender = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
@@ -1404,6 +1475,96 @@ def test_estimate_execution_unit(chain_context):
     assert [plutus_script] == witness.plutus_v1_script
 
 
+class SlowAsyncChainContext(AsyncChainContext):
+    """Serves a sync context's results after a delay, recording how many queries overlap."""
+
+    def __init__(self, context):
+        self.context = context
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _query(self, name, func):
+        self.queries.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return func()
+        finally:
+            self.in_flight -= 1
+
+    @property
+    def network(self):
+        return self.context.network
+
+    async def protocol_param(self):
+        return await self._query("protocol_param", lambda: self.context.protocol_param)
+
+    async def last_block_slot(self):
+        return await self._query(
+            "last_block_slot", lambda: self.context.last_block_slot
+        )
+
+    async def _utxos(self, address):
+        return await self._query("utxos", lambda: self.context.utxos(address))
+
+    async def evaluate_tx_cbor(self, cbor):
+        return await self._query(
+            "evaluate_tx", lambda: self.context.evaluate_tx_cbor(cbor)
+        )
+
+
+def test_build_async(chain_context):
+    def script_tx_builder(context):
+        tx_builder = TransactionBuilder(context)
+        plutus_script = PlutusV1Script(b"dummy test script")
+        datum = PlutusData()
+        utxo1 = UTxO(
+            TransactionInput.from_primitive(
+                ["18cbe6cadecd3f89b60e08e68e5e6c7d72d730aaa1ad21431590f7e6643438ef", 0]
+            ),
+            TransactionOutput(
+                Address(plutus_script_hash(plutus_script)),
+                10000000,
+                datum_hash=datum.hash(),
+            ),
+        )
+        tx_builder.add_script_input(utxo1, plutus_script, datum, Redeemer(PlutusData()))
+        tx_builder.add_input_address(
+            "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+        )
+        tx_builder.add_output(TransactionOutput(utxo1.output.address, 12000000))
+        return tx_builder
+
+    receiver = Address.from_primitive(
+        "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+    )
+    expected = script_tx_builder(chain_context).build(change_address=receiver)
+
+    async_context = SlowAsyncChainContext(chain_context)
+    tx_builder = script_tx_builder(chain_context)
+    tx_body = asyncio.run(
+        tx_builder.build_async(change_address=receiver, context=async_context)
+    )
+
+    assert tx_body == expected
+    assert tx_builder.context is chain_context
+    # Everything but the evaluation of the built transaction is queried at once.
+    assert async_context.queries[-1] == "evaluate_tx"
+    assert sorted(async_context.queries[:-1]) == [
+        "last_block_slot",
+        "protocol_param",
+        "utxos",
+        "utxos",
+    ]
+    assert async_context.max_in_flight == 4
+
+    # Without an async context, the build runs on an executor.
+    tx_builder = script_tx_builder(chain_context)
+    assert asyncio.run(tx_builder.build_async(change_address=receiver)) == expected
+
+
 def test_add_script_input_inline_datum_extra(chain_context):
     tx_builder = TransactionBuilder(chain_context)
     tx_in1 = TransactionInput.from_primitive(